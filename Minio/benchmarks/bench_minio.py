@@ -0,0 +1,331 @@
+# bench_minio.py
+"""
+Benchmarks do cliente MinIO contra um servidor local.
+
+Sobe um `minio server` temporário (binário no PATH ou em MINIO_BINARY) ou
+usa um endpoint S3 compatível já em execução, mede:
+
+  - small_ops: operações/s com objetos pequenos (put, stat, get, delete)
+  - large_object: MB/s de upload e download (simples e por intervalos)
+  - listing: objetos/s ao listar um prefixo com muitas chaves
+  - read_file: tempo de leitura/decodificação de parquet via read_file
+
+e grava o resultado em JSON para comparar execuções.
+
+Uso:
+    python -m Minio.benchmarks.bench_minio --output bench.json
+    python -m Minio.benchmarks.bench_minio --endpoint localhost:9000 \\
+        --access-key minioadmin --secret-key minioadmin --compare bench_anterior.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from io import BytesIO
+from pathlib import Path
+
+from Minio.minio_client import MinIOManager, MinIOConnectionError
+
+BENCH_BUCKET = "bench"
+
+
+###################################################################
+@contextmanager
+def local_minio_server(binary: str | None = None, startup_timeout: float = 30.0):
+    """
+    Sobe um `minio server` em um diretório e porta temporários e devolve
+    (endpoint, access_key, secret_key). O processo é encerrado na saída.
+    """
+    binary = binary or os.getenv("MINIO_BINARY") or shutil.which("minio")
+    if not binary:
+        raise RuntimeError(
+            "Binário 'minio' não encontrado. Instale-o, defina MINIO_BINARY "
+            "ou informe --endpoint de um servidor S3 compatível."
+        )
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    access_key, secret_key = "benchadmin", "benchadmin-secret"
+    data_dir = tempfile.mkdtemp(prefix="minio-bench-")
+    env = dict(
+        os.environ,
+        MINIO_ROOT_USER=access_key,
+        MINIO_ROOT_PASSWORD=secret_key,
+        MINIO_API_SELECT_PARQUET="on"
+    )
+    process = subprocess.Popen(
+        [binary, "server", data_dir, "--address", f"127.0.0.1:{port}", "--quiet"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    endpoint = f"127.0.0.1:{port}"
+
+    try:
+        deadline = time.monotonic() + startup_timeout
+        while True:
+            try:
+                MinIOManager(endpoint, access_key, secret_key, secure=False)
+                break
+            except MinIOConnectionError:
+                if process.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError(f"MinIO local não respondeu em {endpoint}")
+                time.sleep(0.2)
+        yield endpoint, access_key, secret_key
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+
+###################################################################
+def _rate(count: float, seconds: float) -> float:
+    return count / seconds if seconds > 0 else 0.0
+
+
+def _timed(func, *args, **kwargs) -> tuple[float, object]:
+    started = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - started, result
+
+
+###################################################################
+def bench_small_ops(manager: MinIOManager, count: int, size: int) -> dict:
+    """Operações por segundo com objetos pequenos, uma requisição por vez."""
+    payload = os.urandom(size)
+    names = [f"small/{i:06d}" for i in range(count)]
+
+    def _get(name):
+        resp = manager.client.get_object(BENCH_BUCKET, name)
+        try:
+            return resp.read()
+        finally:
+            resp.close()
+            resp.release_conn()
+
+    # O bucket já foi criado por run_benchmarks: _put_data evita o bucket_exists
+    # que upload_data faz a cada chamada e mediria duas requisições por put
+    results = {}
+    for label, func in (
+        ("put", lambda name: manager._put_data(payload, name, BENCH_BUCKET)),
+        ("stat", lambda name: manager.get_file_info(BENCH_BUCKET, name)),
+        ("get", _get),
+        ("delete", lambda name: manager.delete_file(BENCH_BUCKET, name)),
+    ):
+        elapsed, _ = _timed(lambda: [func(name) for name in names])
+        results[f"{label}_ops_per_second"] = _rate(count, elapsed)
+
+    results.update({"count": count, "object_size": size})
+    return results
+
+
+def bench_large_object(manager: MinIOManager, size_mb: int, work_dir: Path) -> dict:
+    """MB/s de upload e download de um objeto grande."""
+    source = work_dir / "large.bin"
+    with open(source, "wb") as f:
+        block = os.urandom(1024 * 1024)
+        for _ in range(size_mb):
+            f.write(block)
+
+    upload_s, _ = _timed(manager.upload_file, source, "large/large.bin", BENCH_BUCKET)
+    download_s, _ = _timed(manager.download_file, BENCH_BUCKET, "large/large.bin", work_dir / "dl.bin")
+    parallel_s, _ = _timed(
+        manager.download_file_parallel, BENCH_BUCKET, "large/large.bin", work_dir / "dl_parallel.bin"
+    )
+    read_s, _ = _timed(manager.read_object_parallel, BENCH_BUCKET, "large/large.bin")
+
+    manager.delete_file(BENCH_BUCKET, "large/large.bin")
+    return {
+        "size_mb": size_mb,
+        "upload_mb_per_second": _rate(size_mb, upload_s),
+        "download_mb_per_second": _rate(size_mb, download_s),
+        "parallel_download_mb_per_second": _rate(size_mb, parallel_s),
+        "parallel_read_mb_per_second": _rate(size_mb, read_s),
+    }
+
+
+def bench_listing(manager: MinIOManager, keys: int, workers: int) -> dict:
+    """Objetos/s ao listar um prefixo com `keys` chaves (list_files e iter_files)."""
+    prefix = "listing/"
+    populate_s, summary = _timed(
+        manager.upload_many_data,
+        [(f"{prefix}{i:07d}", b"") for i in range(keys)],
+        BENCH_BUCKET,
+        max_workers=workers
+    )
+
+    list_s, listed = _timed(manager.list_files, BENCH_BUCKET, prefix)
+    iter_s, counted = _timed(lambda: sum(1 for _ in manager.iter_files(BENCH_BUCKET, prefix, as_record=True)))
+
+    first_started = time.perf_counter()
+    next(iter(manager.iter_files(BENCH_BUCKET, prefix, as_record=True)))
+    first_s = time.perf_counter() - first_started
+
+    delete_s, _ = _timed(manager.delete_prefix, BENCH_BUCKET, prefix, max_workers=workers)
+    return {
+        "keys": keys,
+        "populate_ops_per_second": _rate(len(summary["uploaded"]), populate_s),
+        "list_files_keys_per_second": _rate(len(listed), list_s),
+        "iter_files_keys_per_second": _rate(counted, iter_s),
+        "iter_files_first_result_seconds": first_s,
+        "delete_prefix_keys_per_second": _rate(keys, delete_s),
+    }
+
+
+def bench_read_file(manager: MinIOManager, rows: int, repeats: int) -> dict:
+    """Tempo de read_file (leitura completa e com projeção/filtro) sobre um parquet."""
+    import numpy as np
+    import pandas as pd
+
+    from Minio.examples import MinIO
+
+    months = np.array([f"2024-{m:02d}" for m in range(1, 13)])
+    df = pd.DataFrame({
+        "REFERENCIA_MEDICAO": np.sort(months[np.arange(rows) % len(months)]),
+        "COLETA_UFORIGEM": np.random.choice(["SP", "RJ", "MG", "PR", "SC"], rows),
+        "VALOR": np.random.rand(rows),
+        "PRAZO": np.random.randint(1, 30, rows),
+    })
+    buffer = BytesIO()
+    df.to_parquet(buffer, engine="pyarrow", index=False, row_group_size=max(1, rows // 12))
+    manager.upload_data(buffer.getvalue(), "parquet/bench.parquet", BENCH_BUCKET)
+
+    def _best(func):
+        return min(_timed(func)[0] for _ in range(repeats))
+
+    full_s = _best(lambda: MinIO.read_file("parquet/bench.parquet", BENCH_BUCKET, use_cache=False))
+    projected_s = _best(lambda: MinIO.read_file(
+        "parquet/bench.parquet", BENCH_BUCKET, columns=["VALOR"],
+        filters=[("REFERENCIA_MEDICAO", "=", "2024-03")], use_cache=False
+    ))
+    decode_s = _best(lambda: pd.read_parquet(BytesIO(buffer.getvalue()), engine="pyarrow"))
+
+    manager.delete_file(BENCH_BUCKET, "parquet/bench.parquet")
+    return {
+        "rows": rows,
+        "object_bytes": buffer.getbuffer().nbytes,
+        "read_file_seconds": full_s,
+        "read_file_projected_seconds": projected_s,
+        "decode_only_seconds": decode_s,
+    }
+
+
+###################################################################
+def run_benchmarks(manager: MinIOManager, args: argparse.Namespace) -> dict:
+    """Executa os benchmarks selecionados e devolve o resultado."""
+    manager.create_bucket_if_not_exists(BENCH_BUCKET)
+    results = {}
+
+    with tempfile.TemporaryDirectory(prefix="minio-bench-work-") as work_dir:
+        suites = {
+            "small_ops": lambda: bench_small_ops(manager, args.small_count, args.small_size),
+            "large_object": lambda: bench_large_object(manager, args.large_mb, Path(work_dir)),
+            "listing": lambda: bench_listing(manager, args.list_keys, args.workers),
+            "read_file": lambda: bench_read_file(manager, args.parquet_rows, args.repeats),
+        }
+        for name in args.only or suites:
+            print(f"▶ {name} ...", flush=True)
+            results[name] = suites[name]()
+            print(f"  {json.dumps(results[name])}", flush=True)
+
+    return results
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+            cwd=Path(__file__).resolve().parent, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def compare(current: dict, previous: dict) -> list[str]:
+    """Linhas com a variação (%) de cada métrica em relação a uma execução anterior."""
+    lines = []
+    for suite, metrics in current["results"].items():
+        old_metrics = previous.get("results", {}).get(suite, {})
+        for key, value in metrics.items():
+            old = old_metrics.get(key)
+            if not isinstance(value, (int, float)) or not isinstance(old, (int, float)) or not old:
+                continue
+            lines.append(f"{suite}.{key}: {old:.4g} -> {value:.4g} ({(value - old) / old:+.1%})")
+    return lines
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks do cliente MinIO contra um servidor local.")
+    parser.add_argument("--endpoint", help="Endpoint S3 já em execução (sem subir o minio local)")
+    parser.add_argument("--access-key", default=os.getenv("MINIO_ACCESS_KEY"))
+    parser.add_argument("--secret-key", default=os.getenv("MINIO_SECRET_KEY"))
+    parser.add_argument("--secure", action="store_true", help="Usar HTTPS com --endpoint")
+    parser.add_argument("--minio-binary", help="Caminho do binário minio (padrão: PATH ou MINIO_BINARY)")
+    parser.add_argument("--output", default="bench_output.json", help="Arquivo JSON de saída")
+    parser.add_argument("--compare", help="JSON de uma execução anterior para comparar")
+    parser.add_argument("--only", nargs="+", choices=["small_ops", "large_object", "listing", "read_file"])
+    parser.add_argument("--small-count", type=int, default=500)
+    parser.add_argument("--small-size", type=int, default=1024)
+    parser.add_argument("--large-mb", type=int, default=256)
+    parser.add_argument("--list-keys", type=int, default=100_000)
+    parser.add_argument("--parquet-rows", type=int, default=1_000_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=32)
+    args = parser.parse_args(argv)
+
+    @contextmanager
+    def _server():
+        if args.endpoint:
+            yield args.endpoint, args.access_key, args.secret_key
+        else:
+            with local_minio_server(args.minio_binary) as server:
+                yield server
+
+    with _server() as (endpoint, access_key, secret_key):
+        secure = bool(args.endpoint and args.secure)
+        # read_file usa o manager compartilhado do módulo de exemplos, configurado por ambiente
+        os.environ.update(
+            MINIO_ENDPOINT=endpoint, MINIO_ACCESS_KEY=access_key,
+            MINIO_SECRET_KEY=secret_key, MINIO_SECURE=str(secure).lower()
+        )
+        manager = MinIOManager(endpoint, access_key, secret_key, secure=secure,
+                               max_connections=max(10, args.workers))
+        results = run_benchmarks(manager, args)
+
+    import minio
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "minio_py": minio.__version__,
+            "endpoint": "local" if not args.endpoint else args.endpoint,
+            "params": {k: v for k, v in vars(args).items() if k not in ("access_key", "secret_key")},
+        },
+        "results": results,
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"✅ Resultados gravados em {args.output}")
+
+    if args.compare:
+        previous = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        for line in compare(report, previous):
+            print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
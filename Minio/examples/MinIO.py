@@ -1,7 +1,12 @@
 # MinIO.py
 import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
+from urllib.parse import quote
 import pandas as pd
+import pyarrow.parquet as pq
 
 # Se este módulo for usado dentro do Streamlit, podemos importar st
 try:
@@ -10,9 +15,16 @@ try:
 except Exception:
     _HAS_ST = False
 
-from Minio.minio_client import MinIOManager, MinIOConfigError, MinIOConnectionError
+from Minio.minio_client import (
+    MinIOManager, MinIOConfigError, MinIOConnectionError, ObjectCache, codec_from_metadata, decompress_bytes
+)
 
-manager = None
+_manager = None
+_cache = None
+_lock = threading.Lock()
+_anexos_cache: dict[tuple[str, str], tuple[float, list[str]]] = {}
+_anexos_lock = threading.Lock()
+_ANEXOS_CACHE_MAX = 50_000
 ###################################################################
 def _get_cfg(key: str, default=None):
     if _HAS_ST:
@@ -32,43 +44,95 @@ def _connect_manager():
         if not endpoint or not access_key or not secret_key:
             raise ValueError("Credenciais do MinIO ausentes (endpoint/access/secret).")
 
+        # Teste de conexão opcional; com MINIO_HEALTH_BUCKET é um único bucket_exists
+        health_raw = _get_cfg("MINIO_HEALTH_CHECK", "true")
+
         # OBS: endpoint SEM https:// — só host (e porta se houver)
         m = MinIOManager(
             endpoint=endpoint,
             access_key=access_key,
             secret_key=secret_key,
-            secure=secure
+            secure=secure,
+            test_connection=str(health_raw).lower() == "true",
+            health_check_bucket=_get_cfg("MINIO_HEALTH_BUCKET")
         )
         print(f"✅ Conectado ao MinIO: {m.endpoint} (secure={secure})")
         return m
     except (MinIOConfigError, MinIOConnectionError, Exception) as e:
         raise RuntimeError(f"Falha ao conectar no MinIO: {e}")
+###################################################################
+def get_manager() -> MinIOManager:
+    """
+    Retorna o MinIOManager compartilhado, conectando na primeira chamada.
 
-try:
-    manager = _connect_manager()
-except Exception as e:
-    print(f"❌ Erro de conexão: {e}")
-    manager = None
+    A conexão não é feita na importação do módulo: só quem usa o MinIO paga
+    o custo. A criação é protegida por lock (seguro com várias threads) e,
+    se falhar, é tentada de novo na próxima chamada.
+    """
+    global _manager
+    if _manager is None:
+        with _lock:
+            if _manager is None:
+                try:
+                    _manager = _connect_manager()
+                except Exception as e:
+                    print(f"❌ Erro de conexão: {e}")
+                    raise
+    return _manager
+
+def __getattr__(name: str):
+    # Compatibilidade: `MinIO.manager` / `from ...MinIO import manager`. Como antes,
+    # vale None se a conexão falhar (quem usa o atributo testa `manager is None`)
+    if name == "manager":
+        try:
+            return get_manager()
+        except RuntimeError:
+            return None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 ###################################################################
-def upload(object_name: str, bucket_name: str, file_path: str, content_type: str = "application/octet-stream") -> dict:
+def _get_cache():
+    """
+    Retorna o cache de leitura, criado na primeira chamada se
+    MINIO_CACHE_MAX_BYTES estiver configurado (MINIO_CACHE_DIR ativa o
+    nível em disco). Sem configuração, retorna None e nada é cacheado.
+    """
+    global _cache
+    if _cache is None:
+        max_bytes = _get_cfg("MINIO_CACHE_MAX_BYTES")
+        if max_bytes:
+            manager = get_manager()
+            with _lock:
+                if _cache is None:
+                    _cache = ObjectCache(
+                        manager,
+                        max_memory_bytes=int(max_bytes),
+                        disk_dir=_get_cfg("MINIO_CACHE_DIR")
+                    )
+    return _cache
+###################################################################
+def upload(object_name: str, bucket_name: str, file_path: str, content_type: str = "application/octet-stream",
+           codec: str | None = None) -> dict:
     """
     Faz upload de um arquivo local para o MinIO.
 
+    Com `codec` ('gzip' ou 'zstd') o arquivo é comprimido durante o envio;
+    download e read_file descomprimem automaticamente.
+
     Retorna um dicionário com:
       - size
       - etag
       - uploaded_at
     """
 
-    if manager is None:
-        raise RuntimeError("MinIO manager não inicializado. Verifique as credenciais.")
+    manager = get_manager()
 
     try:
         result = manager.upload_file(
             file_path=file_path,
             object_name=object_name,
             bucket_name=bucket_name,
-            content_type=content_type
+            content_type=content_type,
+            codec=codec
         )
 
         return result
@@ -79,20 +143,23 @@ def upload(object_name: str, bucket_name: str, file_path: str, content_type: str
             f"{bucket_name}/{object_name}: {e}"
         ) from e
 ###################################################################
-def download(object_name: str, bucket_name: str, download_path: str) -> dict:
+def download(object_name: str, bucket_name: str, download_path: str, parallel: bool = False) -> dict:
     """
     Faz download de um arquivo do MinIO para o disco local.
 
+    Com `parallel=True` o objeto é baixado em intervalos de bytes
+    simultâneos (indicado para exportações de vários GB).
+
     Retorna um dicionário com:
       - local_path
       - size
     """
 
-    if manager is None:
-        raise RuntimeError("MinIO manager não inicializado. Verifique as credenciais.")
+    manager = get_manager()
 
     try:
-        result = manager.download_file(
+        download_fn = manager.download_file_parallel if parallel else manager.download_file
+        result = download_fn(
             bucket_name=bucket_name,
             object_name=object_name,
             file_path=download_path
@@ -106,13 +173,64 @@ def download(object_name: str, bucket_name: str, download_path: str) -> dict:
             f"para '{download_path}': {e}"
         ) from e
 ###################################################################
-def read_file(object_name: str, bucket_name: str) -> pd.DataFrame:
-    if manager is None:
-        raise RuntimeError("MinIO manager não inicializado. Falha anterior de conexão? Verifique as credenciais.")
+def download_prefix(prefix: str, bucket_name: str, local_dir: str, max_workers: int = 8) -> dict:
+    """
+    Baixa em paralelo todos os objetos de um prefixo para um diretório local.
+
+    Arquivos locais já idênticos (tamanho e etag) não são baixados de novo.
+    Retorna o resumo de MinIOManager.download_prefix.
+    """
+
+    manager = get_manager()
+
+    try:
+        return manager.download_prefix(
+            bucket_name=bucket_name,
+            prefix=prefix,
+            local_dir=local_dir,
+            max_workers=max_workers
+        )
+
+    except Exception as e:
+        raise RuntimeError(
+            f"Erro ao baixar o prefixo {bucket_name}/{prefix} "
+            f"para '{local_dir}': {e}"
+        ) from e
+###################################################################
+def read_file(object_name: str, bucket_name: str, columns: list[str] | None = None,
+              filters: list | None = None, use_cache: bool = True) -> pd.DataFrame:
+    """
+    Lê um arquivo parquet do MinIO como DataFrame.
+
+    Com `columns` e/ou `filters` (mesmo formato do pyarrow, ex:
+    [("REFERENCIA_MEDICAO", "=", "2024-01")]) o rodapé do parquet é lido
+    primeiro e só os row groups/colunas necessários são baixados, via GETs
+    com Range no manager.client.
+
+    Se o cache estiver configurado (ver _get_cache) e `use_cache` for True,
+    o DataFrame é reaproveitado enquanto o etag do objeto não mudar.
+
+    Objetos enviados com `codec` (gzip/zstd) são descomprimidos
+    automaticamente; nesse caso o objeto é sempre baixado inteiro.
+    """
+    manager = get_manager()
     resp = None
     try:
+        cache = _get_cache() if use_cache else None
+        if cache is not None:
+            return cache.get_dataframe(bucket_name, object_name, columns=columns, filters=filters)
+
+        if columns is not None or filters is not None:
+            with manager.open_object(bucket_name, object_name) as f:
+                source = BytesIO(decompress_bytes(f.read(), f.codec)) if f.codec else f
+                table = pq.read_table(source, columns=columns, filters=filters)
+            return table.to_pandas()
+
         resp = manager.client.get_object(bucket_name, object_name)
         data = resp.read()
+        codec = codec_from_metadata(resp.headers)
+        if codec is not None:
+            data = decompress_bytes(data, codec)
         return pd.read_parquet(BytesIO(data), engine="pyarrow")
     except Exception as e:
         raise RuntimeError(f"Erro na leitura do arquivo {bucket_name}/{object_name}: {e}") from e
@@ -127,16 +245,78 @@ def read_file(object_name: str, bucket_name: str) -> pd.DataFrame:
             except Exception:
                 pass
 ###################################################################
+def _to_parquet_bytes(df: pd.DataFrame, index: bool | None = None) -> BytesIO:
+    buffer = BytesIO()
+    df.to_parquet(buffer, engine="pyarrow", index=index)
+    buffer.seek(0)
+    return buffer
+###################################################################
+def write_dataframe(df: pd.DataFrame, object_name: str, bucket_name: str,
+                    partition_cols: list[str] | None = None, index: bool | None = None,
+                    max_workers: int = 8) -> dict:
+    """
+    Grava um DataFrame no MinIO como parquet, sem arquivo temporário.
+
+    O parquet é serializado em memória e enviado direto com put_object
+    (em partes, para DataFrames grandes). Com `partition_cols`, grava um
+    dataset particionado no padrão Hive em `object_name/`, por exemplo
+    <object_name>/REFERENCIA_MEDICAO=2024-01/part-00000.parquet, enviando
+    as partições em paralelo.
+
+    Retorna o dicionário de upload (ou o resumo de upload_many_data, no
+    modo particionado).
+    """
+
+    manager = get_manager()
+
+    try:
+        if not partition_cols:
+            buffer = _to_parquet_bytes(df, index=index)
+            return manager.upload_data(
+                data=buffer,
+                object_name=object_name,
+                bucket_name=bucket_name,
+                content_type="application/vnd.apache.parquet",
+                length=buffer.getbuffer().nbytes
+            )
+
+        root = object_name.rstrip("/")
+        objects = []
+        groups = df.groupby(partition_cols, dropna=False, observed=True, sort=True).indices
+        for values, rows in groups.items():
+            values = values if isinstance(values, tuple) else (values,)
+            path = "/".join(
+                f"{col}={'__HIVE_DEFAULT_PARTITION__' if pd.isna(value) else quote(str(value), safe='')}"
+                for col, value in zip(partition_cols, values)
+            )
+            # O recorte da partição e a serialização rodam na thread do upload:
+            # só as partições em envio ficam copiadas na memória
+            objects.append((
+                f"{root}/{path}/part-00000.parquet",
+                lambda rows=rows: _to_parquet_bytes(
+                    df.take(rows).drop(columns=partition_cols), index=index
+                ).getvalue()
+            ))
+
+        return manager.upload_many_data(
+            objects,
+            bucket_name=bucket_name,
+            content_type="application/vnd.apache.parquet",
+            max_workers=max_workers
+        )
+
+    except Exception as e:
+        raise RuntimeError(
+            f"Erro ao gravar DataFrame em {bucket_name}/{object_name}: {e}"
+        ) from e
+###################################################################
 def listar_anexos(bucket_name: str, id_registro: str) -> list[str]:
     """
     Lista todos os anexos armazenados no MinIO para um registro específico,
     usando o padrão <id_registro>_<n>.<ext>.
     """
 
-    if manager is None:
-        raise RuntimeError(
-            "MinIO manager não inicializado. Falha anterior de conexão? Verifique as credenciais."
-        )
+    manager = get_manager()
 
     prefix = f"{id_registro}_"
     anexos = []
@@ -159,4 +339,136 @@ def listar_anexos(bucket_name: str, id_registro: str) -> list[str]:
         raise RuntimeError(
             f"Erro ao listar anexos no bucket '{bucket_name}' com prefixo '{prefix}': {e}"
         ) from e
+###################################################################
+def _agrupar_ids(ids: list[str], sufixo_agrupado: int) -> list[tuple[str, list[str]]]:
+    """
+    Agrupa IDs de mesmo tamanho que só diferem nos últimos `sufixo_agrupado`
+    caracteres (ex: 12340..12349 -> prefixo '1234'). Cada grupo vira uma
+    única listagem; IDs sozinhos continuam com o prefixo '<id>_'.
+    """
+    grupos: dict[tuple[int, str], list[str]] = {}
+    for id_registro in sorted(set(ids)):
+        if sufixo_agrupado and len(id_registro) > sufixo_agrupado:
+            chave = (len(id_registro), id_registro[:-sufixo_agrupado])
+        else:
+            chave = (len(id_registro), id_registro)
+        grupos.setdefault(chave, []).append(id_registro)
+
+    return [
+        (prefixo if len(membros) > 1 else f"{membros[0]}_", membros)
+        for (_, prefixo), membros in grupos.items()
+    ]
+###################################################################
+def listar_anexos_lote(bucket_name: str, ids_registro: list[str], max_workers: int = 8,
+                       sufixo_agrupado: int = 0, cache_ttl: float = 0) -> dict[str, list[str]]:
+    """
+    Lista os anexos de vários registros de uma vez (padrão <id_registro>_<n>.<ext>).
+
+    Cada ID é listado com o prefixo '<id>_', em paralelo. Com
+    `sufixo_agrupado` > 0, IDs de mesmo tamanho que só diferem nos últimos
+    caracteres são resolvidos com uma única listagem, limitada ao intervalo
+    entre o menor e o maior ID do grupo; vale a pena só quando os IDs do
+    lote são densos (ex: 12340..12349), pois chaves de IDs mais longos dentro
+    do intervalo também são percorridas. Com `cache_ttl` (segundos) os
+    resultados ficam guardados em memória por esse tempo.
+
+    Retorna um dicionário id_registro -> lista de anexos, com o mesmo
+    resultado de chamar listar_anexos para cada ID.
+    """
+
+    manager = get_manager()
+
+    ids = [str(id_registro) for id_registro in ids_registro]
+    resultado: dict[str, list[str]] = {}
+    agora = time.monotonic()
+
+    if cache_ttl > 0:
+        with _anexos_lock:
+            for id_registro in ids:
+                entrada = _anexos_cache.get((bucket_name, id_registro))
+                if entrada is not None and entrada[0] > agora:
+                    resultado[id_registro] = list(entrada[1])
+
+    pendentes = [id_registro for id_registro in ids if id_registro not in resultado]
+
+    def _listar_id(id_registro: str) -> list[str]:
+        prefix = f"{id_registro}_"
+        return [obj.object_name for obj in manager.client.list_objects(bucket_name, prefix=prefix, recursive=True)]
+
+    def _listar(grupo: tuple[str, list[str]]) -> dict[str, list[str]]:
+        prefix, membros = grupo
+        if len(membros) == 1:
+            return {membros[0]: _listar_id(membros[0])}
+
+        # A listagem é ordenada: começa no menor ID e para ao passar do maior.
+        # Se aparecerem chaves demais de outros IDs no intervalo (ex: IDs mais
+        # longos), desiste e lista cada ID do grupo separadamente.
+        anexos = {id_registro: [] for id_registro in membros}
+        ultimo = f"{membros[-1]}_"
+        alheias, limite_alheias = 0, 10 * len(membros)
+        objetos = manager.client.list_objects(bucket_name, prefix=prefix, recursive=True, start_after=membros[0])
+        for obj in objetos:
+            nome = obj.object_name
+            if nome > ultimo and not nome.startswith(ultimo):
+                break
+            encontrados = [id_registro for id_registro in membros if nome.startswith(f"{id_registro}_")]
+            for id_registro in encontrados:
+                anexos[id_registro].append(nome)
+            if not encontrados:
+                alheias += 1
+                if alheias > limite_alheias:
+                    return {id_registro: _listar_id(id_registro) for id_registro in membros}
+        return anexos
+
+    try:
+        grupos = _agrupar_ids(pendentes, sufixo_agrupado)
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(grupos) or 1))) as pool:
+            for anexos in pool.map(_listar, grupos):
+                resultado.update(anexos)
+
+    except Exception as e:
+        raise RuntimeError(
+            f"Erro ao listar anexos em lote no bucket '{bucket_name}': {e}"
+        ) from e
+
+    if cache_ttl > 0:
+        agora = time.monotonic()
+        expira = agora + cache_ttl
+        with _anexos_lock:
+            # Descarta as entradas vencidas e, acima do limite, as que vencem primeiro
+            for chave in [chave for chave, (validade, _) in _anexos_cache.items() if validade <= agora]:
+                del _anexos_cache[chave]
+            for id_registro in pendentes:
+                _anexos_cache[(bucket_name, id_registro)] = (expira, list(resultado[id_registro]))
+            excesso = len(_anexos_cache) - _ANEXOS_CACHE_MAX
+            if excesso > 0:
+                for chave, _ in sorted(_anexos_cache.items(), key=lambda item: item[1][0])[:excesso]:
+                    del _anexos_cache[chave]
+
+    return {id_registro: resultado[id_registro] for id_registro in ids}
+###################################################################
+def links_anexos(bucket_name: str, anexos: list[str], expires_hours: float = 1) -> dict[str, str]:
+    """
+    Gera os links de download de vários anexos de uma vez (ex: a saída de
+    listar_anexos_lote), sem uma requisição por link.
 
+    Links gerados em renderizações anteriores são reaproveitados enquanto
+    faltarem mais de 5 minutos para expirarem.
+
+    Retorna um dicionário anexo -> URL.
+    """
+
+    manager = get_manager()
+
+    try:
+        return manager.generate_presigned_urls(
+            bucket_name,
+            anexos,
+            expires_hours=expires_hours,
+            use_cache=True
+        )
+
+    except Exception as e:
+        raise RuntimeError(
+            f"Erro ao gerar links de anexos no bucket '{bucket_name}': {e}"
+        ) from e
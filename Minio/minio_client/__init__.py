@@ -5,7 +5,15 @@ Este módulo fornece uma interface simples e robusta para operações
 com MinIO, especialmente projetado para equipes de ETL.
 """
 
-from .client import MinIOManager
+from .client import MinIOManager, ObjectEntry
+from .ranged import RangedObjectReader
+from .cache import ObjectCache
+from .async_client import AsyncMinIOManager
+from .index import BucketIndex
+from .metrics import OperationMetrics
+from .compression import SUPPORTED_CODECS, codec_from_metadata, decompress_bytes
+from .retry import RetryPolicy, AdaptiveConcurrencyLimiter
+from .presign import PresignedUrlCache
 from .exceptions import MinIOBaseError, MinIOConfigError, MinIOOperationError, MinIOConnectionError
 
 __version__ = "1.0.0"
@@ -13,6 +21,18 @@ __author__ = "Equipe de Desenvolvimento"
 
 __all__ = [
     "MinIOManager",
+    "AsyncMinIOManager",
+    "ObjectEntry",
+    "RangedObjectReader",
+    "ObjectCache",
+    "BucketIndex",
+    "OperationMetrics",
+    "RetryPolicy",
+    "AdaptiveConcurrencyLimiter",
+    "PresignedUrlCache",
+    "SUPPORTED_CODECS",
+    "codec_from_metadata",
+    "decompress_bytes",
     "MinIOBaseError", 
     "MinIOConfigError",
     "MinIOOperationError",
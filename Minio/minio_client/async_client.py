@@ -0,0 +1,154 @@
+"""
+Interface asyncio para o MinIOManager.
+
+O cliente Minio é síncrono (urllib3), então cada chamada roda em um pool de
+threads próprio, dimensionado junto com o pool de conexões HTTP e limitado
+por um semáforo. Assim milhares de chamadas de metadados podem ser
+disparadas no mesmo event loop sem ocupar o executor padrão da aplicação.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from .client import MinIOManager
+
+logger = logging.getLogger(__name__)
+
+# Número padrão de chamadas simultâneas ao MinIO
+DEFAULT_MAX_CONCURRENCY = 64
+
+
+class AsyncMinIOManager:
+    """
+    Versão assíncrona do MinIOManager.
+
+    Expõe os mesmos métodos como corrotinas e levanta as mesmas exceções
+    (MinIOOperationError, MinIOConfigError, MinIOConnectionError).
+    """
+
+    def __init__(self, manager: MinIOManager, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        """
+        Args:
+            manager: MinIOManager já inicializado
+            max_concurrency: Número máximo de chamadas simultâneas (padrão: 64)
+        """
+        self.manager = manager
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="minio-async"
+        )
+
+    @classmethod
+    async def connect(cls, endpoint: str, access_key: str, secret_key: str, secure: bool = True,
+                      max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> "AsyncMinIOManager":
+        """
+        Cria o MinIOManager (fora do event loop) com um pool de conexões do
+        tamanho da concorrência desejada.
+
+        Raises:
+            MinIOConfigError: Se as credenciais estão inválidas
+            MinIOConnectionError: Se não conseguir conectar ao servidor
+        """
+        loop = asyncio.get_running_loop()
+        manager = await loop.run_in_executor(None, partial(
+            MinIOManager, endpoint, access_key, secret_key,
+            secure=secure, max_connections=max_concurrency, max_concurrency=max_concurrency
+        ))
+        return cls(manager, max_concurrency=max_concurrency)
+
+    async def _run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    async def list_buckets(self) -> List[str]:
+        return await self._run(self.manager.list_buckets)
+
+    async def bucket_exists(self, bucket_name: str) -> bool:
+        return await self._run(self.manager.bucket_exists, bucket_name)
+
+    async def create_bucket_if_not_exists(self, bucket_name: str):
+        return await self._run(self.manager.create_bucket_if_not_exists, bucket_name)
+
+    async def upload_file(self, file_path: Union[str, Path], object_name: str, bucket_name: str,
+                          content_type: Optional[str] = None, codec: Optional[str] = None,
+                          resume: bool = False) -> Dict[str, Any]:
+        return await self._run(
+            self.manager.upload_file, file_path, object_name, bucket_name,
+            content_type=content_type, codec=codec, resume=resume
+        )
+
+    async def download_file(self, bucket_name: str, object_name: str,
+                            file_path: Union[str, Path]) -> Dict[str, Any]:
+        return await self._run(self.manager.download_file, bucket_name, object_name, file_path)
+
+    async def list_files(self, bucket_name: str, prefix: str = "",
+                         recursive: bool = True) -> List[Dict[str, Any]]:
+        return await self._run(self.manager.list_files, bucket_name, prefix=prefix, recursive=recursive)
+
+    async def get_file_info(self, bucket_name: str, object_name: str) -> Dict[str, Any]:
+        return await self._run(self.manager.get_file_info, bucket_name, object_name)
+
+    async def get_many_file_info(self, bucket_name: str, object_names: Iterable[str],
+                                 return_exceptions: bool = False) -> List[Any]:
+        """
+        Obtém metadados de vários objetos simultaneamente.
+
+        Args:
+            bucket_name: Nome do bucket
+            object_names: Nomes dos objetos
+            return_exceptions: Se deve devolver as exceções na lista em vez
+                               de levantar a primeira (padrão: False)
+
+        Returns:
+            Lista no formato de get_file_info, na ordem de `object_names`
+        """
+        return await asyncio.gather(
+            *(self.get_file_info(bucket_name, name) for name in object_names),
+            return_exceptions=return_exceptions
+        )
+
+    async def delete_file(self, bucket_name: str, object_name: str):
+        return await self._run(self.manager.delete_file, bucket_name, object_name)
+
+    async def generate_presigned_upload_url(self, bucket_name: str, object_name: str,
+                                            expires_hours: int = 1) -> str:
+        return await self._run(
+            self.manager.generate_presigned_upload_url, bucket_name, object_name, expires_hours
+        )
+
+    async def generate_presigned_download_url(self, bucket_name: str, object_name: str,
+                                              expires_hours: int = 1) -> str:
+        return await self._run(
+            self.manager.generate_presigned_download_url, bucket_name, object_name, expires_hours
+        )
+
+    async def generate_presigned_urls(self, bucket_name: str, object_names: Iterable[str],
+                                      method: str = "GET", expires_hours: float = 1,
+                                      use_cache: bool = False) -> Dict[str, str]:
+        return await self._run(
+            self.manager.generate_presigned_urls, bucket_name, list(object_names),
+            method=method, expires_hours=expires_hours, use_cache=use_cache
+        )
+
+    async def close(self):
+        """Encerra o pool de threads, aguardando as chamadas em andamento."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, partial(self._executor.shutdown, wait=True))
+
+    async def __aenter__(self) -> "AsyncMinIOManager":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def __str__(self):
+        return f"AsyncMinIOManager(endpoint={self.manager.endpoint}, max_concurrency={self.max_concurrency})"
+
+    def __repr__(self):
+        return self.__str__()
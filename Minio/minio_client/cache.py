@@ -0,0 +1,257 @@
+"""
+Cache de leitura para objetos do MinIO.
+
+Mantém bytes e DataFrames em memória (LRU limitado em bytes) e,
+opcionalmente, os bytes em disco. As entradas são indexadas por
+bucket, objeto e etag e revalidadas com um `stat_object` a cada acesso:
+enquanto o objeto não mudar no servidor, nada é baixado de novo.
+"""
+
+import os
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Dict, Hashable, Optional, Tuple, Union
+
+from minio.error import S3Error
+
+from .compression import codec_from_metadata, decompress_bytes
+from .exceptions import MinIOOperationError
+
+logger = logging.getLogger(__name__)
+
+# Orçamento padrão de memória do cache (256 MiB)
+DEFAULT_MAX_MEMORY_BYTES = 256 * 1024 * 1024
+
+
+class ObjectCache:
+    """
+    Cache LRU de objetos do MinIO com segundo nível opcional em disco.
+
+    O nível em memória guarda tanto bytes brutos quanto DataFrames
+    decodificados; o nível em disco guarda apenas bytes brutos.
+    """
+
+    def __init__(self, manager, max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES,
+                 disk_dir: Optional[Union[str, Path]] = None,
+                 max_disk_bytes: Optional[int] = None):
+        """
+        Args:
+            manager: MinIOManager usado para stat e download
+            max_memory_bytes: Orçamento do nível em memória, em bytes
+            disk_dir: Diretório do nível em disco (opcional)
+            max_disk_bytes: Orçamento do nível em disco, em bytes (opcional)
+        """
+        self.manager = manager
+        self.max_memory_bytes = max_memory_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.max_disk_bytes = max_disk_bytes
+
+        self._entries: "OrderedDict[Tuple, Tuple[Any, int]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        if self.disk_dir:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # API pública
+    # ------------------------------------------------------------------
+    def get_bytes(self, bucket_name: str, object_name: str) -> bytes:
+        """
+        Retorna o conteúdo de um objeto, baixando-o só se o etag mudou.
+
+        Raises:
+            MinIOOperationError: Se falhar ao consultar ou baixar o objeto
+        """
+        etag = self._current_etag(bucket_name, object_name)
+        key = (bucket_name, object_name, etag, "bytes")
+
+        data = self._memory_get(key)
+        if data is None:
+            data = self._load_bytes(bucket_name, object_name, etag)
+            self._memory_put(key, data, len(data))
+        return data
+
+    def get_dataframe(self, bucket_name: str, object_name: str, columns: Optional[list] = None,
+                      filters: Optional[list] = None, copy: bool = True):
+        """
+        Retorna um parquet do MinIO como DataFrame, decodificando-o só se o etag mudou.
+
+        Args:
+            bucket_name: Nome do bucket
+            object_name: Nome do objeto parquet
+            columns: Colunas a ler (opcional, lidas via GETs com Range)
+            filters: Filtros no formato do pyarrow (opcional)
+            copy: Se deve devolver uma cópia, protegendo a entrada do cache
+                  contra alterações do chamador (padrão: True)
+
+        Raises:
+            MinIOOperationError: Se falhar ao consultar ou baixar o objeto
+        """
+        import pandas as pd
+        import pyarrow.parquet as pq
+
+        etag = self._current_etag(bucket_name, object_name)
+        variant = (repr(columns), repr(filters))
+        key = (bucket_name, object_name, etag, "dataframe", variant)
+
+        df = self._memory_get(key)
+        if df is None:
+            if columns is None and filters is None:
+                data = self._load_bytes(bucket_name, object_name, etag)
+                df = pd.read_parquet(BytesIO(data), engine="pyarrow")
+            else:
+                with self.manager.open_object(bucket_name, object_name) as f:
+                    source = BytesIO(decompress_bytes(f.read(), f.codec)) if f.codec else f
+                    df = pq.read_table(source, columns=columns, filters=filters).to_pandas()
+            self._memory_put(key, df, int(df.memory_usage(deep=True).sum()))
+
+        return df.copy() if copy else df
+
+    def invalidate(self, bucket_name: Optional[str] = None, object_name: Optional[str] = None):
+        """Remove entradas do cache (todas, de um bucket ou de um objeto)."""
+        with self._lock:
+            for key in list(self._entries):
+                if bucket_name is not None and key[0] != bucket_name:
+                    continue
+                if object_name is not None and key[1] != object_name:
+                    continue
+                _, size = self._entries.pop(key)
+                self._memory_bytes -= size
+
+        # Os arquivos em disco são nomeados pelo hash de bucket/objeto, então
+        # só é possível removê-los todos ou os de um objeto específico
+        if self.disk_dir and object_name is not None and bucket_name is not None:
+            pattern = f"{self._disk_stem(bucket_name, object_name)}-*.bin"
+        elif self.disk_dir and object_name is None and bucket_name is None:
+            pattern = "*.bin"
+        else:
+            return
+        for path in self.disk_dir.glob(pattern):
+            path.unlink(missing_ok=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Retorna estatísticas de uso do cache."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "memory_bytes": self._memory_bytes,
+                "max_memory_bytes": self.max_memory_bytes,
+                "hits": self.hits,
+                "misses": self.misses
+            }
+
+    # ------------------------------------------------------------------
+    # Nível em memória
+    # ------------------------------------------------------------------
+    def _memory_get(self, key: Tuple[Hashable, ...]) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def _memory_put(self, key: Tuple[Hashable, ...], value: Any, size: int):
+        if size > self.max_memory_bytes:
+            logger.info(f"Objeto {key[0]}/{key[1]} ({size:,} bytes) excede o orçamento do cache")
+            return
+
+        with self._lock:
+            # Versões antigas do mesmo objeto nunca mais serão usadas
+            for old_key in [k for k in self._entries if k[:2] == key[:2] and k[2] != key[2]]:
+                self._memory_bytes -= self._entries.pop(old_key)[1]
+
+            if key in self._entries:
+                self._memory_bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self._memory_bytes += size
+
+            while self._memory_bytes > self.max_memory_bytes and self._entries:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._memory_bytes -= evicted_size
+
+    # ------------------------------------------------------------------
+    # Nível em disco e servidor
+    # ------------------------------------------------------------------
+    def _current_etag(self, bucket_name: str, object_name: str) -> str:
+        try:
+            stat = self.manager._call(self.manager.client.stat_object, bucket_name, object_name)
+        except S3Error as e:
+            raise MinIOOperationError(f"Erro ao validar cache de '{object_name}': {e}", "get_file_info")
+        return (stat.etag or "").strip('"')
+
+    @staticmethod
+    def _disk_stem(bucket_name: str, object_name: str) -> str:
+        return hashlib.sha1(f"{bucket_name}/{object_name}".encode("utf-8")).hexdigest()
+
+    def _disk_path(self, bucket_name: str, object_name: str, etag: str) -> Path:
+        return self.disk_dir / f"{self._disk_stem(bucket_name, object_name)}-{etag}.bin"
+
+    def _load_bytes(self, bucket_name: str, object_name: str, etag: str) -> bytes:
+        """
+        Lê os bytes do disco ou, se ausentes, do servidor (fixando o etag com
+        If-Match). Objetos comprimidos são guardados já descomprimidos.
+        """
+        disk_path = self._disk_path(bucket_name, object_name, etag) if self.disk_dir else None
+
+        if disk_path is not None and disk_path.exists():
+            data = disk_path.read_bytes()
+            os.utime(disk_path)
+            return data
+
+        def _get() -> Tuple[bytes, Optional[str]]:
+            resp = self.manager.client.get_object(
+                bucket_name, object_name,
+                request_headers={"If-Match": etag} if etag else None
+            )
+            try:
+                return resp.read(), codec_from_metadata(resp.headers)
+            finally:
+                resp.close()
+                resp.release_conn()
+
+        try:
+            data, codec = self.manager._run_with_retry(_get, object_name)
+        except S3Error as e:
+            raise MinIOOperationError(f"Erro ao baixar '{object_name}': {e}", "download_file")
+
+        logger.info(f"Cache: {bucket_name}/{object_name} baixado ({len(data):,} bytes)")
+        if codec is not None:
+            data = decompress_bytes(data, codec)
+
+        if disk_path is not None:
+            self._disk_put(bucket_name, object_name, disk_path, data)
+        return data
+
+    def _disk_put(self, bucket_name: str, object_name: str, disk_path: Path, data: bytes):
+        for stale in self.disk_dir.glob(f"{self._disk_stem(bucket_name, object_name)}-*.bin"):
+            stale.unlink(missing_ok=True)
+
+        tmp_path = disk_path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, disk_path)
+
+        if self.max_disk_bytes is not None:
+            self._trim_disk()
+
+    def _trim_disk(self):
+        files = sorted(self.disk_dir.glob("*.bin"), key=lambda p: p.stat().st_mtime)
+        total = sum(p.stat().st_size for p in files)
+        for path in files:
+            if total <= self.max_disk_bytes:
+                break
+            total -= path.stat().st_size
+            path.unlink(missing_ok=True)
+
+    def __repr__(self):
+        return (f"ObjectCache(max_memory_bytes={self.max_memory_bytes}, "
+                f"disk_dir={self.disk_dir})")
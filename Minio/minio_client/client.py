@@ -6,18 +6,140 @@ focada nas necessidades de pipelines de ETL.
 """
 
 import os
+import json
+import time
+import hashlib
 import logging
+import threading
+from io import BytesIO
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union, IO
+from typing import List, Dict, Any, Optional, Union, IO, Callable, Iterable, Iterator, Tuple, NamedTuple, TYPE_CHECKING
 from datetime import datetime, timedelta
 
+import certifi
+import urllib3
 from minio import Minio
+from minio.commonconfig import ComposeSource, CopySource
+from minio.datatypes import Part
+from minio.deleteobjects import DeleteObject
 from minio.error import S3Error
+from minio.select import (
+    CSVInputSerialization, JSONInputSerialization, JSONOutputSerialization,
+    ParquetInputSerialization, SelectRequest
+)
 
+from .compression import (
+    CompressingReader, check_codec, codec_from_metadata, codec_metadata, decompress_bytes, decompress_file,
+    original_from_metadata
+)
 from .exceptions import MinIOConfigError, MinIOOperationError, MinIOConnectionError
+from .metrics import OperationMetrics, instrumented
+from .ranged import RangedObjectReader
+from .presign import PresignedUrlCache, presign_many
+from .retry import AdaptiveConcurrencyLimiter, RetryPolicy
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Número padrão de transferências simultâneas nas operações em lote
+DEFAULT_MAX_WORKERS = 8
+
+# Tamanho das partes em uploads multipart
+DEFAULT_PART_SIZE = 16 * 1024 * 1024
+
+# Limite de partes de um upload multipart no S3
+MAX_MULTIPART_PARTS = 10000
+
+# Partes enviadas simultaneamente em cada upload multipart de arquivo
+MULTIPART_MAX_WORKERS = 4
+
+# Tamanho padrão do pool de conexões HTTP: upload_many com os workers padrão,
+# cada um enviando as partes de um multipart em paralelo
+DEFAULT_MAX_CONNECTIONS = DEFAULT_MAX_WORKERS * MULTIPART_MAX_WORKERS
+
+# Idade a partir da qual um upload multipart pendente é considerado abandonado (24 h)
+STALE_MULTIPART_AGE = 24 * 3600
+
+# Limite inicial (e máximo) de requisições simultâneas do limitador adaptativo
+DEFAULT_MAX_CONCURRENCY = 64
+
+# Tamanho dos intervalos (Range) nos downloads paralelos de objetos grandes
+DEFAULT_CHUNK_SIZE = 16 * 1024 * 1024
+
+# Limite de chaves por requisição de remoção múltipla (DeleteObjects)
+DELETE_BATCH_SIZE = 1000
+
+# Registros por DataFrame parcial nas consultas S3 Select
+DEFAULT_QUERY_CHUNK_ROWS = 50_000
+
+# Tamanho dos blocos lidos ao calcular hashes de arquivos locais
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _normalize_etag(etag: Optional[str]) -> str:
+    """Remove aspas e espaços de um etag retornado pelo servidor."""
+    return (etag or "").strip().strip('"')
+
+
+def _file_md5(file_path: Path, part_size: int = 0) -> List[bytes]:
+    """Retorna o digest MD5 do arquivo inteiro ou de cada parte de `part_size` bytes."""
+    digests = []
+    md5 = hashlib.md5()
+    read_size = part_size or _HASH_CHUNK_SIZE
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(read_size), b""):
+            if part_size:
+                digests.append(hashlib.md5(chunk).digest())
+            else:
+                md5.update(chunk)
+    return digests if part_size else [md5.digest()]
+
+
+def _matches_local_etag(file_path: Path, remote_etag: Optional[str]) -> bool:
+    """
+    Verifica se um arquivo local tem o mesmo etag S3 de um objeto remoto.
+    
+    Uploads simples usam o MD5 do conteúdo. Para uploads multipart
+    ('<md5>-<n>') o tamanho da parte não é conhecido, então são testados os
+    tamanhos usuais (5, 8 e 16 MiB) e o tamanho mínimo que gera n partes.
+    """
+    remote_etag = _normalize_etag(remote_etag)
+    if not remote_etag:
+        return False
+    
+    if "-" not in remote_etag:
+        return _file_md5(file_path)[0].hex() == remote_etag
+    
+    digest, _, count = remote_etag.rpartition("-")
+    if not count.isdigit() or int(count) <= 0:
+        return False
+    parts = int(count)
+    
+    mib = 1024 * 1024
+    file_size = file_path.stat().st_size
+    estimated = -(-(-(-file_size // parts)) // mib) * mib
+    for part_size in dict.fromkeys((5 * mib, 8 * mib, 16 * mib, estimated)):
+        if -(-file_size // part_size) != parts:
+            continue
+        if hashlib.md5(b"".join(_file_md5(file_path, part_size))).hexdigest() == digest:
+            return True
+    return False
+
+
+class ObjectEntry(NamedTuple):
+    """Registro leve de um objeto listado (alternativa aos dicionários de list_files)."""
+    name: str
+    size: Optional[int]
+    last_modified: Optional[datetime]
+    etag: Optional[str]
+    content_type: Optional[str]
+    bucket: str
+
 
 class MinIOManager:
     """
@@ -30,7 +152,24 @@ class MinIOManager:
     - Geração de URLs pré-assinadas
     """
     
-    def __init__(self, endpoint: str, access_key: str, secret_key: str, secure: bool = True):
+    # Coletor de métricas (OperationMetrics); None desativa a instrumentação
+    metrics: Optional[OperationMetrics] = None
+    
+    # Política de novas tentativas das operações idempotentes
+    retry_policy: RetryPolicy = RetryPolicy()
+    
+    # Limitador adaptativo de requisições simultâneas; None desativa o limite
+    limiter: Optional[AdaptiveConcurrencyLimiter] = None
+    
+    # URLs pré-assinadas reaproveitáveis (ver generate_presigned_urls)
+    presigned_url_cache: Optional[PresignedUrlCache] = None
+    
+    def __init__(self, endpoint: str, access_key: str, secret_key: str, secure: bool = True,
+                 max_connections: Optional[int] = None, lazy: bool = False,
+                 test_connection: bool = True, health_check_bucket: Optional[str] = None,
+                 metrics: Optional[OperationMetrics] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 max_concurrency: Optional[int] = DEFAULT_MAX_CONCURRENCY):
         """
         Inicializa o cliente MinIO.
         
@@ -39,6 +178,22 @@ class MinIOManager:
             access_key: Chave de acesso
             secret_key: Chave secreta  
             secure: Se deve usar HTTPS (padrão: True)
+            max_connections: Tamanho do pool de conexões HTTP (padrão: 32, o
+                             pico de upload_many com os workers padrão e
+                             uploads multipart, limitado a max_concurrency).
+                             Aumente ao usar mais workers nas operações em lote.
+            lazy: Se True, o cliente só é criado (e testado) no primeiro uso
+            test_connection: Se deve testar a conexão ao criar o cliente (padrão: True)
+            health_check_bucket: Bucket usado no teste de conexão; com ele o
+                                 teste é um único bucket_exists em vez de
+                                 list_buckets (opcional)
+            metrics: Coletor de métricas por operação (opcional; desativado por padrão)
+            retry_policy: Política de novas tentativas nas falhas transitórias
+                          (padrão: RetryPolicy(); use RetryPolicy(max_attempts=1)
+                          para desativar)
+            max_concurrency: Limite máximo de requisições simultâneas; o limite
+                             efetivo cai pela metade a cada SlowDown/503 e volta
+                             a subir com os sucessos (padrão: 64; None desativa)
         
         Raises:
             MinIOConfigError: Se as credenciais estão inválidas
@@ -48,13 +203,44 @@ class MinIOManager:
         self.access_key = access_key
         self.secret_key = secret_key
         self.secure = secure
+        self.max_connections = max_connections
+        self.test_connection = test_connection
+        self.health_check_bucket = health_check_bucket
+        self.metrics = metrics
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.limiter = AdaptiveConcurrencyLimiter(max_limit=max_concurrency) if max_concurrency else None
+        self.presigned_url_cache = PresignedUrlCache()
+        
+        self._client: Optional[Minio] = None
+        self._client_lock = threading.Lock()
         
         self._validate_config()
-        self._init_client()
-        self._test_connection()
+        if not lazy:
+            self._ensure_client()
         
         logger.info(f"MinIOManager inicializado para endpoint: {self.endpoint}")
 
+    @property
+    def client(self) -> Minio:
+        """Cliente Minio subjacente, criado no primeiro acesso no modo lazy."""
+        if self._client is None:
+            self._ensure_client()
+        return self._client
+
+    @client.setter
+    def client(self, value: Minio):
+        self._client = value
+
+    def _ensure_client(self):
+        """Cria e testa o cliente uma única vez, mesmo com várias threads."""
+        with self._client_lock:
+            if self._client is not None:
+                return
+            client = self._init_client()
+            if self.test_connection:
+                self._test_connection(client)
+            self._client = client
+
     def _validate_config(self):
         """Valida a configuração fornecida."""
         if not self.endpoint:
@@ -66,29 +252,74 @@ class MinIOManager:
         if not self.secret_key:
             raise MinIOConfigError("Secret key não pode estar vazia")
 
-    def _init_client(self):
+    def _init_client(self) -> Minio:
         """Inicializa o cliente MinIO."""
         try:
-            self.client = Minio(
+            return Minio(
                 endpoint=self.endpoint,
                 access_key=self.access_key,
                 secret_key=self.secret_key,
-                secure=self.secure
+                secure=self.secure,
+                http_client=self._build_http_client()
             )
         except Exception as e:
             raise MinIOConfigError(f"Erro ao inicializar cliente MinIO: {e}")
 
-    def _test_connection(self):
+    def _build_http_client(self) -> urllib3.PoolManager:
+        """
+        Cria o pool HTTP com os mesmos padrões do cliente Minio, mudando o
+        tamanho e deixando o 503 (SlowDown) para a RetryPolicy e o limitador
+        adaptativo, em vez de repeti-lo silenciosamente no urllib3.
+        
+        Com a RetryPolicy ativa (max_attempts > 1) o urllib3 não repete
+        falhas de conexão nem respostas 5xx: as duas camadas multiplicariam
+        as tentativas (5 x 5 por chamada). Só os redirecionamentos continuam
+        com o urllib3.
+        """
+        timeout = timedelta(minutes=5).seconds
+        maxsize = self.max_connections
+        if maxsize is None:
+            maxsize = min(DEFAULT_MAX_CONNECTIONS, self.limiter.max_limit) if self.limiter else DEFAULT_MAX_CONNECTIONS
+        if self.retry_policy.max_attempts > 1:
+            retries = urllib3.Retry(total=5, connect=0, read=0, status=0, other=0)
+        else:
+            retries = urllib3.Retry(total=5, backoff_factor=0.2, status_forcelist=[500, 502, 504])
+        return urllib3.PoolManager(
+            timeout=urllib3.Timeout(connect=timeout, read=timeout),
+            maxsize=maxsize,
+            cert_reqs="CERT_REQUIRED",
+            ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+            retries=retries
+        )
+
+    def _test_connection(self, client: Minio):
         """Testa a conectividade com o servidor MinIO."""
         try:
-            # Tenta listar buckets para validar a conexão
-            list(self.client.list_buckets())
+            if self.health_check_bucket:
+                # Uma única requisição leve (HEAD no bucket) valida endpoint e credenciais
+                client.bucket_exists(self.health_check_bucket)
+            else:
+                # Tenta listar buckets para validar a conexão
+                list(client.list_buckets())
         except Exception as e:
             raise MinIOConnectionError(
                 f"Falha ao conectar com MinIO: {e}", 
                 endpoint=self.endpoint
             )
 
+    def _call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Chama uma operação idempotente do cliente com novas tentativas e limite de concorrência."""
+        return self._run_with_retry(partial(func, *args, **kwargs), getattr(func, "__name__", ""))
+
+    def _run_with_retry(self, func: Callable[[], Any], description: str = "",
+                        max_attempts: Optional[int] = None) -> Any:
+        """Executa `func` (sem argumentos) segundo a retry_policy, dentro do limitador."""
+        policy = self.retry_policy
+        if max_attempts is not None:
+            policy = policy._replace(max_attempts=max_attempts)
+        return policy.run(func, self.limiter, description)
+
+    @instrumented("list_buckets")
     def list_buckets(self) -> List[str]:
         """
         Lista todos os buckets disponíveis.
@@ -100,11 +331,12 @@ class MinIOManager:
             MinIOOperationError: Se falhar ao listar buckets
         """
         try:
-            buckets = self.client.list_buckets()
+            buckets = self._call(self.client.list_buckets)
             return [bucket.name for bucket in buckets]
         except S3Error as e:
             raise MinIOOperationError(f"Erro ao listar buckets: {e}", "list_buckets")
 
+    @instrumented("create_bucket")
     def create_bucket_if_not_exists(self, bucket_name: str):
         """
         Cria um bucket se ele não existir.
@@ -116,7 +348,7 @@ class MinIOManager:
             MinIOOperationError: Se falhar ao criar o bucket
         """
         try:
-            if not self.client.bucket_exists(bucket_name):
+            if not self._call(self.client.bucket_exists, bucket_name):
                 self.client.make_bucket(bucket_name)
                 logger.info(f"Bucket '{bucket_name}' criado com sucesso")
             else:
@@ -128,64 +360,626 @@ class MinIOManager:
             )
 
     def upload_file(self, file_path: Union[str, Path], object_name: str, bucket_name: str,
-                   content_type: Optional[str] = None) -> Dict[str, Any]:
+                   content_type: Optional[str] = None, codec: Optional[str] = None,
+                   resume: bool = False) -> Dict[str, Any]:
         """
         Faz upload de um arquivo para o MinIO.
         
+        Com `codec` ('gzip' ou 'zstd') o arquivo é comprimido durante o envio
+        e o codec fica registrado nos metadados do objeto; download_file e
+        as leituras descomprimem automaticamente.
+        
         Args:
             file_path: Caminho local do arquivo
             object_name: Nome do objeto no MinIO
             bucket_name: Nome do bucket de destino
             content_type: Tipo MIME do arquivo (opcional)
+            codec: Codec de compressão (opcional)
+            resume: Se deve retomar um upload multipart pendente do mesmo objeto
+                    (arquivos acima de 16 MiB) e mantê-lo em caso de falha.
+                    Só é seguro quando não há outro processo enviando o mesmo
+                    objeto ao mesmo tempo (padrão: False)
             
         Returns:
-            Dicionário com informações do upload
+            Dicionário com informações do upload (com codec, "size" é o
+            tamanho armazenado e "original_size" o do arquivo local)
             
         Raises:
+            MinIOConfigError: Se o codec for desconhecido ou indisponível
             MinIOOperationError: Se falhar ao fazer upload
         """
         file_path = Path(file_path)
         
         if not file_path.exists():
             raise MinIOOperationError(f"Arquivo não encontrado: {file_path}", "upload_file")
+        if codec is not None:
+            codec = check_codec(codec)
         
         try:
             # Garantir que o bucket existe
             self.create_bucket_if_not_exists(bucket_name)
             
-            file_size = file_path.stat().st_size
+            return self._put_file(file_path, object_name, bucket_name, content_type, codec, resume)
             
-            result = self.client.fput_object(
+        except S3Error as e:
+            raise MinIOOperationError(f"Erro ao fazer upload de '{object_name}': {e}", "upload_file")
+
+    @instrumented("upload_file", transfers_bytes=True)
+    def _put_file(self, file_path: Path, object_name: str, bucket_name: str,
+                  content_type: Optional[str] = None, codec: Optional[str] = None,
+                  resume: bool = False) -> Dict[str, Any]:
+        """Envia um arquivo local sem verificar o bucket (usado por upload_file e upload_many)."""
+        if codec is not None:
+            # Tamanho e MD5 do original nos metadados: permitem reconhecer uma cópia local
+            # descomprimida inalterada (download_prefix/sync) sem baixar o objeto
+            original_md5 = _file_md5(file_path)[0].hex()
+            with open(file_path, "rb") as f:
+                return self._put_compressed(
+                    f, object_name, bucket_name, content_type, codec, DEFAULT_PART_SIZE,
+                    original_size=file_path.stat().st_size, original_md5=original_md5
+                )
+        
+        file_size = file_path.stat().st_size
+        
+        if file_size > DEFAULT_PART_SIZE:
+            result = self._put_file_multipart(file_path, file_size, object_name, bucket_name, content_type, resume)
+        else:
+            result = self._call(
+                self.client.fput_object,
                 bucket_name=bucket_name,
                 object_name=object_name,
                 file_path=str(file_path),
                 content_type=content_type
             )
+        
+        logger.info(f"Upload concluído: {object_name} ({file_size:,} bytes)")
+        
+        return {
+            "bucket": bucket_name,
+            "object_name": object_name,
+            "size": file_size,
+            "etag": result.etag,
+            "uploaded_at": datetime.now().isoformat()
+        }
+
+    def _put_file_multipart(self, file_path: Path, file_size: int, object_name: str,
+                            bucket_name: str, content_type: Optional[str] = None, resume: bool = False):
+        """
+        Envia um arquivo grande em partes, repetindo só as partes que falharem.
+        
+        Uploads pendentes do mesmo objeto com mais de STALE_MULTIPART_AGE
+        segundos são abortados. Com `resume`, o upload pendente mais recente
+        é retomado: as partes já enviadas cujo tamanho e MD5 coincidem com o
+        arquivo local são reaproveitadas e, em caso de falha, o upload fica
+        pendente para a próxima chamada. Sem `resume`, um upload novo é
+        criado e abortado se falhar.
+        
+        Usa as chamadas de multipart de baixo nível do cliente Minio
+        (_create_multipart_upload, _upload_part, _list_parts, ...).
+        """
+        mib = 1024 * 1024
+        part_size = max(DEFAULT_PART_SIZE, -(-file_size // MAX_MULTIPART_PARTS))
+        part_size = -(-part_size // mib) * mib
+        parts = [
+            (number, offset, min(part_size, file_size - offset))
+            for number, offset in enumerate(range(0, file_size, part_size), start=1)
+        ]
+        
+        pending = self._pending_uploads(bucket_name, object_name)
+        cutoff = time.time() - STALE_MULTIPART_AGE
+        for upload in pending:
+            if upload.initiated_time is not None and upload.initiated_time.timestamp() < cutoff:
+                self._abort_upload(bucket_name, object_name, upload.upload_id)
+        pending = [
+            upload for upload in pending
+            if upload.initiated_time is None or upload.initiated_time.timestamp() >= cutoff
+        ]
+        
+        upload_id = None
+        done: Dict[int, str] = {}
+        if resume and pending:
+            upload = max(pending, key=lambda u: u.initiated_time.timestamp() if u.initiated_time else 0)
+            upload_id = upload.upload_id
+            uploaded = self._list_uploaded_parts(bucket_name, object_name, upload_id)
+            if uploaded:
+                digests = _file_md5(file_path, part_size)
+                for number, _, length in parts:
+                    previous = uploaded.get(number)
+                    if (previous is not None and previous.size == length
+                            and _normalize_etag(previous.etag) == digests[number - 1].hex()):
+                        done[number] = previous.etag
+            logger.info(
+                f"Retomando upload de {object_name}: {len(done)} de {len(parts)} partes já enviadas"
+            )
+        if upload_id is None:
+            upload_id = self._call(
+                self.client._create_multipart_upload, bucket_name, object_name,
+                {"Content-Type": content_type or "application/octet-stream"}
+            )
+        
+        def _upload_part(part):
+            number, offset, length = part
             
-            logger.info(f"Upload concluído: {object_name} ({file_size:,} bytes)")
+            def _send():
+                with open(file_path, "rb") as f:
+                    f.seek(offset)
+                    data = f.read(length)
+                return self.client._upload_part(bucket_name, object_name, data, None, upload_id, number)
             
-            return {
-                "bucket": bucket_name,
-                "object_name": object_name,
-                "size": file_size,
-                "etag": result.etag,
-                "uploaded_at": datetime.now().isoformat()
-            }
+            return number, self._run_with_retry(_send, f"parte {number} de {object_name}")
+        
+        try:
+            results, failures = self._run_concurrently(
+                _upload_part, [part for part in parts if part[0] not in done], MULTIPART_MAX_WORKERS
+            )
+            done.update(results)
+            if failures:
+                (number, _, _), error = failures[0]
+                raise MinIOOperationError(
+                    f"Erro ao fazer upload de '{object_name}': {len(failures)} de {len(parts)} partes "
+                    f"falharam (parte {number}: {error})"
+                    + ("; as partes enviadas serão reaproveitadas na próxima tentativa com resume=True"
+                       if resume else ""),
+                    "upload_file"
+                )
+            
+            return self._complete_upload(
+                bucket_name, object_name, upload_id,
+                [Part(number, done[number]) for number in sorted(done)]
+            )
+        except BaseException:
+            if not resume:
+                self._abort_upload(bucket_name, object_name, upload_id)
+            raise
+
+    def _complete_upload(self, bucket_name: str, object_name: str, upload_id: str, parts: List[Part]):
+        """
+        Conclui um upload multipart.
+        
+        Concluir não é idempotente: se a resposta de uma tentativa bem-sucedida
+        se perder, a nova tentativa recebe NoSuchUpload. Nesse caso o objeto é
+        consultado e, se o etag for o do multipart enviado, o upload é dado
+        como concluído.
+        """
+        try:
+            return self._call(self.client._complete_multipart_upload, bucket_name, object_name, upload_id, parts)
+        except S3Error as e:
+            if e.code != "NoSuchUpload":
+                raise
+            expected = hashlib.md5(
+                b"".join(bytes.fromhex(_normalize_etag(part.etag)) for part in parts)
+            ).hexdigest() + f"-{len(parts)}"
+            try:
+                stat = self._call(self.client.stat_object, bucket_name, object_name)
+            except S3Error:
+                raise e
+            if _normalize_etag(stat.etag) != expected:
+                raise
+            logger.info(f"Upload de {object_name} já estava concluído (resposta anterior perdida)")
+            return stat
+
+    def _abort_upload(self, bucket_name: str, object_name: str, upload_id: str):
+        """Aborta um upload multipart, liberando as partes já armazenadas (melhor esforço)."""
+        try:
+            self._call(self.client._abort_multipart_upload, bucket_name, object_name, upload_id)
+            logger.info(f"Upload multipart de {object_name} abortado ({upload_id})")
+        except S3Error as e:
+            if e.code != "NoSuchUpload":
+                logger.warning(f"Falha ao abortar upload multipart de {object_name} ({upload_id}): {e}")
+
+    def _pending_uploads(self, bucket_name: str, object_name: str) -> list:
+        """Uploads multipart pendentes do objeto (lista vazia se a listagem falhar)."""
+        try:
+            return [
+                upload for upload in self._iter_multipart_uploads(bucket_name, object_name)
+                if upload.object_name == object_name
+            ]
+        except S3Error:
+            return []
+
+    def _iter_multipart_uploads(self, bucket_name: str, prefix: str = "") -> Iterator[Any]:
+        key_marker = upload_id_marker = None
+        while True:
+            listing = self._call(
+                self.client._list_multipart_uploads, bucket_name, prefix=prefix or None,
+                key_marker=key_marker, upload_id_marker=upload_id_marker
+            )
+            yield from listing.uploads
+            next_key = getattr(listing, "next_key_marker", None)
+            if not listing.is_truncated or not listing.uploads or next_key is None:
+                break
+            key_marker = next_key
+            upload_id_marker = getattr(listing, "next_upload_id_marker", None) or listing.uploads[-1].upload_id
+
+    def _list_uploaded_parts(self, bucket_name: str, object_name: str, upload_id: str) -> Dict[int, Part]:
+        parts: Dict[int, Part] = {}
+        marker = None
+        while True:
+            page = self._call(
+                self.client._list_parts, bucket_name, object_name, upload_id,
+                part_number_marker=marker
+            )
+            parts.update((part.part_number, part) for part in page.parts)
+            if not page.is_truncated:
+                break
+            marker = page.next_part_number_marker
+        return parts
+
+    @instrumented("abort_stale_uploads")
+    def abort_stale_uploads(self, bucket_name: str, prefix: str = "",
+                            older_than: float = STALE_MULTIPART_AGE) -> int:
+        """
+        Aborta os uploads multipart pendentes iniciados há mais de `older_than` segundos.
+        
+        Uploads interrompidos (inclusive os mantidos com resume=True) ocupam
+        espaço até serem concluídos ou abortados.
+        
+        Args:
+            bucket_name: Nome do bucket
+            prefix: Prefixo dos objetos (opcional)
+            older_than: Idade mínima em segundos (padrão: 24 h)
+            
+        Returns:
+            Número de uploads abortados
+            
+        Raises:
+            MinIOOperationError: Se falhar ao listar os uploads pendentes
+        """
+        cutoff = time.time() - older_than
+        try:
+            stale = [
+                upload for upload in self._iter_multipart_uploads(bucket_name, prefix)
+                if upload.initiated_time is not None and upload.initiated_time.timestamp() < cutoff
+            ]
+        except S3Error as e:
+            raise MinIOOperationError(f"Erro ao listar uploads pendentes em '{bucket_name}': {e}", "abort_stale_uploads")
+        for upload in stale:
+            self._abort_upload(bucket_name, upload.object_name, upload.upload_id)
+        return len(stale)
+
+    def _put_compressed(self, source: IO[bytes], object_name: str, bucket_name: str,
+                        content_type: Optional[str], codec: str, part_size: int,
+                        original_size: Optional[int] = None, original_md5: Optional[str] = None) -> Dict[str, Any]:
+        """Comprime `source` durante o envio, registrando o codec (e o original) nos metadados."""
+        start = source.tell() if source.seekable() else None
+        reader = None
+        
+        def _send():
+            nonlocal reader
+            # Cada tentativa recomeça a compressão do início da origem
+            if reader is not None:
+                source.seek(start)
+            reader = CompressingReader(source, codec)
+            return self.client.put_object(
+                bucket_name=bucket_name,
+                object_name=object_name,
+                data=reader,
+                length=-1,
+                content_type=content_type or "application/octet-stream",
+                metadata=codec_metadata(codec, original_size, original_md5),
+                part_size=part_size
+            )
+        
+        result = self._run_with_retry(_send, object_name, max_attempts=None if start is not None else 1)
+        
+        ratio = reader.bytes_out / reader.bytes_in if reader.bytes_in else 1.0
+        logger.info(
+            f"Upload concluído: {object_name} ({reader.bytes_in:,} bytes, "
+            f"{reader.bytes_out:,} com {codec}, {ratio:.0%})"
+        )
+        
+        return {
+            "bucket": bucket_name,
+            "object_name": object_name,
+            "size": reader.bytes_out,
+            "original_size": reader.bytes_in,
+            "codec": codec,
+            "etag": result.etag,
+            "uploaded_at": datetime.now().isoformat()
+        }
+
+    def _run_concurrently(self, func: Callable[[Any], Any], items: Iterable[Any],
+                          max_workers: int = DEFAULT_MAX_WORKERS) -> Tuple[List[Any], List[Tuple[Any, Exception]]]:
+        """
+        Executa `func` para cada item em um pool de threads limitado.
+        
+        O mesmo cliente Minio (thread-safe) é compartilhado entre as threads.
+        
+        Returns:
+            Tupla (resultados, falhas), ambos na ordem dos itens de entrada.
+            Cada falha é uma tupla (item, exceção).
+        """
+        items = list(items)
+        if not items:
+            return [], []
+        
+        workers = max(1, min(max_workers, len(items)))
+        outcomes: List[Tuple[Any, Any, Optional[Exception]]] = []
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="minio") as pool:
+            futures = [(item, pool.submit(func, item)) for item in items]
+            for item, future in futures:
+                try:
+                    outcomes.append((item, future.result(), None))
+                except Exception as e:
+                    outcomes.append((item, None, e))
+        
+        results = [result for _, result, error in outcomes if error is None]
+        failures = [(item, error) for item, _, error in outcomes if error is not None]
+        return results, failures
+
+    def upload_many(self, files: Iterable[Tuple[Union[str, Path], str]], bucket_name: str,
+                    content_type: Optional[str] = None,
+                    max_workers: int = DEFAULT_MAX_WORKERS,
+                    codec: Optional[str] = None, resume: bool = False) -> Dict[str, Any]:
+        """
+        Faz upload de vários arquivos em paralelo.
+        
+        O bucket é verificado uma única vez por lote e as transferências rodam
+        em um pool de threads limitado que compartilha o cliente Minio.
+        
+        Args:
+            files: Pares (caminho_local, object_name)
+            bucket_name: Nome do bucket de destino
+            content_type: Tipo MIME aplicado a todos os arquivos (opcional)
+            max_workers: Número máximo de uploads simultâneos (padrão: 8)
+            codec: Codec de compressão aplicado a todos os arquivos (opcional)
+            resume: Se deve retomar uploads multipart pendentes (ver upload_file)
+            
+        Returns:
+            Dicionário com:
+              - uploaded: lista de dicionários no formato de upload_file
+              - failed: lista de {"file_path", "object_name", "error"}
+              - total_bytes, elapsed_seconds, bytes_per_second
+            
+        Raises:
+            MinIOOperationError: Se falhar ao verificar/criar o bucket
+        """
+        pairs = [(Path(path), object_name) for path, object_name in files]
+        if codec is not None:
+            codec = check_codec(codec)
+        
+        self.create_bucket_if_not_exists(bucket_name)
+        
+        def _upload(pair):
+            path, object_name = pair
+            if not path.exists():
+                raise MinIOOperationError(f"Arquivo não encontrado: {path}", "upload_file")
+            return self._put_file(path, object_name, bucket_name, content_type, codec, resume)
+        
+        started = time.perf_counter()
+        uploaded, failures = self._run_concurrently(_upload, pairs, max_workers)
+        elapsed = time.perf_counter() - started
+        
+        failed = [
+            {"file_path": str(path), "object_name": object_name, "error": str(error)}
+            for (path, object_name), error in failures
+        ]
+        for item in failed:
+            logger.warning(f"Falha no upload de {item['object_name']}: {item['error']}")
+        
+        total_bytes = sum(item["size"] for item in uploaded)
+        logger.info(
+            f"Upload em lote concluído: {len(uploaded)} arquivos, {len(failed)} falhas, "
+            f"{total_bytes:,} bytes em {elapsed:.2f}s"
+        )
+        
+        return {
+            "bucket": bucket_name,
+            "uploaded": uploaded,
+            "failed": failed,
+            "total_bytes": total_bytes,
+            "elapsed_seconds": elapsed,
+            "bytes_per_second": total_bytes / elapsed if elapsed > 0 else 0.0
+        }
+
+    def upload_directory(self, directory: Union[str, Path], bucket_name: str, prefix: str = "",
+                         pattern: str = "**/*", content_type: Optional[str] = None,
+                         max_workers: int = DEFAULT_MAX_WORKERS,
+                         codec: Optional[str] = None, resume: bool = False) -> Dict[str, Any]:
+        """
+        Faz upload em paralelo de uma árvore de diretórios local.
+        
+        O nome de cada objeto é `prefix` + caminho relativo ao diretório
+        (sempre com '/').
+        
+        Args:
+            directory: Diretório local de origem
+            bucket_name: Nome do bucket de destino
+            prefix: Prefixo dos objetos no MinIO (opcional)
+            pattern: Padrão glob para selecionar arquivos (padrão: '**/*')
+            content_type: Tipo MIME aplicado a todos os arquivos (opcional)
+            max_workers: Número máximo de uploads simultâneos (padrão: 8)
+            codec: Codec de compressão aplicado a todos os arquivos (opcional)
+            resume: Se deve retomar uploads multipart pendentes (ver upload_file)
+            
+        Returns:
+            Mesmo formato de upload_many
+            
+        Raises:
+            MinIOOperationError: Se o diretório não existir ou falhar ao verificar o bucket
+        """
+        directory = Path(directory)
+        
+        if not directory.is_dir():
+            raise MinIOOperationError(f"Diretório não encontrado: {directory}", "upload_directory")
+        
+        files = [
+            (path, prefix + path.relative_to(directory).as_posix())
+            for path in sorted(directory.glob(pattern))
+            if path.is_file()
+        ]
+        
+        return self.upload_many(files, bucket_name, content_type=content_type,
+                                max_workers=max_workers, codec=codec, resume=resume)
+
+    def upload_data(self, data: Union[bytes, bytearray, memoryview, IO[bytes]], object_name: str,
+                    bucket_name: str, content_type: Optional[str] = None,
+                    length: Optional[int] = None,
+                    part_size: int = DEFAULT_PART_SIZE,
+                    codec: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Faz upload de dados em memória ou de um stream, sem passar pelo disco.
+        
+        Dados maiores que `part_size` são enviados em partes (multipart). Com
+        `codec` os dados são comprimidos durante o envio (ver upload_file).
+        
+        Args:
+            data: Bytes ou stream binário com os dados
+            object_name: Nome do objeto no MinIO
+            bucket_name: Nome do bucket de destino
+            content_type: Tipo MIME dos dados (opcional)
+            length: Tamanho do stream em bytes; se omitido para um stream,
+                    o envio é feito em partes até o fim dos dados
+            part_size: Tamanho de cada parte no multipart (padrão: 16 MiB)
+            codec: Codec de compressão, 'gzip' ou 'zstd' (opcional)
+            
+        Returns:
+            Dicionário com informações do upload (mesmo formato de upload_file)
+            
+        Raises:
+            MinIOConfigError: Se o codec for desconhecido ou indisponível
+            MinIOOperationError: Se falhar ao fazer upload
+        """
+        if codec is not None:
+            codec = check_codec(codec)
+        
+        try:
+            self.create_bucket_if_not_exists(bucket_name)
+            
+            return self._put_data(data, object_name, bucket_name, content_type, length, part_size, codec)
             
         except S3Error as e:
             raise MinIOOperationError(f"Erro ao fazer upload de '{object_name}': {e}", "upload_file")
 
+    @instrumented("upload_file", transfers_bytes=True)
+    def _put_data(self, data: Union[bytes, bytearray, memoryview, IO[bytes]], object_name: str,
+                  bucket_name: str, content_type: Optional[str] = None,
+                  length: Optional[int] = None,
+                  part_size: int = DEFAULT_PART_SIZE,
+                  codec: Optional[str] = None) -> Dict[str, Any]:
+        """Envia dados em memória/stream sem verificar o bucket (usado por upload_data e upload_many_data)."""
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            length = len(data)
+            data = BytesIO(data)
+        
+        if codec is not None:
+            return self._put_compressed(data, object_name, bucket_name, content_type, codec, part_size)
+        
+        if length is None:
+            length = -1
+        
+        # Só streams posicionáveis podem ser reenviados em uma nova tentativa
+        start = data.tell() if data.seekable() else None
+        
+        def _send():
+            if start is not None:
+                data.seek(start)
+            return self.client.put_object(
+                bucket_name=bucket_name,
+                object_name=object_name,
+                data=data,
+                length=length,
+                content_type=content_type or "application/octet-stream",
+                part_size=part_size
+            )
+        
+        result = self._run_with_retry(_send, object_name, max_attempts=None if start is not None else 1)
+        
+        size = length
+        if size < 0:
+            try:
+                size = data.tell()
+            except (AttributeError, OSError):
+                size = None
+        logger.info(f"Upload concluído: {object_name} ({size or 0:,} bytes)")
+        
+        return {
+            "bucket": bucket_name,
+            "object_name": object_name,
+            "size": size,
+            "etag": result.etag,
+            "uploaded_at": datetime.now().isoformat()
+        }
+
+    def upload_many_data(self, objects: Iterable[Tuple[str, Union[bytes, Callable[[], bytes]]]],
+                         bucket_name: str, content_type: Optional[str] = None,
+                         max_workers: int = DEFAULT_MAX_WORKERS,
+                         part_size: int = DEFAULT_PART_SIZE,
+                         codec: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Faz upload em paralelo de vários objetos a partir de dados em memória.
+        
+        Cada item pode trazer os bytes prontos ou uma função que os gera; no
+        segundo caso a serialização roda na própria thread do upload, de modo
+        que só `max_workers` objetos ficam em memória ao mesmo tempo.
+        
+        Args:
+            objects: Pares (object_name, bytes ou função sem argumentos que retorna bytes)
+            bucket_name: Nome do bucket de destino
+            content_type: Tipo MIME aplicado a todos os objetos (opcional)
+            max_workers: Número máximo de uploads simultâneos (padrão: 8)
+            part_size: Tamanho de cada parte no multipart (padrão: 16 MiB)
+            codec: Codec de compressão aplicado a todos os objetos (opcional)
+            
+        Returns:
+            Mesmo formato de upload_many (failed traz "object_name" e "error")
+            
+        Raises:
+            MinIOOperationError: Se falhar ao verificar/criar o bucket
+        """
+        objects = list(objects)
+        if codec is not None:
+            codec = check_codec(codec)
+        
+        self.create_bucket_if_not_exists(bucket_name)
+        
+        def _upload(item):
+            object_name, data = item
+            if callable(data):
+                data = data()
+            return self._put_data(data, object_name, bucket_name, content_type, part_size=part_size, codec=codec)
+        
+        started = time.perf_counter()
+        uploaded, failures = self._run_concurrently(_upload, objects, max_workers)
+        elapsed = time.perf_counter() - started
+        
+        failed = [
+            {"object_name": object_name, "error": str(error)}
+            for (object_name, _), error in failures
+        ]
+        for item in failed:
+            logger.warning(f"Falha no upload de {item['object_name']}: {item['error']}")
+        
+        total_bytes = sum(item["size"] or 0 for item in uploaded)
+        logger.info(
+            f"Upload em lote concluído: {len(uploaded)} objetos, {len(failed)} falhas, "
+            f"{total_bytes:,} bytes em {elapsed:.2f}s"
+        )
+        
+        return {
+            "bucket": bucket_name,
+            "uploaded": uploaded,
+            "failed": failed,
+            "total_bytes": total_bytes,
+            "elapsed_seconds": elapsed,
+            "bytes_per_second": total_bytes / elapsed if elapsed > 0 else 0.0
+        }
+
+    @instrumented("download_file", transfers_bytes=True)
     def download_file(self, bucket_name: str, object_name: str, file_path: Union[str, Path]) -> Dict[str, Any]:
         """
         Baixa um arquivo do MinIO.
         
+        Objetos enviados com `codec` são descomprimidos automaticamente.
+        
         Args:
             bucket_name: Nome do bucket
             object_name: Nome do objeto no MinIO
             file_path: Caminho local de destino
             
         Returns:
-            Dicionário com informações do download
+            Dicionário com informações do download (com codec, "size" é o
+            tamanho armazenado e "local_size" o do arquivo descomprimido)
             
         Raises:
             MinIOOperationError: Se falhar ao baixar o arquivo
@@ -196,26 +990,541 @@ class MinIOManager:
             # Criar diretório pai se não existir
             file_path.parent.mkdir(parents=True, exist_ok=True)
             
-            self.client.fget_object(
+            stat = self._call(
+                self.client.fget_object,
                 bucket_name=bucket_name,
                 object_name=object_name,
                 file_path=str(file_path)
             )
             
             file_size = file_path.stat().st_size
+            codec = codec_from_metadata(stat.metadata)
+            if codec is not None:
+                self._decompress_in_place(file_path, codec)
             logger.info(f"Download concluído: {object_name} ({file_size:,} bytes)")
             
-            return {
+            result = {
                 "bucket": bucket_name,
                 "object_name": object_name,
                 "local_path": str(file_path),
                 "size": file_size,
                 "downloaded_at": datetime.now().isoformat()
             }
+            if codec is not None:
+                result["codec"] = codec
+                result["local_size"] = file_path.stat().st_size
+            return result
             
         except S3Error as e:
             raise MinIOOperationError(f"Erro ao baixar '{object_name}': {e}", "download_file")
 
+    @staticmethod
+    def _decompress_in_place(file_path: Path, codec: str):
+        """Substitui um arquivo baixado comprimido pela sua versão descomprimida."""
+        tmp_path = file_path.with_name(f"{file_path.name}.decompress.minio")
+        try:
+            decompress_file(file_path, tmp_path, codec)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    @instrumented("download_file", transfers_bytes=True)
+    def download_file_parallel(self, bucket_name: str, object_name: str, file_path: Union[str, Path],
+                               chunk_size: int = DEFAULT_CHUNK_SIZE,
+                               max_workers: int = DEFAULT_MAX_WORKERS,
+                               max_retries: int = 3) -> Dict[str, Any]:
+        """
+        Baixa um objeto grande em intervalos de bytes simultâneos.
+        
+        O objeto é dividido em intervalos de `chunk_size` bytes, baixados em
+        paralelo e gravados por posição em um arquivo pré-alocado. Cada
+        intervalo é repetido isoladamente em caso de falha transitória.
+        
+        Args:
+            bucket_name: Nome do bucket
+            object_name: Nome do objeto no MinIO
+            file_path: Caminho local de destino
+            chunk_size: Tamanho de cada intervalo em bytes (padrão: 16 MiB)
+            max_workers: Número máximo de intervalos simultâneos (padrão: 8)
+            max_retries: Novas tentativas por intervalo (padrão: 3)
+            
+        Returns:
+            Dicionário no formato de download_file, mais chunks,
+            elapsed_seconds e bytes_per_second
+            
+        Raises:
+            MinIOOperationError: Se falhar ao baixar algum intervalo
+        """
+        file_path = Path(file_path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = file_path.with_name(f"{file_path.name}.part.minio")
+        
+        size, etag, codec = self._stat_for_download(bucket_name, object_name, "download_file")
+        
+        started = time.perf_counter()
+        try:
+            with open(tmp_path, "wb") as f:
+                f.truncate(size)
+            
+            fd = os.open(tmp_path, os.O_WRONLY | getattr(os, "O_BINARY", 0))
+            try:
+                def _write(offset: int, data: bytes):
+                    if hasattr(os, "pwrite"):
+                        while data:
+                            written = os.pwrite(fd, data, offset)
+                            data = data[written:]
+                            offset += written
+                    else:
+                        with open(tmp_path, "r+b") as handle:
+                            handle.seek(offset)
+                            handle.write(data)
+                
+                chunks = self._download_ranges(
+                    bucket_name, object_name, size, etag, _write,
+                    chunk_size, max_workers, max_retries, "download_file"
+                )
+            finally:
+                os.close(fd)
+            
+            if codec is not None:
+                self._decompress_in_place(tmp_path, codec)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        elapsed = time.perf_counter() - started
+        
+        logger.info(f"Download paralelo concluído: {object_name} ({size:,} bytes em {chunks} intervalos)")
+        
+        result = {
+            "bucket": bucket_name,
+            "object_name": object_name,
+            "local_path": str(file_path),
+            "size": size,
+            "chunks": chunks,
+            "elapsed_seconds": elapsed,
+            "bytes_per_second": size / elapsed if elapsed > 0 else 0.0,
+            "downloaded_at": datetime.now().isoformat()
+        }
+        if codec is not None:
+            result["codec"] = codec
+            result["local_size"] = file_path.stat().st_size
+        return result
+
+    @instrumented("read_object", transfers_bytes=True)
+    def read_object_parallel(self, bucket_name: str, object_name: str,
+                             chunk_size: int = DEFAULT_CHUNK_SIZE,
+                             max_workers: int = DEFAULT_MAX_WORKERS,
+                             max_retries: int = 3) -> Union[bytearray, bytes]:
+        """
+        Lê um objeto grande para a memória em intervalos de bytes simultâneos.
+        
+        Mesmo funcionamento de download_file_parallel, mas os intervalos são
+        gravados em um buffer pré-alocado em vez de um arquivo. Objetos
+        enviados com `codec` são descomprimidos após a leitura.
+        
+        Returns:
+            Buffer com o conteúdo completo (descomprimido) do objeto
+            
+        Raises:
+            MinIOOperationError: Se falhar ao baixar algum intervalo
+        """
+        size, etag, codec = self._stat_for_download(bucket_name, object_name, "read_object")
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        
+        def _write(offset: int, data: bytes):
+            view[offset:offset + len(data)] = data
+        
+        chunks = self._download_ranges(
+            bucket_name, object_name, size, etag, _write,
+            chunk_size, max_workers, max_retries, "read_object"
+        )
+        view.release()
+        
+        logger.info(f"Leitura paralela concluída: {object_name} ({size:,} bytes em {chunks} intervalos)")
+        if codec is not None:
+            return decompress_bytes(buffer, codec)
+        return buffer
+
+    def _stat_for_download(self, bucket_name: str, object_name: str,
+                           operation: str) -> Tuple[int, str, Optional[str]]:
+        """Retorna (tamanho, etag, codec) do objeto para os downloads por intervalos."""
+        try:
+            stat = self._call(self.client.stat_object, bucket_name, object_name)
+        except S3Error as e:
+            raise MinIOOperationError(f"Erro ao baixar '{object_name}': {e}", operation)
+        return stat.size, _normalize_etag(stat.etag), codec_from_metadata(stat.metadata)
+
+    def _download_ranges(self, bucket_name: str, object_name: str, size: int, etag: str,
+                         write: Callable[[int, bytes], None], chunk_size: int,
+                         max_workers: int, max_retries: int, operation: str) -> int:
+        """
+        Baixa os intervalos de um objeto em paralelo, repassando cada bloco
+        recebido para `write(offset, dados)`. Falhas são levantadas com o
+        nome de `operation`, o mesmo das métricas do método chamador.
+        
+        Returns:
+            Número de intervalos baixados
+        """
+        if chunk_size <= 0:
+            raise MinIOOperationError("chunk_size deve ser positivo", operation)
+        
+        ranges = [(offset, min(chunk_size, size - offset)) for offset in range(0, size, chunk_size)]
+        headers = {"If-Match": etag} if etag else None
+        
+        def _fetch(byte_range):
+            offset, length = byte_range
+            
+            def _get():
+                resp = None
+                received = 0
+                try:
+                    resp = self.client.get_object(
+                        bucket_name, object_name,
+                        offset=offset, length=length, request_headers=headers
+                    )
+                    for block in resp.stream(_HASH_CHUNK_SIZE):
+                        write(offset + received, block)
+                        received += len(block)
+                    if received != length:
+                        raise ConnectionError(f"intervalo incompleto ({received} de {length} bytes)")
+                    return length
+                finally:
+                    if resp is not None:
+                        resp.close()
+                        resp.release_conn()
+            
+            return self._run_with_retry(
+                _get, f"intervalo {offset}-{offset + length - 1} de {object_name}",
+                max_attempts=max_retries + 1
+            )
+        
+        _, failures = self._run_concurrently(_fetch, ranges, max_workers)
+        if failures:
+            (offset, length), error = failures[0]
+            raise MinIOOperationError(
+                f"Erro ao baixar '{object_name}' (intervalo {offset}-{offset + length - 1}, "
+                f"{len(failures)} falhas): {error}",
+                operation
+            )
+        return len(ranges)
+
+    def download_prefix(self, bucket_name: str, prefix: str, local_dir: Union[str, Path],
+                        max_workers: int = DEFAULT_MAX_WORKERS,
+                        skip_unchanged: bool = True) -> Dict[str, Any]:
+        """
+        Espelha um prefixo do MinIO em um diretório local, baixando em paralelo.
+        
+        O prefixo é tratado como pasta ('/' é acrescentada ao final se faltar,
+        então "data" não inclui "dataset/") e cada objeto é salvo em
+        `local_dir` com o caminho relativo a ele. Arquivos locais com mesmo tamanho e etag do objeto remoto são
+        ignorados, de modo que restaurações repetidas só transferem as diferenças.
+        Para objetos enviados com `codec` por upload_file/upload_many, a cópia
+        local (descomprimida) é comparada com o tamanho e o MD5 do original
+        gravados nos metadados, consultados com um stat por arquivo local
+        divergente; objetos comprimidos sem esses metadados (upload_data) são
+        sempre baixados.
+        
+        Args:
+            bucket_name: Nome do bucket
+            prefix: Pasta dos objetos a baixar
+            local_dir: Diretório local de destino
+            max_workers: Número máximo de downloads simultâneos (padrão: 8)
+            skip_unchanged: Se deve ignorar arquivos locais idênticos (padrão: True)
+            
+        Returns:
+            Dicionário com:
+              - downloaded: lista de dicionários no formato de download_file
+              - skipped: nomes dos objetos que já estavam atualizados
+              - failed: lista de {"object_name", "local_path", "error"}
+              - total_bytes, skipped_bytes, elapsed_seconds, bytes_per_second
+            
+        Raises:
+            MinIOOperationError: Se falhar ao listar o prefixo
+        """
+        local_dir = Path(local_dir)
+        root = local_dir.resolve()
+        if prefix and not prefix.endswith("/"):
+            prefix += "/"
+        
+        pending = []
+        skipped = []
+        skipped_bytes = 0
+        for obj in self.iter_files(bucket_name, prefix=prefix, recursive=True, as_record=True):
+            relative = obj.name[len(prefix):]
+            if not relative or relative.endswith("/"):
+                continue
+            target = local_dir / relative
+            if relative.startswith("/") or root not in target.resolve().parents:
+                logger.warning(f"Objeto '{obj.name}' ignorado: resolve para fora de {local_dir}")
+                continue
+            
+            if skip_unchanged and self._is_local_copy_current(target, obj.size, obj.etag):
+                skipped.append(obj.name)
+                skipped_bytes += obj.size or 0
+                continue
+            pending.append((obj.name, target, obj.size))
+        
+        if skip_unchanged:
+            current = self._current_compressed_copies(
+                bucket_name, [(name, target) for name, target, _ in pending if target.is_file()], max_workers
+            )
+            skipped.extend(name for name, _, _ in pending if name in current)
+            skipped_bytes += sum(size or 0 for name, _, size in pending if name in current)
+            pending = [item for item in pending if item[0] not in current]
+        pending = [(name, target) for name, target, _ in pending]
+        
+        def _download(item):
+            object_name, target = item
+            if root not in target.resolve().parents:
+                raise MinIOOperationError(
+                    f"Objeto '{object_name}' resolve para fora de {local_dir}", "download_prefix"
+                )
+            return self.download_file(bucket_name, object_name, target)
+        
+        started = time.perf_counter()
+        downloaded, failures = self._run_concurrently(_download, pending, max_workers)
+        elapsed = time.perf_counter() - started
+        
+        failed = [
+            {"object_name": object_name, "local_path": str(target), "error": str(error)}
+            for (object_name, target), error in failures
+        ]
+        for item in failed:
+            logger.warning(f"Falha no download de {item['object_name']}: {item['error']}")
+        
+        total_bytes = sum(item["size"] for item in downloaded)
+        logger.info(
+            f"Download de {bucket_name}/{prefix} concluído: {len(downloaded)} baixados, "
+            f"{len(skipped)} inalterados, {len(failed)} falhas, {total_bytes:,} bytes em {elapsed:.2f}s"
+        )
+        
+        return {
+            "bucket": bucket_name,
+            "prefix": prefix,
+            "local_dir": str(local_dir),
+            "downloaded": downloaded,
+            "skipped": skipped,
+            "failed": failed,
+            "total_bytes": total_bytes,
+            "skipped_bytes": skipped_bytes,
+            "elapsed_seconds": elapsed,
+            "bytes_per_second": total_bytes / elapsed if elapsed > 0 else 0.0
+        }
+
+    def sync(self, local_dir: Union[str, Path], bucket_name: str, prefix: str = "",
+             direction: str = "upload", delete: bool = False, checksum: bool = False,
+             max_workers: int = DEFAULT_MAX_WORKERS, dry_run: bool = False) -> Dict[str, Any]:
+        """
+        Sincroniza incrementalmente um diretório local com um prefixo do MinIO.
+        
+        Arquivos com tamanho diferente são sempre transferidos. Com o mesmo
+        tamanho, o conteúdo (MD5/etag) só é comparado quando a origem é mais
+        nova que o destino, ou sempre com `checksum=True`; se o hash bater,
+        a transferência é evitada. As transferências rodam em paralelo.
+        No download, objetos enviados com `codec` são comparados pelo tamanho
+        e MD5 do original gravados nos metadados (ver download_prefix).
+        
+        Args:
+            local_dir: Diretório local
+            bucket_name: Nome do bucket
+            prefix: Prefixo dos objetos no MinIO (opcional); é tratado como pasta,
+                    com '/' acrescentada ao final se faltar
+            direction: 'upload' (local -> MinIO) ou 'download' (MinIO -> local)
+            delete: Se deve remover do destino o que não existe mais na origem
+            checksum: Se deve comparar o hash mesmo quando a origem não é mais nova
+            max_workers: Número máximo de transferências simultâneas (padrão: 8)
+            dry_run: Se True, apenas calcula o plano, sem transferir nem remover
+            
+        Returns:
+            Dicionário com transferred, bytes_transferred, skipped, bytes_skipped,
+            deleted, failed, elapsed_seconds e dry_run
+            
+        Raises:
+            MinIOOperationError: Se a direção for inválida ou falhar ao listar o prefixo
+        """
+        if direction not in ("upload", "download"):
+            raise MinIOOperationError(f"Direção de sincronização inválida: {direction}", "sync")
+        
+        local_dir = Path(local_dir)
+        if direction == "upload" and not local_dir.is_dir():
+            raise MinIOOperationError(f"Diretório não encontrado: {local_dir}", "sync")
+        root = local_dir.resolve()
+        
+        # "data" e "data/" sincronizam a mesma pasta: sem a barra, as chaves
+        # relativas começariam com "/" (e "data" + "x.txt" viraria "datax.txt")
+        if prefix and not prefix.endswith("/"):
+            prefix += "/"
+        
+        local_files = {
+            path.relative_to(local_dir).as_posix(): path
+            for path in (local_dir.rglob("*") if local_dir.is_dir() else [])
+            if path.is_file() and not path.name.endswith(".part.minio")
+        }
+        # No upload o bucket pode ainda não existir (upload_many o cria)
+        remote_exists = direction == "download" or self.bucket_exists(bucket_name)
+        remote_objects = {}
+        for obj in (self.iter_files(bucket_name, prefix=prefix, recursive=True, as_record=True)
+                    if remote_exists else []):
+            relative = obj.name[len(prefix):]
+            if not relative or relative.endswith("/"):
+                continue
+            if relative.startswith("/") or root not in (root / relative).resolve().parents:
+                logger.warning(f"Objeto '{obj.name}' ignorado: resolve para fora de {local_dir}")
+                continue
+            remote_objects[relative] = obj
+        
+        def _needs_transfer(path: Optional[Path], obj: Optional[ObjectEntry]) -> bool:
+            if path is None or obj is None:
+                return True
+            local_stat = path.stat()
+            if local_stat.st_size != obj.size:
+                return True
+            remote_mtime = obj.last_modified.timestamp() if obj.last_modified else 0
+            source_is_newer = (
+                local_stat.st_mtime > remote_mtime if direction == "upload"
+                else remote_mtime > local_stat.st_mtime
+            )
+            if checksum or source_is_newer:
+                return not _matches_local_etag(path, obj.etag)
+            return False
+        
+        if direction == "upload":
+            sources, targets = local_files, remote_objects
+        else:
+            sources, targets = remote_objects, local_files
+        
+        pending = []
+        skipped = 0
+        bytes_skipped = 0
+        for relative in sorted(sources):
+            path = local_files.get(relative)
+            obj = remote_objects.get(relative)
+            if _needs_transfer(path, obj):
+                pending.append(relative)
+            else:
+                skipped += 1
+                bytes_skipped += obj.size or 0
+        
+        if direction == "download":
+            current = self._current_compressed_copies(
+                bucket_name,
+                [(remote_objects[rel].name, local_files[rel]) for rel in pending if rel in local_files],
+                max_workers
+            )
+            unchanged = [rel for rel in pending if remote_objects[rel].name in current]
+            skipped += len(unchanged)
+            bytes_skipped += sum(remote_objects[rel].size or 0 for rel in unchanged)
+            pending = [rel for rel in pending if remote_objects[rel].name not in current]
+        
+        stale = sorted(set(targets) - set(sources)) if delete else []
+        
+        summary = {
+            "direction": direction,
+            "bucket": bucket_name,
+            "prefix": prefix,
+            "local_dir": str(local_dir),
+            "transferred": 0,
+            "bytes_transferred": 0,
+            "skipped": skipped,
+            "bytes_skipped": bytes_skipped,
+            "deleted": 0,
+            "failed": [],
+            "elapsed_seconds": 0.0,
+            "dry_run": dry_run
+        }
+        
+        if dry_run:
+            summary["transferred"] = len(pending)
+            summary["bytes_transferred"] = sum(
+                (local_files[rel].stat().st_size if direction == "upload" else remote_objects[rel].size or 0)
+                for rel in pending
+            )
+            summary["deleted"] = len(stale)
+            return summary
+        
+        started = time.perf_counter()
+        if direction == "upload":
+            if pending:
+                result = self.upload_many(
+                    [(local_files[rel], prefix + rel) for rel in pending],
+                    bucket_name, max_workers=max_workers
+                )
+                summary["transferred"] = len(result["uploaded"])
+                summary["bytes_transferred"] = result["total_bytes"]
+                summary["failed"] = result["failed"]
+            if stale:
+                summary["deleted"] = self.delete_many(
+                    bucket_name, [prefix + rel for rel in stale], max_workers=max_workers
+                )["deleted"]
+        else:
+            def _download(relative):
+                obj = remote_objects[relative]
+                if root not in (local_dir / relative).resolve().parents:
+                    raise MinIOOperationError(
+                        f"Objeto '{obj.name}' resolve para fora de {local_dir}", "sync"
+                    )
+                result = self.download_file(bucket_name, obj.name, local_dir / relative)
+                if obj.last_modified:
+                    # Mantém o mtime igual ao do servidor para as próximas comparações
+                    mtime = obj.last_modified.timestamp()
+                    os.utime(local_dir / relative, (mtime, mtime))
+                return result
+            
+            downloaded, failures = self._run_concurrently(_download, pending, max_workers)
+            summary["transferred"] = len(downloaded)
+            summary["bytes_transferred"] = sum(item["size"] for item in downloaded)
+            summary["failed"] = [
+                {"object_name": prefix + relative, "local_path": str(local_dir / relative), "error": str(error)}
+                for relative, error in failures
+            ]
+            for relative in stale:
+                local_files[relative].unlink(missing_ok=True)
+            summary["deleted"] = len(stale)
+        summary["elapsed_seconds"] = time.perf_counter() - started
+        
+        logger.info(
+            f"Sincronização ({direction}) {local_dir} <-> {bucket_name}/{prefix}: "
+            f"{summary['transferred']} transferidos ({summary['bytes_transferred']:,} bytes), "
+            f"{skipped} inalterados ({bytes_skipped:,} bytes), {summary['deleted']} removidos, "
+            f"{len(summary['failed'])} falhas"
+        )
+        return summary
+
+    def _current_compressed_copies(self, bucket_name: str, candidates: List[Tuple[str, Path]],
+                                   max_workers: int = DEFAULT_MAX_WORKERS) -> set:
+        """
+        Nomes dos objetos comprimidos cuja cópia local já é igual ao original.
+        
+        O tamanho e o etag da listagem são os do conteúdo comprimido; o
+        tamanho e o MD5 do arquivo original vêm dos metadados gravados no
+        upload. Falhas na consulta contam como cópia desatualizada.
+        """
+        def _check(item):
+            object_name, path = item
+            stat = self._call(self.client.stat_object, bucket_name, object_name)
+            if codec_from_metadata(stat.metadata) is None:
+                return None
+            size, md5 = original_from_metadata(stat.metadata)
+            if size is None or not md5 or path.stat().st_size != size:
+                return None
+            return object_name if _file_md5(path)[0].hex() == md5 else None
+        
+        results, _ = self._run_concurrently(_check, candidates, max_workers)
+        return {name for name in results if name is not None}
+
+    @staticmethod
+    def _is_local_copy_current(file_path: Path, size: Optional[int], etag: Optional[str]) -> bool:
+        """Verifica se o arquivo local tem o mesmo tamanho e etag do objeto remoto."""
+        if not file_path.is_file() or size is None or not etag:
+            return False
+        if file_path.stat().st_size != size:
+            return False
+        return _matches_local_etag(file_path, etag)
+
+    @instrumented("list_files")
     def list_files(self, bucket_name: str, prefix: str = "", recursive: bool = True) -> List[Dict[str, Any]]:
         """
         Lista arquivos em um bucket.
@@ -231,24 +1540,86 @@ class MinIOManager:
         Raises:
             MinIOOperationError: Se falhar ao listar arquivos
         """
+        objects = list(self.iter_files(bucket_name, prefix=prefix, recursive=recursive))
+        
+        logger.info(f"Encontrados {len(objects)} objetos em {bucket_name}/{prefix}")
+        return objects
+
+    def iter_files(self, bucket_name: str, prefix: str = "", recursive: bool = True,
+                   start_after: Optional[str] = None, max_keys: Optional[int] = None,
+                   as_record: bool = False) -> Iterator[Union[Dict[str, Any], ObjectEntry]]:
+        """
+        Lista arquivos em um bucket sob demanda, conforme as páginas chegam do servidor.
+        
+        Ao contrário de list_files, nada é acumulado em memória: o primeiro
+        resultado fica disponível assim que a primeira página é recebida.
+        
+        Args:
+            bucket_name: Nome do bucket
+            prefix: Prefixo para filtrar arquivos (opcional)
+            recursive: Se deve listar recursivamente (padrão: True)
+            start_after: Retoma a listagem após esta chave (opcional)
+            max_keys: Número máximo de objetos retornados (opcional)
+            as_record: Se deve retornar ObjectEntry em vez de dicionários
+            
+        Yields:
+            Dicionários no formato de list_files ou ObjectEntry
+            
+        Raises:
+            MinIOOperationError: Se falhar ao listar arquivos
+        """
+        policy = self.retry_policy
+        remaining = max(0, max_keys) if max_keys is not None else None
+        attempt = 0
         try:
-            objects = []
-            for obj in self.client.list_objects(bucket_name, prefix=prefix, recursive=recursive):
-                objects.append({
-                    "name": obj.object_name,
-                    "size": obj.size,
-                    "last_modified": obj.last_modified.isoformat() if obj.last_modified else None,
-                    "etag": obj.etag,
-                    "content_type": obj.content_type,
-                    "bucket": bucket_name
-                })
-            
-            logger.info(f"Encontrados {len(objects)} objetos em {bucket_name}/{prefix}")
-            return objects
+            while True:
+                objects = self.client.list_objects(
+                    bucket_name, prefix=prefix, recursive=recursive, start_after=start_after
+                )
+                if remaining is not None:
+                    objects = islice(objects, remaining)
+                
+                try:
+                    for obj in objects:
+                        attempt = 0
+                        start_after = obj.object_name
+                        if remaining is not None:
+                            remaining -= 1
+                        yield self._listing_item(obj, bucket_name, as_record)
+                    return
+                except Exception as e:
+                    # Falha transitória no meio da listagem: retoma após a última chave recebida
+                    attempt += 1
+                    if attempt >= policy.max_attempts or not policy.is_retryable(e):
+                        raise
+                    delay = policy.backoff(attempt - 1)
+                    logger.warning(
+                        f"Falha transitória ao listar {bucket_name}/{prefix} "
+                        f"(tentativa {attempt}), retomando após '{start_after or ''}' em {delay:.2f}s: {e}"
+                    )
+                    time.sleep(delay)
             
         except S3Error as e:
             raise MinIOOperationError(f"Erro ao listar arquivos em '{bucket_name}': {e}", "list_files")
 
+    @staticmethod
+    def _listing_item(obj, bucket_name: str, as_record: bool) -> Union[Dict[str, Any], ObjectEntry]:
+        """Converte um objeto da listagem do cliente em dicionário ou ObjectEntry."""
+        if as_record:
+            return ObjectEntry(
+                obj.object_name, obj.size, obj.last_modified,
+                obj.etag, obj.content_type, bucket_name
+            )
+        return {
+            "name": obj.object_name,
+            "size": obj.size,
+            "last_modified": obj.last_modified.isoformat() if obj.last_modified else None,
+            "etag": obj.etag,
+            "content_type": obj.content_type,
+            "bucket": bucket_name
+        }
+
+    @instrumented("delete_file")
     def delete_file(self, bucket_name: str, object_name: str):
         """
         Remove um arquivo do MinIO.
@@ -261,11 +1632,378 @@ class MinIOManager:
             MinIOOperationError: Se falhar ao remover o arquivo
         """
         try:
-            self.client.remove_object(bucket_name, object_name)
+            self._call(self.client.remove_object, bucket_name, object_name)
             logger.info(f"Arquivo removido: {bucket_name}/{object_name}")
         except S3Error as e:
             raise MinIOOperationError(f"Erro ao remover '{object_name}': {e}", "delete_file")
 
+    @instrumented("delete_many")
+    def delete_many(self, bucket_name: str, object_names: Iterable[str],
+                    max_workers: int = DEFAULT_MAX_WORKERS, dry_run: bool = False) -> Dict[str, Any]:
+        """
+        Remove vários arquivos com a remoção múltipla do S3 (até 1000 chaves por requisição).
+        
+        Os lotes são enviados em paralelo.
+        
+        Args:
+            bucket_name: Nome do bucket
+            object_names: Nomes dos objetos a remover
+            max_workers: Número máximo de lotes simultâneos (padrão: 8)
+            dry_run: Se True, apenas conta os objetos, sem remover nada
+            
+        Returns:
+            Dicionário com bucket, deleted (quantidade), batches e dry_run
+            
+        Raises:
+            MinIOOperationError: Se alguma chave não puder ser removida; as
+                falhas individuais ficam em `details`
+        """
+        object_names = list(dict.fromkeys(object_names))
+        batches = [
+            object_names[start:start + DELETE_BATCH_SIZE]
+            for start in range(0, len(object_names), DELETE_BATCH_SIZE)
+        ]
+        
+        if dry_run:
+            logger.info(f"Simulação: {len(object_names)} objetos seriam removidos de {bucket_name}")
+            return {"bucket": bucket_name, "deleted": len(object_names), "batches": len(batches), "dry_run": True}
+        
+        def _delete(batch):
+            # remove_objects é preguiçoso: a requisição só é feita ao consumir o iterador
+            errors = self._run_with_retry(
+                lambda: list(self.client.remove_objects(bucket_name, [DeleteObject(name) for name in batch])),
+                "remove_objects"
+            )
+            return [
+                {"object_name": error.name, "code": error.code, "message": error.message}
+                for error in errors
+            ]
+        
+        results, failures = self._run_concurrently(_delete, batches, max_workers)
+        
+        details = [item for batch_errors in results for item in batch_errors]
+        for batch, error in failures:
+            code = error.code if isinstance(error, S3Error) else type(error).__name__
+            details.extend({"object_name": name, "code": code, "message": str(error)} for name in batch)
+        
+        deleted = len(object_names) - len(details)
+        logger.info(f"Removidos {deleted} objetos de {bucket_name} ({len(batches)} lotes, {len(details)} falhas)")
+        
+        if details:
+            raise MinIOOperationError(
+                f"Falha ao remover {len(details)} de {len(object_names)} objetos em '{bucket_name}'",
+                "delete_many",
+                details=details
+            )
+        
+        return {"bucket": bucket_name, "deleted": deleted, "batches": len(batches), "dry_run": False}
+
+    def delete_prefix(self, bucket_name: str, prefix: str, max_workers: int = DEFAULT_MAX_WORKERS,
+                      dry_run: bool = False) -> Dict[str, Any]:
+        """
+        Remove todos os arquivos sob um prefixo, em lotes paralelos.
+        
+        O prefixo é tratado como pasta: '/' é acrescentada ao final se faltar,
+        então delete_prefix(bucket, "data") não remove "dataset/".
+        
+        Args:
+            bucket_name: Nome do bucket
+            prefix: Pasta dos objetos a remover
+            max_workers: Número máximo de lotes simultâneos (padrão: 8)
+            dry_run: Se True, apenas conta os objetos, sem remover nada
+            
+        Returns:
+            Mesmo formato de delete_many, mais o prefixo
+            
+        Raises:
+            MinIOOperationError: Se falhar ao listar o prefixo ou remover alguma chave
+        """
+        if not prefix:
+            raise MinIOOperationError("Prefixo vazio: use delete_many para remover o bucket inteiro", "delete_prefix")
+        if not prefix.endswith("/"):
+            prefix += "/"
+        
+        names = [obj.name for obj in self.iter_files(bucket_name, prefix=prefix, as_record=True)]
+        result = self.delete_many(bucket_name, names, max_workers=max_workers, dry_run=dry_run)
+        result["prefix"] = prefix
+        return result
+
+    @instrumented("copy_object")
+    def copy_object(self, source_bucket: str, source_object: str, dest_bucket: str,
+                    dest_object: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Copia um objeto no próprio servidor, sem trafegar os dados pelo cliente.
+        
+        Objetos acima de 5 GiB são copiados em partes (UploadPartCopy)
+        automaticamente pelo cliente Minio.
+        
+        Args:
+            source_bucket: Bucket de origem
+            source_object: Objeto de origem
+            dest_bucket: Bucket de destino (precisa existir)
+            dest_object: Objeto de destino (padrão: mesmo nome da origem)
+            
+        Returns:
+            Dicionário com informações da cópia
+            
+        Raises:
+            MinIOOperationError: Se falhar ao copiar
+        """
+        dest_object = dest_object or source_object
+        
+        try:
+            result = self._call(
+                self.client.copy_object,
+                dest_bucket, dest_object, CopySource(source_bucket, source_object)
+            )
+        except (S3Error, ValueError) as e:
+            raise MinIOOperationError(
+                f"Erro ao copiar '{source_bucket}/{source_object}' para '{dest_bucket}/{dest_object}': {e}",
+                "copy_object"
+            )
+        
+        logger.info(f"Cópia concluída: {source_bucket}/{source_object} -> {dest_bucket}/{dest_object}")
+        
+        return {
+            "bucket": dest_bucket,
+            "object_name": dest_object,
+            "source_bucket": source_bucket,
+            "source_object": source_object,
+            "etag": result.etag,
+            "copied_at": datetime.now().isoformat()
+        }
+
+    def move_object(self, source_bucket: str, source_object: str, dest_bucket: str,
+                    dest_object: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Move um objeto no próprio servidor (cópia seguida da remoção da origem).
+        
+        Returns:
+            Dicionário no formato de copy_object
+            
+        Raises:
+            MinIOOperationError: Se falhar ao copiar ou ao remover a origem
+        """
+        result = self.copy_object(source_bucket, source_object, dest_bucket, dest_object)
+        if (source_bucket, source_object) != (dest_bucket, result["object_name"]):
+            self.delete_file(source_bucket, source_object)
+        return result
+
+    def copy_prefix(self, source_bucket: str, source_prefix: str, dest_bucket: str,
+                    dest_prefix: str, max_workers: int = DEFAULT_MAX_WORKERS) -> Dict[str, Any]:
+        """
+        Copia em paralelo todos os objetos de um prefixo para outro, no próprio servidor.
+        
+        O nome de destino é `dest_prefix` + parte do nome após `source_prefix`.
+        
+        Args:
+            source_bucket: Bucket de origem
+            source_prefix: Prefixo de origem
+            dest_bucket: Bucket de destino (criado se não existir)
+            dest_prefix: Prefixo de destino
+            max_workers: Número máximo de cópias simultâneas (padrão: 8)
+            
+        Returns:
+            Dicionário com copied (formato de copy_object), failed
+            ({"object_name", "error"}), total_bytes e elapsed_seconds
+            
+        Raises:
+            MinIOOperationError: Se falhar ao listar a origem ou verificar o bucket de destino
+        """
+        objects = list(self.iter_files(source_bucket, prefix=source_prefix, as_record=True))
+        self.create_bucket_if_not_exists(dest_bucket)
+        
+        def _copy(obj):
+            result = self.copy_object(
+                source_bucket, obj.name, dest_bucket, dest_prefix + obj.name[len(source_prefix):]
+            )
+            result["size"] = obj.size
+            return result
+        
+        started = time.perf_counter()
+        copied, failures = self._run_concurrently(_copy, objects, max_workers)
+        elapsed = time.perf_counter() - started
+        
+        failed = [{"object_name": obj.name, "error": str(error)} for obj, error in failures]
+        for item in failed:
+            logger.warning(f"Falha na cópia de {item['object_name']}: {item['error']}")
+        
+        total_bytes = sum(item["size"] or 0 for item in copied)
+        logger.info(
+            f"Cópia de {source_bucket}/{source_prefix} para {dest_bucket}/{dest_prefix} concluída: "
+            f"{len(copied)} objetos, {len(failed)} falhas, {total_bytes:,} bytes em {elapsed:.2f}s"
+        )
+        
+        return {
+            "bucket": dest_bucket,
+            "prefix": dest_prefix,
+            "copied": copied,
+            "failed": failed,
+            "total_bytes": total_bytes,
+            "elapsed_seconds": elapsed
+        }
+
+    def move_prefix(self, source_bucket: str, source_prefix: str, dest_bucket: str,
+                    dest_prefix: str, max_workers: int = DEFAULT_MAX_WORKERS) -> Dict[str, Any]:
+        """
+        Move em paralelo todos os objetos de um prefixo para outro, no próprio servidor.
+        
+        Só são removidos da origem os objetos copiados com sucesso.
+        
+        Returns:
+            Mesmo formato de copy_prefix, mais deleted
+            
+        Raises:
+            MinIOOperationError: Se falhar ao listar, verificar o bucket ou remover a origem
+        """
+        result = self.copy_prefix(source_bucket, source_prefix, dest_bucket, dest_prefix, max_workers)
+        
+        moved = [
+            item["source_object"] for item in result["copied"]
+            if (source_bucket, item["source_object"]) != (dest_bucket, item["object_name"])
+        ]
+        result["deleted"] = self.delete_many(source_bucket, moved, max_workers=max_workers)["deleted"] if moved else 0
+        return result
+
+    @instrumented("compose_object")
+    def compose(self, bucket_name: str, object_name: str,
+                sources: Iterable[Union[str, Tuple[str, str]]]) -> Dict[str, Any]:
+        """
+        Concatena objetos no próprio servidor em um novo objeto.
+        
+        Pelas regras do S3, todas as partes exceto a última precisam ter
+        pelo menos 5 MiB.
+        
+        Args:
+            bucket_name: Bucket do objeto resultante
+            object_name: Nome do objeto resultante
+            sources: Nomes de objetos no mesmo bucket ou pares (bucket, objeto), em ordem
+            
+        Returns:
+            Dicionário com informações do objeto composto
+            
+        Raises:
+            MinIOOperationError: Se falhar ao compor
+        """
+        compose_sources = [
+            ComposeSource(*source) if isinstance(source, tuple) else ComposeSource(bucket_name, source)
+            for source in sources
+        ]
+        
+        try:
+            result = self._call(self.client.compose_object, bucket_name, object_name, compose_sources)
+        except (S3Error, ValueError) as e:
+            raise MinIOOperationError(f"Erro ao compor '{object_name}': {e}", "compose_object")
+        
+        logger.info(f"Objeto composto: {bucket_name}/{object_name} ({len(compose_sources)} partes)")
+        
+        return {
+            "bucket": bucket_name,
+            "object_name": object_name,
+            "parts": len(compose_sources),
+            "etag": result.etag,
+            "composed_at": datetime.now().isoformat()
+        }
+
+    def iter_query(self, bucket_name: str, object_name: str, expression: str,
+                   input_format: str = "csv", compression: Optional[str] = None,
+                   csv_delimiter: str = ",", csv_header: bool = True,
+                   json_type: str = "LINES",
+                   chunk_rows: int = DEFAULT_QUERY_CHUNK_ROWS) -> Iterator["pd.DataFrame"]:
+        """
+        Executa uma consulta SQL no servidor (S3 Select) e devolve o resultado em DataFrames parciais.
+        
+        Só os registros selecionados trafegam pela rede. No MinIO, consultas
+        em parquet exigem MINIO_API_SELECT_PARQUET=on no servidor.
+        
+        Args:
+            bucket_name: Nome do bucket
+            object_name: Nome do objeto
+            expression: Consulta SQL (ex: "SELECT * FROM s3object s WHERE s.UF = 'SP'")
+            input_format: 'csv', 'json' ou 'parquet' (padrão: 'csv')
+            compression: Compressão do objeto CSV/JSON: 'GZIP' ou 'BZIP2' (opcional)
+            csv_delimiter: Separador de campos do CSV (padrão: ',')
+            csv_header: Se a primeira linha do CSV é o cabeçalho (padrão: True)
+            json_type: 'LINES' (um JSON por linha) ou 'DOCUMENT' (padrão: 'LINES')
+            chunk_rows: Registros por DataFrame parcial (padrão: 50.000)
+            
+        Yields:
+            DataFrames com até `chunk_rows` registros
+            
+        Raises:
+            MinIOOperationError: Se o formato for inválido ou a consulta falhar
+        """
+        import pandas as pd
+        
+        input_format = input_format.lower()
+        if input_format == "csv":
+            input_serialization = CSVInputSerialization(
+                compression_type=compression,
+                field_delimiter=csv_delimiter,
+                file_header_info="USE" if csv_header else "NONE"
+            )
+        elif input_format == "json":
+            input_serialization = JSONInputSerialization(compression_type=compression, json_type=json_type)
+        elif input_format == "parquet":
+            input_serialization = ParquetInputSerialization()
+        else:
+            raise MinIOOperationError(f"Formato de entrada inválido: {input_format}", "query_object")
+        
+        request = SelectRequest(
+            expression, input_serialization, JSONOutputSerialization(record_delimiter="\n")
+        )
+        
+        reader = None
+        try:
+            reader = self.client.select_object_content(bucket_name, object_name, request)
+            
+            records: List[Dict[str, Any]] = []
+            pending = b""
+            for payload in reader.stream():
+                lines = (pending + payload).split(b"\n")
+                pending = lines.pop()
+                records.extend(json.loads(line) for line in lines if line.strip())
+                while len(records) >= chunk_rows:
+                    yield pd.DataFrame.from_records(records[:chunk_rows])
+                    records = records[chunk_rows:]
+            
+            if pending.strip():
+                records.append(json.loads(pending))
+            if records:
+                yield pd.DataFrame.from_records(records)
+            
+            stats = reader.stats()
+            if stats is not None:
+                logger.info(
+                    f"Consulta em {bucket_name}/{object_name}: {int(stats.bytes_scanned or 0):,} bytes "
+                    f"lidos no servidor, {int(stats.bytes_returned or 0):,} bytes retornados"
+                )
+        except (S3Error, ValueError) as e:
+            raise MinIOOperationError(f"Erro ao consultar '{object_name}': {e}", "query_object")
+        finally:
+            if reader is not None:
+                reader.close()
+
+    @instrumented("query_object")
+    def query_object(self, bucket_name: str, object_name: str, expression: str,
+                     input_format: str = "csv", **kwargs) -> "pd.DataFrame":
+        """
+        Executa uma consulta SQL no servidor (S3 Select) e retorna o resultado como DataFrame.
+        
+        Aceita os mesmos argumentos de iter_query; o resultado é montado a
+        partir dos DataFrames parciais recebidos.
+        
+        Raises:
+            MinIOOperationError: Se o formato for inválido ou a consulta falhar
+        """
+        import pandas as pd
+        
+        chunks = list(self.iter_query(bucket_name, object_name, expression, input_format, **kwargs))
+        if not chunks:
+            return pd.DataFrame()
+        return pd.concat(chunks, ignore_index=True)
+
+    @instrumented("get_file_info")
     def get_file_info(self, bucket_name: str, object_name: str) -> Dict[str, Any]:
         """
         Obtém informações de um arquivo no MinIO.
@@ -281,7 +2019,7 @@ class MinIOManager:
             MinIOOperationError: Se falhar ao obter informações
         """
         try:
-            stat = self.client.stat_object(bucket_name, object_name)
+            stat = self._call(self.client.stat_object, bucket_name, object_name)
             return {
                 "name": stat.object_name,
                 "size": stat.size,
@@ -294,6 +2032,39 @@ class MinIOManager:
         except S3Error as e:
             raise MinIOOperationError(f"Erro ao obter info de '{object_name}': {e}", "get_file_info")
 
+    @instrumented("open_object")
+    def open_object(self, bucket_name: str, object_name: str) -> RangedObjectReader:
+        """
+        Abre um objeto como arquivo posicionável, lido sob demanda com GETs de Range.
+        
+        Útil para formatos como parquet, em que só o rodapé e alguns trechos
+        do arquivo precisam ser lidos. Objetos comprimidos não podem ser lidos
+        por trechos: nesse caso `reader.codec` vem preenchido e o conteúdo
+        deve ser lido inteiro (reader.read()) e descomprimido.
+        
+        Args:
+            bucket_name: Nome do bucket
+            object_name: Nome do objeto
+            
+        Returns:
+            RangedObjectReader posicionado no início do objeto
+            
+        Raises:
+            MinIOOperationError: Se falhar ao obter informações do objeto
+        """
+        try:
+            stat = self._call(self.client.stat_object, bucket_name, object_name)
+        except S3Error as e:
+            raise MinIOOperationError(f"Erro ao abrir '{object_name}': {e}", "open_object")
+        
+        return RangedObjectReader(
+            self.client, bucket_name, object_name,
+            size=stat.size, etag=_normalize_etag(stat.etag) or None,
+            codec=codec_from_metadata(stat.metadata),
+            retry_policy=self.retry_policy, limiter=self.limiter
+        )
+
+    @instrumented("generate_upload_url")
     def generate_presigned_upload_url(self, bucket_name: str, object_name: str, 
                                     expires_hours: int = 1) -> str:
         """
@@ -321,6 +2092,7 @@ class MinIOManager:
         except S3Error as e:
             raise MinIOOperationError(f"Erro ao gerar URL de upload: {e}", "generate_upload_url")
 
+    @instrumented("generate_download_url")
     def generate_presigned_download_url(self, bucket_name: str, object_name: str,
                                       expires_hours: int = 1) -> str:
         """
@@ -348,6 +2120,64 @@ class MinIOManager:
         except S3Error as e:
             raise MinIOOperationError(f"Erro ao gerar URL de download: {e}", "generate_download_url")
 
+    @instrumented("generate_urls")
+    def generate_presigned_urls(self, bucket_name: str, object_names: Iterable[str],
+                                method: str = "GET", expires_hours: float = 1,
+                                use_cache: bool = False) -> Dict[str, str]:
+        """
+        Gera URLs pré-assinadas para vários objetos de um bucket em uma chamada.
+        
+        A região do bucket é resolvida uma vez (e fica em cache no cliente), a
+        chave de assinatura é derivada uma vez e todas as URLs são assinadas
+        localmente, sem requisições por objeto. Com `use_cache=True`, URLs
+        geradas antes são reaproveitadas enquanto faltar mais de
+        `presigned_url_cache.reuse_margin` segundos (padrão: 5 min) para
+        expirarem; nesse caso a validade restante pode ser menor que
+        `expires_hours`.
+        
+        Args:
+            bucket_name: Nome do bucket
+            object_names: Nomes dos objetos
+            method: Método HTTP das URLs: 'GET' (download) ou 'PUT' (upload)
+            expires_hours: Horas até expirar (padrão: 1; máximo: 7 dias)
+            use_cache: Se deve reaproveitar URLs ainda válidas (padrão: False)
+            
+        Returns:
+            Dicionário object_name -> URL, na ordem de `object_names`
+            
+        Raises:
+            MinIOOperationError: Se falhar ao resolver a região ou algum nome for inválido
+        """
+        object_names = list(dict.fromkeys(object_names))
+        method = method.upper()
+        expires = int(timedelta(hours=expires_hours).total_seconds())
+        
+        cache = None
+        if use_cache:
+            if self.presigned_url_cache is None:
+                self.presigned_url_cache = PresignedUrlCache()
+            cache = self.presigned_url_cache
+        
+        urls = cache.get_many(method, bucket_name, object_names) if cache is not None else {}
+        missing = [name for name in object_names if name not in urls]
+        
+        if missing:
+            signed_at = time.time()
+            try:
+                signed = dict(zip(missing, presign_many(self.client, method, bucket_name, missing, expires)))
+            except (S3Error, ValueError) as e:
+                raise MinIOOperationError(f"Erro ao gerar URLs em {bucket_name}: {e}", "generate_urls")
+            if cache is not None:
+                cache.put_many(method, bucket_name, signed, signed_at + expires)
+            urls.update(signed)
+        
+        logger.info(
+            f"URLs geradas para {bucket_name}: {len(missing)} assinadas, "
+            f"{len(object_names) - len(missing)} reaproveitadas"
+        )
+        return {name: urls[name] for name in object_names}
+
+    @instrumented("bucket_exists")
     def bucket_exists(self, bucket_name: str) -> bool:
         """
         Verifica se um bucket existe.
@@ -362,7 +2192,7 @@ class MinIOManager:
             MinIOOperationError: Se falhar ao verificar bucket
         """
         try:
-            return self.client.bucket_exists(bucket_name)
+            return self._call(self.client.bucket_exists, bucket_name)
         except S3Error as e:
             raise MinIOOperationError(f"Erro ao verificar bucket '{bucket_name}': {e}", "bucket_exists")
 
@@ -0,0 +1,189 @@
+"""
+Codecs de compressão transparente para uploads e downloads.
+
+Os dados são comprimidos enquanto são enviados (sem arquivo intermediário)
+e o codec usado fica registrado nos metadados do objeto
+(x-amz-meta-modulos-codec), para que os downloads e leituras descomprimam
+automaticamente. Nos uploads de arquivos também são gravados o tamanho e o
+MD5 do original, usados para não baixar de novo cópias locais inalteradas.
+Codecs suportados: 'gzip' (biblioteca padrão) e 'zstd' (requer o pacote
+opcional `zstandard`).
+"""
+
+import io
+import shutil
+import zlib
+from pathlib import Path
+from typing import IO, Mapping, Optional, Tuple, Union
+
+try:
+    import zstandard as zstd
+    _HAS_ZSTD = True
+except ImportError:
+    _HAS_ZSTD = False
+
+from .exceptions import MinIOConfigError
+
+# Nomes dos metadados (sem o prefixo x-amz-meta-) gravados nos objetos comprimidos.
+# O prefixo "modulos-" evita confundir com um "codec" gravado por outros sistemas
+# (ex: vídeos com codec=h264)
+CODEC_METADATA_KEY = "modulos-codec"
+ORIGINAL_SIZE_METADATA_KEY = "modulos-original-size"
+ORIGINAL_MD5_METADATA_KEY = "modulos-original-md5"
+
+SUPPORTED_CODECS = ("gzip", "zstd")
+
+# Tamanho dos blocos lidos da origem ao comprimir/descomprimir
+_STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+def check_codec(codec: str) -> str:
+    """
+    Valida o nome do codec e a disponibilidade da biblioteca necessária.
+
+    Raises:
+        MinIOConfigError: Se o codec for desconhecido ou indisponível
+    """
+    codec = codec.lower()
+    if codec not in SUPPORTED_CODECS:
+        raise MinIOConfigError(f"Codec de compressão desconhecido: {codec} (use {', '.join(SUPPORTED_CODECS)})")
+    if codec == "zstd" and not _HAS_ZSTD:
+        raise MinIOConfigError("Codec 'zstd' requer o pacote 'zstandard' (pip install zstandard)")
+    return codec
+
+
+def codec_metadata(codec: str, original_size: Optional[int] = None,
+                   original_md5: Optional[str] = None) -> dict:
+    """Metadados a gravar no objeto para registrar o codec (e o original, se conhecido)."""
+    metadata = {CODEC_METADATA_KEY: codec}
+    if original_size is not None:
+        metadata[ORIGINAL_SIZE_METADATA_KEY] = str(original_size)
+    if original_md5:
+        metadata[ORIGINAL_MD5_METADATA_KEY] = original_md5
+    return metadata
+
+
+def _metadata_value(metadata: Optional[Mapping[str, str]], name: str) -> Optional[str]:
+    if not metadata:
+        return None
+    wanted = f"x-amz-meta-{name}"
+    for key, value in metadata.items():
+        if key.lower() in (wanted, name):
+            return value
+    return None
+
+
+def codec_from_metadata(metadata: Optional[Mapping[str, str]]) -> Optional[str]:
+    """
+    Extrai o codec dos metadados/cabeçalhos de um objeto.
+
+    Retorna None se o objeto não foi comprimido por este módulo, inclusive
+    quando o valor gravado não é um codec suportado.
+    """
+    value = (_metadata_value(metadata, CODEC_METADATA_KEY) or "").lower()
+    return value if value in SUPPORTED_CODECS else None
+
+
+def original_from_metadata(metadata: Optional[Mapping[str, str]]) -> Tuple[Optional[int], Optional[str]]:
+    """Tamanho e MD5 (hex) do conteúdo original de um objeto comprimido, se registrados."""
+    size = _metadata_value(metadata, ORIGINAL_SIZE_METADATA_KEY)
+    md5 = _metadata_value(metadata, ORIGINAL_MD5_METADATA_KEY)
+    return (int(size) if size and size.isdigit() else None), (md5.lower() if md5 else None)
+
+
+class CompressingReader(io.RawIOBase):
+    """
+    Stream de leitura que entrega os dados de `source` já comprimidos.
+
+    Usado como `data` do put_object (com length=-1), comprime enquanto o
+    cliente envia as partes do multipart.
+    """
+
+    def __init__(self, source: IO[bytes], codec: str, level: Optional[int] = None):
+        super().__init__()
+        self.source = source
+        self.codec = check_codec(codec)
+        if self.codec == "gzip":
+            self._compressor = zlib.compressobj(level if level is not None else 6, zlib.DEFLATED, 31)
+        else:
+            self._compressor = zstd.ZstdCompressor(level=level if level is not None else 3).compressobj()
+        self._buffer = bytearray()
+        self._finished = False
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._finished and (size is None or size < 0 or len(self._buffer) < size):
+            chunk = self.source.read(_STREAM_CHUNK_SIZE)
+            if chunk:
+                self.bytes_in += len(chunk)
+                self._buffer += self._compressor.compress(chunk)
+            else:
+                self._buffer += self._compressor.flush()
+                self._finished = True
+
+        if size is None or size < 0:
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        self.bytes_out += len(data)
+        return data
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+def decompressing_reader(source: IO[bytes], codec: str) -> IO[bytes]:
+    """Envolve `source` em um stream que entrega os dados descomprimidos."""
+    codec = check_codec(codec)
+    if codec == "gzip":
+        return io.BufferedReader(_GzipStreamReader(source), buffer_size=_STREAM_CHUNK_SIZE)
+    return zstd.ZstdDecompressor().stream_reader(source, read_across_frames=True)
+
+
+class _GzipStreamReader(io.RawIOBase):
+    """Descompressor gzip em streaming que aceita membros concatenados."""
+
+    def __init__(self, source: IO[bytes]):
+        super().__init__()
+        self.source = source
+        self._decompressor = zlib.decompressobj(31)
+        self._pending = b""
+        self._eof = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending and not self._eof:
+            chunk = self.source.read(_STREAM_CHUNK_SIZE)
+            if not chunk:
+                self._pending = self._decompressor.flush()
+                self._eof = True
+                break
+            self._pending = self._decompressor.decompress(chunk)
+            while self._decompressor.eof and self._decompressor.unused_data:
+                rest = self._decompressor.unused_data
+                self._decompressor = zlib.decompressobj(31)
+                self._pending += self._decompressor.decompress(rest)
+
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def decompress_bytes(data: Union[bytes, bytearray, memoryview], codec: str) -> bytes:
+    """Descomprime um conteúdo inteiro em memória."""
+    return decompressing_reader(io.BytesIO(data), codec).read()
+
+
+def decompress_file(source_path: Union[str, Path], dest_path: Union[str, Path], codec: str):
+    """Descomprime `source_path` em `dest_path` em streaming."""
+    with open(source_path, "rb") as src, open(dest_path, "wb") as dst:
+        shutil.copyfileobj(decompressing_reader(src, codec), dst, _STREAM_CHUNK_SIZE)
@@ -19,9 +19,11 @@ class MinIOConfigError(MinIOBaseError):
 class MinIOOperationError(MinIOBaseError):
     """Erro durante operações do MinIO (upload, download, bucket ops, etc)."""
     
-    def __init__(self, message: str, operation: str = None):
+    def __init__(self, message: str, operation: str = None, details: list = None):
         self.message = message
         self.operation = operation
+        # Falhas individuais em operações em lote (ex: [{"object_name", "code", "message"}])
+        self.details = details or []
         super().__init__(self.message)
 
 
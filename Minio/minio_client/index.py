@@ -0,0 +1,312 @@
+"""
+Índice local (SQLite) dos metadados de um bucket.
+
+Guarda chaves, tamanhos, etags e datas de modificação obtidos pelas
+listagens do MinIOManager, para responder localmente perguntas como
+"quais objetos existem para X" ou "o que mudou desde ontem" sem uma
+nova listagem completa no servidor.
+"""
+
+import logging
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from .client import ObjectEntry
+
+logger = logging.getLogger(__name__)
+
+# Quantidade de linhas gravadas por transação durante o refresh
+_WRITE_BATCH_SIZE = 5000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    bucket        TEXT    NOT NULL,
+    name          TEXT    NOT NULL,
+    size          INTEGER,
+    etag          TEXT,
+    last_modified REAL,
+    content_type  TEXT,
+    PRIMARY KEY (bucket, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_objects_modified ON objects (bucket, last_modified);
+CREATE INDEX IF NOT EXISTS idx_objects_size ON objects (bucket, size);
+CREATE TABLE IF NOT EXISTS refreshes (
+    bucket       TEXT NOT NULL,
+    prefix       TEXT NOT NULL,
+    refreshed_at REAL NOT NULL,
+    PRIMARY KEY (bucket, prefix)
+);
+"""
+
+
+def _prefix_upper_bound(prefix: str) -> Optional[str]:
+    """Menor string maior que todas as que começam com `prefix` (None se não houver)."""
+    while prefix:
+        last = ord(prefix[-1])
+        if last < 0x10FFFF:
+            return prefix[:-1] + chr(last + 1)
+        prefix = prefix[:-1]
+    return None
+
+
+def _to_timestamp(value: Optional[Union[datetime, float, int, str]]) -> Optional[float]:
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class BucketIndex:
+    """
+    Índice local de objetos de um ou mais buckets, com atualização incremental.
+
+    Exemplo:
+        index = BucketIndex(manager, "anexos.db")
+        index.refresh("anexos", prefix="2024/")
+        index.find("anexos", glob="*_1.pdf", modified_since=ontem)
+    """
+
+    def __init__(self, manager, db_path: Union[str, Path] = ":memory:"):
+        """
+        Args:
+            manager: MinIOManager usado nas listagens
+            db_path: Arquivo SQLite do índice (padrão: em memória)
+        """
+        self.manager = manager
+        self.db_path = str(db_path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL" if self.db_path != ":memory:" else "PRAGMA journal_mode=MEMORY")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    # ------------------------------------------------------------------
+    # Atualização
+    # ------------------------------------------------------------------
+    def refresh(self, bucket_name: str, prefix: str = "", append_only: bool = False) -> Dict[str, Any]:
+        """
+        Atualiza o índice a partir de uma listagem do prefixo.
+
+        Só linhas novas ou alteradas (etag, tamanho ou data) são gravadas. No
+        modo normal o prefixo é listado inteiro (o S3 não filtra a listagem
+        por data de modificação) e chaves que sumiram do servidor são
+        removidas do índice. Com `append_only=True` a listagem começa após a
+        maior chave já indexada no prefixo (start_after), trazendo só as
+        chaves novas: útil quando as chaves crescem em ordem (ex:
+        particionadas por data) e nunca são sobrescritas. O que mudou desde
+        uma data é respondido localmente por find(modified_since=...).
+
+        Args:
+            bucket_name: Nome do bucket
+            prefix: Prefixo a atualizar (padrão: bucket inteiro)
+            append_only: Se deve listar apenas chaves após a última indexada
+
+        Returns:
+            Dicionário com listed, added, updated, removed e max_last_modified
+
+        Raises:
+            MinIOOperationError: Se falhar ao listar o prefixo
+        """
+        start_after = self._max_name(bucket_name, prefix) if append_only else None
+
+        known = {
+            name: (size, etag, modified)
+            for name, size, etag, modified in self._select(
+                "SELECT name, size, etag, last_modified FROM objects WHERE bucket = ?"
+                + self._prefix_clause(prefix),
+                [bucket_name] + self._prefix_params(prefix)
+            )
+        } if not append_only else {}
+
+        counts = {"listed": 0, "added": 0, "updated": 0, "removed": 0}
+        max_modified = None
+        pending = []
+
+        for obj in self.manager.iter_files(bucket_name, prefix=prefix, start_after=start_after, as_record=True):
+            modified = _to_timestamp(obj.last_modified)
+            row = (obj.size, obj.etag, modified)
+            counts["listed"] += 1
+            if max_modified is None or (modified or 0) > max_modified:
+                max_modified = modified
+
+            previous = known.pop(obj.name, None)
+            if previous == row:
+                continue
+            counts["updated" if previous is not None else "added"] += 1
+            pending.append((bucket_name, obj.name, obj.size, obj.etag, modified, obj.content_type))
+
+            if len(pending) >= _WRITE_BATCH_SIZE:
+                self._upsert(pending)
+                pending = []
+
+        self._upsert(pending)
+
+        if known:
+            counts["removed"] = len(known)
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "DELETE FROM objects WHERE bucket = ? AND name = ?",
+                    [(bucket_name, name) for name in known]
+                )
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO refreshes (bucket, prefix, refreshed_at) VALUES (?, ?, ?) "
+                "ON CONFLICT (bucket, prefix) DO UPDATE SET refreshed_at = excluded.refreshed_at",
+                (bucket_name, prefix, datetime.now(timezone.utc).timestamp())
+            )
+
+        logger.info(
+            f"Índice {bucket_name}/{prefix} atualizado: {counts['listed']} listados, "
+            f"{counts['added']} novos, {counts['updated']} alterados, {counts['removed']} removidos"
+        )
+
+        counts["bucket"] = bucket_name
+        counts["prefix"] = prefix
+        counts["max_last_modified"] = (
+            datetime.fromtimestamp(max_modified, timezone.utc) if max_modified is not None else None
+        )
+        return counts
+
+    def last_refresh(self, bucket_name: str, prefix: str = "") -> Optional[Dict[str, Any]]:
+        """
+        Retorna quando o prefixo foi atualizado e a data de modificação mais
+        recente entre os objetos indexados nele (None se nunca foi atualizado).
+        """
+        rows = self._select(
+            "SELECT refreshed_at FROM refreshes WHERE bucket = ? AND prefix = ?",
+            [bucket_name, prefix]
+        )
+        if not rows:
+            return None
+        refreshed_at = rows[0][0]
+        max_modified = self._select(
+            "SELECT MAX(last_modified) FROM objects WHERE bucket = ?" + self._prefix_clause(prefix),
+            [bucket_name] + self._prefix_params(prefix)
+        )[0][0]
+        return {
+            "refreshed_at": datetime.fromtimestamp(refreshed_at, timezone.utc),
+            "max_last_modified": (
+                datetime.fromtimestamp(max_modified, timezone.utc) if max_modified else None
+            )
+        }
+
+    # ------------------------------------------------------------------
+    # Consultas locais
+    # ------------------------------------------------------------------
+    def find(self, bucket_name: str, prefix: str = "", glob: Optional[str] = None,
+             min_size: Optional[int] = None, max_size: Optional[int] = None,
+             modified_since: Optional[Union[datetime, float, str]] = None,
+             limit: Optional[int] = None) -> List[ObjectEntry]:
+        """
+        Consulta o índice local, sem acessar o servidor.
+
+        Args:
+            bucket_name: Nome do bucket
+            prefix: Prefixo das chaves (opcional)
+            glob: Padrão no estilo glob do SQLite, sensível a maiúsculas
+                  (ex: '2024/*/*.parquet') (opcional)
+            min_size: Tamanho mínimo em bytes (opcional)
+            max_size: Tamanho máximo em bytes (opcional)
+            modified_since: Apenas objetos modificados depois desta data (opcional)
+            limit: Número máximo de resultados (opcional)
+
+        Returns:
+            Lista de ObjectEntry ordenada pelo nome
+        """
+        sql = ("SELECT name, size, last_modified, etag, content_type FROM objects WHERE bucket = ?"
+               + self._prefix_clause(prefix))
+        params: List[Any] = [bucket_name] + self._prefix_params(prefix)
+
+        if glob is not None:
+            sql += " AND name GLOB ?"
+            params.append(glob)
+        if min_size is not None:
+            sql += " AND size >= ?"
+            params.append(min_size)
+        if max_size is not None:
+            sql += " AND size <= ?"
+            params.append(max_size)
+        if modified_since is not None:
+            sql += " AND last_modified > ?"
+            params.append(_to_timestamp(modified_since))
+
+        sql += " ORDER BY name"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        return [
+            ObjectEntry(
+                name, size,
+                datetime.fromtimestamp(modified, timezone.utc) if modified is not None else None,
+                etag, content_type, bucket_name
+            )
+            for name, size, modified, etag, content_type in self._select(sql, params)
+        ]
+
+    def count(self, bucket_name: str, prefix: str = "") -> int:
+        """Retorna quantos objetos do prefixo estão no índice."""
+        return self._select(
+            "SELECT COUNT(*) FROM objects WHERE bucket = ?" + self._prefix_clause(prefix),
+            [bucket_name] + self._prefix_params(prefix)
+        )[0][0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "BucketIndex":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __repr__(self):
+        return f"BucketIndex(db_path={self.db_path})"
+
+    # ------------------------------------------------------------------
+    # Auxiliares
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _prefix_clause(prefix: str) -> str:
+        # Intervalo [prefixo, limite) usa a chave primária em vez de LIKE
+        if not prefix:
+            return ""
+        return " AND name >= ?" + (" AND name < ?" if _prefix_upper_bound(prefix) else "")
+
+    @staticmethod
+    def _prefix_params(prefix: str) -> List[str]:
+        if not prefix:
+            return []
+        upper = _prefix_upper_bound(prefix)
+        return [prefix, upper] if upper else [prefix]
+
+    def _max_name(self, bucket_name: str, prefix: str) -> Optional[str]:
+        rows = self._select(
+            "SELECT MAX(name) FROM objects WHERE bucket = ?" + self._prefix_clause(prefix),
+            [bucket_name] + self._prefix_params(prefix)
+        )
+        return rows[0][0] if rows else None
+
+    def _select(self, sql: str, params: List[Any]) -> List[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def _upsert(self, rows: List[tuple]):
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO objects (bucket, name, size, etag, last_modified, content_type) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
@@ -0,0 +1,260 @@
+"""
+Métricas por operação do MinIOManager.
+
+Contadores, histogramas de latência e de bytes por nome de operação (os
+mesmos de MinIOOperationError.operation), com exportação no formato texto
+do Prometheus e ganchos para tracers externos. Com as métricas desativadas
+(manager.metrics = None) o custo é uma única verificação de atributo.
+"""
+
+import functools
+import threading
+import time
+from bisect import bisect_left
+from contextlib import ExitStack
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Sequence
+
+# Limites (em segundos) dos buckets do histograma de latência
+DEFAULT_LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0
+)
+
+# Limites (em bytes) dos buckets do histograma de tamanho
+DEFAULT_SIZE_BUCKETS = (
+    1024, 16 * 1024, 256 * 1024, 1024 ** 2, 16 * 1024 ** 2, 128 * 1024 ** 2, 1024 ** 3, 10 * 1024 ** 3
+)
+
+
+class _Histogram:
+    """Histograma cumulativo simples (não thread-safe; protegido pelo OperationMetrics)."""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estima o quantil por interpolação linear dentro do bucket."""
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = self.bounds[i - 1] if i > 0 else 0.0
+                upper = self.bounds[i] if i < len(self.bounds) else self.bounds[-1]
+                return lower + (upper - lower) * ((rank - seen) / bucket_count)
+            seen += bucket_count
+        return self.bounds[-1]
+
+
+class _OperationStats:
+    __slots__ = ("calls", "errors", "latency", "size", "bytes")
+
+    def __init__(self, latency_buckets: Sequence[float], size_buckets: Sequence[float]):
+        self.calls = 0
+        self.errors = 0
+        self.latency = _Histogram(latency_buckets)
+        self.size = _Histogram(size_buckets)
+        self.bytes = 0
+
+
+def _result_bytes(result: Any) -> Optional[int]:
+    """Extrai a quantidade de bytes transferidos do retorno de uma operação."""
+    if isinstance(result, (bytes, bytearray, memoryview)):
+        return len(result)
+    if isinstance(result, dict):
+        for key in ("size", "total_bytes"):
+            value = result.get(key)
+            if isinstance(value, int):
+                return value
+    return None
+
+
+class OperationMetrics:
+    """
+    Coletor de métricas por operação.
+
+    Exemplo:
+        metrics = OperationMetrics()
+        manager = MinIOManager(..., metrics=metrics)
+        ...
+        metrics.snapshot()["get_file_info"]["latency_p95"]
+        print(metrics.to_prometheus())
+    """
+
+    def __init__(self, latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+                 size_buckets: Sequence[float] = DEFAULT_SIZE_BUCKETS,
+                 namespace: str = "minio"):
+        """
+        Args:
+            latency_buckets: Limites do histograma de latência, em segundos
+            size_buckets: Limites do histograma de tamanho, em bytes
+            namespace: Prefixo dos nomes das métricas no Prometheus
+        """
+        self.latency_buckets = tuple(sorted(latency_buckets))
+        self.size_buckets = tuple(sorted(size_buckets))
+        self.namespace = namespace
+        self._operations: Dict[str, _OperationStats] = {}
+        self._lock = threading.Lock()
+        self._span_hooks: List[Callable[[str], ContextManager]] = []
+        self._listeners: List[Callable[[str, float, Optional[int], Optional[BaseException]], None]] = []
+
+    # ------------------------------------------------------------------
+    # Ganchos
+    # ------------------------------------------------------------------
+    def add_span_hook(self, hook: Callable[[str], ContextManager]):
+        """
+        Registra uma fábrica de spans, chamada com o nome da operação e
+        usada como context manager em volta da chamada (ex:
+        `lambda op: tracer.start_as_current_span(f"minio.{op}")`).
+        """
+        self._span_hooks.append(hook)
+
+    def add_listener(self, listener: Callable[[str, float, Optional[int], Optional[BaseException]], None]):
+        """Registra uma função chamada após cada operação com (operação, segundos, bytes, erro)."""
+        self._listeners.append(listener)
+
+    # ------------------------------------------------------------------
+    # Coleta
+    # ------------------------------------------------------------------
+    def measure(self, operation: str, func: Callable[..., Any], *args,
+                transfers_bytes: bool = False, **kwargs) -> Any:
+        """
+        Executa `func` medindo latência e erros sob o nome `operation`.
+
+        Com `transfers_bytes=True` o tamanho retornado pela operação (bytes,
+        ou "size"/"total_bytes" de um dicionário) entra nas métricas de bytes.
+        """
+        with ExitStack() as stack:
+            for hook in self._span_hooks:
+                stack.enter_context(hook(operation))
+
+            started = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as e:
+                self.observe(operation, time.perf_counter() - started, error=e)
+                raise
+            nbytes = _result_bytes(result) if transfers_bytes else None
+            self.observe(operation, time.perf_counter() - started, nbytes)
+            return result
+
+    def observe(self, operation: str, seconds: float, nbytes: Optional[int] = None,
+                error: Optional[BaseException] = None):
+        """Registra uma execução de `operation`."""
+        with self._lock:
+            stats = self._operations.get(operation)
+            if stats is None:
+                stats = self._operations[operation] = _OperationStats(self.latency_buckets, self.size_buckets)
+            stats.calls += 1
+            stats.latency.observe(seconds)
+            if error is not None:
+                stats.errors += 1
+            elif nbytes is not None:
+                stats.size.observe(nbytes)
+                stats.bytes += nbytes
+
+        for listener in self._listeners:
+            listener(operation, seconds, nbytes, error)
+
+    def reset(self):
+        with self._lock:
+            self._operations.clear()
+
+    # ------------------------------------------------------------------
+    # Exportação
+    # ------------------------------------------------------------------
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Retorna um resumo por operação: calls, errors, error_rate, bytes,
+        latency_avg/p50/p95/p99 (segundos) e bytes_per_second.
+        """
+        with self._lock:
+            result = {}
+            for operation, stats in sorted(self._operations.items()):
+                latency = stats.latency
+                result[operation] = {
+                    "calls": stats.calls,
+                    "errors": stats.errors,
+                    "error_rate": stats.errors / stats.calls if stats.calls else 0.0,
+                    "bytes": stats.bytes,
+                    "latency_avg": latency.sum / latency.count if latency.count else None,
+                    "latency_p50": latency.quantile(0.50),
+                    "latency_p95": latency.quantile(0.95),
+                    "latency_p99": latency.quantile(0.99),
+                    "bytes_per_second": stats.bytes / latency.sum if latency.sum > 0 else 0.0
+                }
+            return result
+
+    def to_prometheus(self) -> str:
+        """Exporta as métricas no formato texto de exposição do Prometheus."""
+        ns = self.namespace
+        lines = [
+            f"# HELP {ns}_operation_calls_total Chamadas por operação.",
+            f"# TYPE {ns}_operation_calls_total counter",
+        ]
+        with self._lock:
+            operations = sorted(self._operations.items())
+
+            for operation, stats in operations:
+                lines.append(f'{ns}_operation_calls_total{{operation="{operation}"}} {stats.calls}')
+
+            lines += [
+                f"# HELP {ns}_operation_errors_total Erros por operação.",
+                f"# TYPE {ns}_operation_errors_total counter",
+            ]
+            for operation, stats in operations:
+                lines.append(f'{ns}_operation_errors_total{{operation="{operation}"}} {stats.errors}')
+
+            lines += [
+                f"# HELP {ns}_operation_bytes_total Bytes transferidos por operação.",
+                f"# TYPE {ns}_operation_bytes_total counter",
+            ]
+            for operation, stats in operations:
+                lines.append(f'{ns}_operation_bytes_total{{operation="{operation}"}} {stats.bytes}')
+
+            for metric, attr, help_text in (
+                ("operation_duration_seconds", "latency", "Latência por operação, em segundos."),
+                ("operation_size_bytes", "size", "Tamanho transferido por chamada, em bytes."),
+            ):
+                lines += [f"# HELP {ns}_{metric} {help_text}", f"# TYPE {ns}_{metric} histogram"]
+                for operation, stats in operations:
+                    histogram = getattr(stats, attr)
+                    cumulative = 0
+                    for bound, count in zip(histogram.bounds, histogram.counts):
+                        cumulative += count
+                        lines.append(
+                            f'{ns}_{metric}_bucket{{operation="{operation}",le="{bound:g}"}} {cumulative}'
+                        )
+                    lines.append(f'{ns}_{metric}_bucket{{operation="{operation}",le="+Inf"}} {histogram.count}')
+                    lines.append(f'{ns}_{metric}_sum{{operation="{operation}"}} {histogram.sum:g}')
+                    lines.append(f'{ns}_{metric}_count{{operation="{operation}"}} {histogram.count}')
+
+        return "\n".join(lines) + "\n"
+
+
+def instrumented(operation: str, transfers_bytes: bool = False):
+    """
+    Decorador de métodos do MinIOManager: mede a chamada em `self.metrics`
+    sob o nome `operation`, ou chama o método diretamente se as métricas
+    estiverem desativadas. `transfers_bytes` marca operações que movem
+    dados pela rede (uploads e downloads).
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            metrics = self.metrics
+            if metrics is None:
+                return func(self, *args, **kwargs)
+            return metrics.measure(operation, func, self, *args, transfers_bytes=transfers_bytes, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,153 @@
+"""
+Geração de URLs pré-assinadas em lote.
+
+O cliente Minio assina uma URL por chamada, consultando a região do bucket
+(que pode exigir uma requisição na primeira vez) e derivando a chave de
+assinatura SigV4 a cada URL. Aqui a região é resolvida uma vez por lote, a
+chave de assinatura é derivada uma vez por (dia, região) e cada URL custa
+só um hash e um HMAC, sem acesso à rede. PresignedUrlCache guarda URLs
+ainda válidas para reaproveitá-las até pouco antes de expirarem.
+"""
+
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlunsplit
+
+from minio import Minio
+from minio.signer import (
+    _get_presign_canonical_request_hash, _get_scope, _get_signature, _get_signing_key, _get_string_to_sign
+)
+from minio.helpers import check_bucket_name, check_object_name, queryencode
+from minio.time import to_signer_date, utcnow
+
+# Validade máxima de uma URL pré-assinada (SigV4): 7 dias
+MAX_PRESIGN_EXPIRES = 7 * 24 * 3600
+
+# Antecedência mínima da expiração para reaproveitar uma URL do cache (5 min)
+DEFAULT_REUSE_MARGIN = 300
+
+_signing_keys: Dict[Tuple[str, str, str], bytes] = {}
+_signing_keys_lock = threading.Lock()
+
+
+def _signing_key(secret_key: str, date: datetime, region: str) -> bytes:
+    """Chave de assinatura SigV4, derivada uma vez por (segredo, dia, região)."""
+    cache_key = (secret_key, to_signer_date(date), region)
+    with _signing_keys_lock:
+        key = _signing_keys.get(cache_key)
+        if key is None:
+            if len(_signing_keys) > 64:
+                _signing_keys.clear()
+            key = _signing_keys[cache_key] = _get_signing_key(secret_key, date, region, "s3")
+    return key
+
+
+def presign_many(client: Minio, method: str, bucket_name: str, object_names: Iterable[str],
+                 expires_seconds: int, request_date: Optional[datetime] = None) -> List[str]:
+    """
+    Assina várias URLs do mesmo bucket com a mesma data e validade.
+
+    Produz as mesmas URLs que client.get_presigned_url, na ordem de
+    `object_names`. Usa a região em cache do cliente (consultada na rede
+    só se ainda não for conhecida) e funções internas de assinatura do
+    minio-py.
+
+    Raises:
+        ValueError: Se a validade ou algum nome for inválido
+    """
+    if not 1 <= expires_seconds <= MAX_PRESIGN_EXPIRES:
+        raise ValueError("A validade deve estar entre 1 segundo e 7 dias")
+    check_bucket_name(bucket_name, s3_check=client._base_url.is_aws_host)
+
+    region = client._get_region(bucket_name)
+    creds = client._provider.retrieve() if client._provider else None
+    date = request_date or utcnow()
+
+    query_params = {}
+    if creds and creds.session_token:
+        query_params["X-Amz-Security-Token"] = creds.session_token
+
+    if creds:
+        scope = _get_scope(date, region, "s3")
+        signing_key = _signing_key(creds.secret_key, date, region)
+
+    urls = []
+    for object_name in object_names:
+        check_object_name(object_name)
+        url = client._base_url.build(
+            method=method, region=region, bucket_name=bucket_name,
+            object_name=object_name, query_params=dict(query_params)
+        )
+        if creds:
+            canonical_hash, url = _get_presign_canonical_request_hash(
+                method=method, url=url, access_key=creds.access_key,
+                scope=scope, date=date, expires=expires_seconds
+            )
+            signature = _get_signature(signing_key, _get_string_to_sign(date, scope, canonical_hash))
+            url = url._replace(query=url.query + "&X-Amz-Signature=" + queryencode(signature))
+        urls.append(urlunsplit(url))
+    return urls
+
+
+class PresignedUrlCache:
+    """
+    Cache de URLs pré-assinadas por (método, bucket, objeto).
+
+    Uma URL é reaproveitada enquanto faltar mais de `reuse_margin`
+    segundos para expirar; depois disso é assinada de novo.
+    """
+
+    def __init__(self, max_entries: int = 100_000, reuse_margin: int = DEFAULT_REUSE_MARGIN):
+        """
+        Args:
+            max_entries: Número máximo de URLs guardadas (padrão: 100.000)
+            reuse_margin: Antecedência mínima da expiração, em segundos, para
+                          reaproveitar uma URL (padrão: 300)
+        """
+        self.max_entries = max_entries
+        self.reuse_margin = reuse_margin
+        self._entries: Dict[Tuple[str, str, str], Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(self, method: str, bucket_name: str,
+                 object_names: Iterable[str]) -> Dict[str, str]:
+        """Retorna as URLs ainda reaproveitáveis dentre `object_names`."""
+        deadline = time.time() + self.reuse_margin
+        found = {}
+        with self._lock:
+            for object_name in object_names:
+                entry = self._entries.get((method, bucket_name, object_name))
+                if entry is not None and entry[1] > deadline:
+                    found[object_name] = entry[0]
+                    self.hits += 1
+                else:
+                    self.misses += 1
+        return found
+
+    def put_many(self, method: str, bucket_name: str, urls: Dict[str, str], expires_at: float):
+        with self._lock:
+            if len(self._entries) + len(urls) > self.max_entries:
+                self._evict(time.time() + self.reuse_margin)
+            for object_name, url in urls.items():
+                self._entries[(method, bucket_name, object_name)] = (url, expires_at)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _evict(self, deadline: float):
+        # Remove as URLs que já não seriam reaproveitadas e, se ainda faltar
+        # espaço, as que expiram primeiro
+        for key in [key for key, (_, expires_at) in self._entries.items() if expires_at <= deadline]:
+            del self._entries[key]
+        excess = len(self._entries) - self.max_entries // 2
+        if excess > 0:
+            for key, _ in sorted(self._entries.items(), key=lambda item: item[1][1])[:excess]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
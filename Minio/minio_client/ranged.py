@@ -0,0 +1,122 @@
+"""
+Leitura posicionável de objetos do MinIO via GETs com Range.
+
+Permite que bibliotecas como o pyarrow leiam apenas os trechos necessários
+de um objeto (ex: rodapé e row groups de um parquet) sem baixá-lo inteiro.
+"""
+
+import io
+from typing import TYPE_CHECKING, Optional
+
+from minio import Minio
+
+if TYPE_CHECKING:
+    from .retry import AdaptiveConcurrencyLimiter, RetryPolicy
+
+
+class RangedObjectReader(io.RawIOBase):
+    """
+    Arquivo somente leitura sobre um objeto do MinIO.
+
+    Cada `read` vira um GET com Range no objeto. Quando o etag é conhecido,
+    as requisições usam If-Match para garantir que todos os trechos lidos
+    pertencem à mesma versão do objeto.
+    """
+
+    def __init__(self, client: Minio, bucket_name: str, object_name: str,
+                 size: int, etag: Optional[str] = None, codec: Optional[str] = None,
+                 retry_policy: Optional["RetryPolicy"] = None,
+                 limiter: Optional["AdaptiveConcurrencyLimiter"] = None):
+        """
+        Args:
+            client: Cliente Minio usado nas requisições
+            bucket_name: Nome do bucket
+            object_name: Nome do objeto
+            size: Tamanho do objeto em bytes
+            etag: Etag do objeto (opcional)
+            codec: Codec de compressão registrado no objeto (opcional)
+            retry_policy: Política de novas tentativas de cada GET (opcional)
+            limiter: Limitador de concorrência compartilhado com o manager (opcional)
+        """
+        super().__init__()
+        self.client = client
+        self.bucket_name = bucket_name
+        self.object_name = object_name
+        self.size = size
+        self.etag = etag
+        self.codec = codec
+        self.retry_policy = retry_policy
+        self.limiter = limiter
+        self._position = 0
+        self.requests = 0
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"whence inválido: {whence}")
+
+        if position < 0:
+            raise ValueError(f"Posição negativa: {position}")
+        self._position = position
+        return position
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self.size - self._position
+        size = min(size, self.size - self._position)
+        if size <= 0:
+            return b""
+
+        data = self.read_range(self._position, size)
+        self._position += len(data)
+        return data
+
+    def readall(self) -> bytes:
+        return self.read(-1)
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def read_range(self, offset: int, length: int) -> bytes:
+        """Lê `length` bytes a partir de `offset` sem alterar a posição atual."""
+        headers = {"If-Match": self.etag} if self.etag else None
+
+        def _get() -> bytes:
+            resp = self.client.get_object(
+                self.bucket_name, self.object_name,
+                offset=offset, length=length, request_headers=headers
+            )
+            try:
+                return resp.read()
+            finally:
+                resp.close()
+                resp.release_conn()
+
+        if self.retry_policy is not None:
+            data = self.retry_policy.run(_get, self.limiter, f"{self.object_name} [{offset}:+{length}]")
+        else:
+            data = _get()
+
+        self.requests += 1
+        self.bytes_read += len(data)
+        return data
+
+    def __repr__(self):
+        return f"RangedObjectReader({self.bucket_name}/{self.object_name}, size={self.size})"
@@ -0,0 +1,193 @@
+"""
+Novas tentativas e controle adaptativo de concorrência para o MinIOManager.
+
+RetryPolicy repete operações idempotentes após falhas transitórias (erros
+5xx, SlowDown, conexões interrompidas), com espera exponencial e jitter.
+AdaptiveConcurrencyLimiter limita as requisições simultâneas e reduz o
+limite pela metade quando o servidor pede para desacelerar (SlowDown/503),
+voltando a aumentá-lo aos poucos enquanto as requisições têm sucesso.
+"""
+
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, FrozenSet, NamedTuple, Optional
+
+import urllib3
+from minio.error import InvalidResponseError, S3Error, ServerError
+
+logger = logging.getLogger(__name__)
+
+# Códigos S3 de falhas transitórias, que valem uma nova tentativa
+RETRYABLE_CODES = frozenset({
+    "SlowDown", "ServiceUnavailable", "InternalError", "RequestTimeout",
+    "OperationAborted", "XMinioServerNotInitialized", "XMinioReadQuorum", "XMinioWriteQuorum",
+})
+
+# Códigos S3 com que o servidor pede para reduzir a taxa de requisições
+THROTTLE_CODES = frozenset({"SlowDown", "ServiceUnavailable", "XMinioServerNotInitialized"})
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    if isinstance(error, ServerError):
+        return error.status_code
+    if isinstance(error, InvalidResponseError):
+        return getattr(error, "_code", None)
+    if isinstance(error, S3Error):
+        response = getattr(error, "response", None)
+        return getattr(response, "status", None)
+    return None
+
+
+class RetryPolicy(NamedTuple):
+    """
+    Política de novas tentativas com espera exponencial e jitter completo.
+
+    A espera antes da tentativa n+1 é um valor aleatório entre 0 e
+    min(max_delay, base_delay * 2**n), o que evita que várias threads
+    repitam as requisições ao mesmo tempo.
+    """
+
+    max_attempts: int = 5
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    retryable_codes: FrozenSet[str] = RETRYABLE_CODES
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """Indica se a falha é transitória."""
+        if isinstance(error, S3Error):
+            return error.code in self.retryable_codes or (_status_code(error) or 0) >= 500
+        if isinstance(error, (ServerError, InvalidResponseError)):
+            return (_status_code(error) or 0) >= 500 or _status_code(error) == 429
+        if isinstance(error, urllib3.exceptions.SSLError):
+            return False
+        return isinstance(error, (urllib3.exceptions.HTTPError, ConnectionError, TimeoutError))
+
+    @staticmethod
+    def is_throttle(error: BaseException) -> bool:
+        """Indica se o servidor pediu para reduzir a taxa (SlowDown/503/429)."""
+        if isinstance(error, S3Error) and error.code in THROTTLE_CODES:
+            return True
+        return _status_code(error) in (429, 503)
+
+    def backoff(self, attempt: int) -> float:
+        """Espera, em segundos, após a tentativa `attempt` (começando em 0)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def run(self, func: Callable[[], Any], limiter: Optional["AdaptiveConcurrencyLimiter"] = None,
+            description: str = "") -> Any:
+        """
+        Executa `func` (sem argumentos), repetindo-a nas falhas transitórias.
+
+        Cada tentativa ocupa uma vaga em `limiter`, quando informado; a espera
+        entre tentativas acontece fora dele.
+        """
+        attempt = 0
+        while True:
+            try:
+                if limiter is None:
+                    return func()
+                with limiter:
+                    try:
+                        result = func()
+                    except BaseException as e:
+                        if self.is_throttle(e):
+                            limiter.on_throttle()
+                        raise
+                    limiter.on_success()
+                    return result
+            except Exception as e:
+                attempt += 1
+                if attempt >= self.max_attempts or not self.is_retryable(e):
+                    raise
+                delay = self.backoff(attempt - 1)
+                logger.warning(
+                    f"Falha transitória{f' em {description}' if description else ''} "
+                    f"(tentativa {attempt} de {self.max_attempts}), nova tentativa em {delay:.2f}s: {e}"
+                )
+                time.sleep(delay)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Limite de requisições simultâneas com aumento aditivo e redução
+    multiplicativa (AIMD).
+
+    Cada sucesso conta para aumentar o limite em 1 a cada `limit` sucessos;
+    um pedido de desaceleração do servidor corta o limite pela metade (no
+    máximo uma vez por `cooldown` segundos, para que uma rajada de 503
+    simultâneos conte como um único evento).
+    """
+
+    def __init__(self, max_limit: int = 64, min_limit: int = 1,
+                 initial_limit: Optional[int] = None, cooldown: float = 1.0):
+        """
+        Args:
+            max_limit: Limite máximo de requisições simultâneas (padrão: 64)
+            min_limit: Limite mínimo (padrão: 1)
+            initial_limit: Limite inicial (padrão: max_limit)
+            cooldown: Intervalo mínimo entre reduções, em segundos (padrão: 1)
+        """
+        if min_limit < 1 or max_limit < min_limit:
+            raise ValueError("Limites inválidos: é preciso 1 <= min_limit <= max_limit")
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.cooldown = cooldown
+        self._limit = max(min_limit, min(initial_limit or max_limit, max_limit))
+        self._in_flight = 0
+        self._successes = 0
+        self._last_decrease = float("-inf")
+        self._condition = threading.Condition()
+        self.throttle_events = 0
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self):
+        with self._condition:
+            while self._in_flight >= self._limit:
+                self._condition.wait()
+            self._in_flight += 1
+
+    def release(self):
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify()
+
+    def __enter__(self) -> "AdaptiveConcurrencyLimiter":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+    def on_success(self):
+        with self._condition:
+            if self._limit >= self.max_limit:
+                return
+            self._successes += 1
+            if self._successes >= self._limit:
+                self._successes = 0
+                self._limit += 1
+                self._condition.notify()
+
+    def on_throttle(self):
+        with self._condition:
+            now = time.monotonic()
+            if now - self._last_decrease < self.cooldown:
+                return
+            self._last_decrease = now
+            self._successes = 0
+            self.throttle_events += 1
+            previous = self._limit
+            self._limit = max(self.min_limit, self._limit // 2)
+        logger.warning(f"Servidor pediu para desacelerar: concorrência reduzida de {previous} para {self._limit}")
+
+    def __repr__(self):
+        return f"AdaptiveConcurrencyLimiter(limit={self._limit}, in_flight={self._in_flight})"
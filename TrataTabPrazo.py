@@ -1,10 +1,253 @@
+import os
+import hashlib
+import tempfile
+import threading
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path, PureWindowsPath
+from typing import NamedTuple
 
-df_aux = pd.read_parquet(PureWindowsPath(r"\\tableau\Central_de_Performance\BI\Local\Bases_Tratadas\Bases_Auxiliares\IBGE.parquet").as_posix())
-columns = df_aux.columns
+# Tabela de municípios do IBGE (pode ser trocada pela variável de ambiente IBGE_PARQUET)
+IBGE_PATH = os.getenv(
+    "IBGE_PARQUET",
+    PureWindowsPath(r"\\tableau\Central_de_Performance\BI\Local\Bases_Tratadas\Bases_Auxiliares\IBGE.parquet").as_posix()
+)
+
+# Pasta da cópia local (Arrow IPC, lida por memory-map) da tabela do IBGE
+IBGE_CACHE_DIR = Path(os.getenv("IBGE_CACHE_DIR", Path(tempfile.gettempdir()) / "trata_prazo"))
+
+# Únicas colunas do IBGE usadas na expansão
+IBGE_COLUNAS = ['UF', 'NOME_MUNICIPIO']
+
+_ibge = None
+_ibge_lock = threading.Lock()
+
+def _copia_local() -> Path:
+    nome = hashlib.sha1(IBGE_PATH.encode("utf-8")).hexdigest()[:16]
+    return IBGE_CACHE_DIR / f"IBGE-{nome}.arrow"
+
+def _assinatura_origem():
+    # mtime + tamanho do parquet de origem (None se o compartilhamento estiver inacessível)
+    try:
+        st = os.stat(IBGE_PATH)
+    except OSError:
+        return None
+    return f"{st.st_mtime_ns}:{st.st_size}".encode()
+
+def _le_copia_local(caminho: Path, assinatura):
+    if not caminho.exists():
+        return None
+    try:
+        with pa.memory_map(str(caminho)) as source:
+            tabela = ipc.open_file(source).read_all()
+    except (OSError, pa.ArrowInvalid):
+        return None
+    if assinatura is not None and (tabela.schema.metadata or {}).get(b"origem") != assinatura:
+        return None
+    return tabela
+
+def _le_origem(assinatura) -> pa.Table:
+    tabela = pq.read_table(IBGE_PATH, columns=IBGE_COLUNAS)
+    tabela = pa.table({
+        coluna: tabela[coluna].combine_chunks().dictionary_encode()
+        for coluna in IBGE_COLUNAS
+    })
+    return tabela.replace_schema_metadata({b"origem": assinatura})
+
+def _grava_copia_local(caminho: Path, tabela: pa.Table):
+    try:
+        caminho.parent.mkdir(parents=True, exist_ok=True)
+        tmp = caminho.with_suffix(f".{os.getpid()}.tmp")
+        with ipc.new_file(str(tmp), tabela.schema) as writer:
+            writer.write_table(tabela)
+        os.replace(tmp, caminho)
+    except OSError:
+        # Sem cópia local: a próxima carga volta a ler a origem
+        pass
+
+def carregaIBGE(recarregar: bool = False) -> pd.DataFrame:
+    """
+    Retorna a tabela UF/NOME_MUNICIPIO do IBGE, carregada só no primeiro uso.
+
+    As colunas ficam como categóricas. A primeira carga grava uma cópia
+    local em IBGE_CACHE_DIR; as seguintes (inclusive em outros processos)
+    leem essa cópia por memory-map enquanto o mtime/tamanho do parquet de
+    origem não mudar. Se a origem estiver inacessível, usa a cópia local.
+    O DataFrame retornado é uma cópia em memória de cada processo (não
+    aponta para o arquivo mapeado).
+    """
+    global _ibge
+    if _ibge is not None and not recarregar:
+        return _ibge
+
+    with _ibge_lock:
+        if _ibge is not None and not recarregar:
+            return _ibge
+
+        caminho = _copia_local()
+        assinatura = _assinatura_origem()
+        tabela = _le_copia_local(caminho, assinatura)
+        if tabela is None:
+            if assinatura is None:
+                raise FileNotFoundError(f"Tabela do IBGE inacessível e sem cópia local: {IBGE_PATH}")
+            tabela = _le_origem(assinatura)
+            _grava_copia_local(caminho, tabela)
+
+        _ibge = tabela.to_pandas()
+        return _ibge
+
+def __getattr__(nome):
+    # Compatibilidade: df_aux e columns eram carregados na importação do módulo
+    if nome == "df_aux":
+        return carregaIBGE()
+    if nome == "columns":
+        return carregaIBGE().columns
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+
+def _ibge_decodificado(df_aux=None) -> pd.DataFrame:
+    # Categóricas de volta ao tipo original, para que o merge preserve os tipos das colunas de df
+    df_aux = carregaIBGE() if df_aux is None else df_aux
+    return df_aux.astype({coluna: df_aux[coluna].cat.categories.dtype for coluna in IBGE_COLUNAS})
+
+class IndiceUF:
+    """
+    Índice UF -> municípios do IBGE, montado uma vez por carga da tabela.
+
+    Os códigos dos municípios ficam agrupados por UF em um único array (na
+    ordem da tabela do IBGE, sem pares UF/município repetidos), com o
+    deslocamento e a quantidade de cada UF. A expansão de uma linha "Todo o
+    Estado" vira um repeat/take sobre esse array, sem merge.
+    """
+
+    def __init__(self, df_aux):
+        self.fonte = df_aux
+        decodificado = _ibge_decodificado(df_aux)[IBGE_COLUNAS]
+        # Uma linha do IBGE, para reproduzir os tipos dos merges da implementação original
+        self.amostra = decodificado.iloc[:1]
+        pares = decodificado.drop_duplicates()
+
+        # NaN vira um valor comum, como nas chaves do merge do pandas
+        codigos_uf, ufs = pd.factorize(pares['UF'], use_na_sentinel=False)
+        codigos_mun, municipios = pd.factorize(pares['NOME_MUNICIPIO'], use_na_sentinel=False)
+        self.ufs = pd.Index(ufs)
+        self.municipios = pd.Index(municipios)
+
+        ordem = np.argsort(codigos_uf, kind='stable')
+        # Sentinela -1 no fim: UFs desconhecidas apontam para ela (cidade nula, como no merge "left")
+        self.municipios_por_uf = np.append(codigos_mun[ordem], -1)
+        self.quantidade = np.bincount(codigos_uf, minlength=len(ufs))
+        self.inicio = np.cumsum(self.quantidade) - self.quantidade
+
+    def expandir(self, valores_uf):
+        """
+        Para cada valor de UF, a posição da linha de origem repetida uma vez
+        por município da UF e o código do município (-1 para UF desconhecida).
+        """
+        codigos = self.ufs.get_indexer(valores_uf)
+        conhecida = codigos >= 0
+        quantidade = np.where(conhecida, self.quantidade[codigos], 1)
+        inicio = np.where(conhecida, self.inicio[codigos], len(self.municipios_por_uf) - 1)
+
+        linhas = np.repeat(np.arange(len(codigos)), quantidade)
+        deslocamento = np.arange(len(linhas)) - np.repeat(np.cumsum(quantidade) - quantidade, quantidade)
+        passo = np.repeat(conhecida, quantidade)
+        posicoes = np.repeat(inicio, quantidade) + np.where(passo, deslocamento, 0)
+        return linhas, self.municipios_por_uf[posicoes]
+
+_indice = None
+
+def indiceUF() -> IndiceUF:
+    # Reconstruído só quando a tabela do IBGE for recarregada
+    global _indice
+    df_aux = carregaIBGE()
+    if _indice is None or _indice.fonte is not df_aux:
+        _indice = IndiceUF(df_aux)
+    return _indice
+
+def _codigos_comuns(a, b):
+    # Códigos inteiros de a e b no mesmo espaço (NaN = NaN, como no merge)
+    codigos, valores = pd.factorize(pd.concat([pd.Series(a), pd.Series(b)], ignore_index=True), use_na_sentinel=False)
+    return codigos[:len(a)], codigos[len(a):], len(valores)
+
+class _Expansao(NamedTuple):
+    estado: pd.DataFrame       # linhas "Todo o Estado" de df, sem repetições
+    posicoes: np.ndarray       # posição de cada linha de `estado` em df
+    linhas: np.ndarray         # linha de `estado` de cada linha expandida
+    codigos_mun: np.ndarray    # código do município (IndiceUF) de cada linha expandida
+    existe: np.ndarray         # se a combinação (ref, UF, cidade) já existe em df
+    tipos: dict                # tipos de ref, UF e cidade no resultado
+
+def _expande(df, colunaCid, colunaUF, ref, indice) -> _Expansao:
+    # Linhas repetidas gerariam expansões repetidas: remover antes de expandir
+    nulas = np.flatnonzero(df[colunaCid].isna().to_numpy())
+    df_estado = df.iloc[nulas]
+    unicas = ~df_estado.duplicated().to_numpy()
+    df_estado = df_estado[unicas].reset_index(drop=True)
+    df_existentes = df[df[colunaCid].notna()]
+
+    linhas, codigos_mun = indice.expandir(df_estado[colunaUF])
+
+    # Chave inteira (ref, UF, cidade) para a diferença com as combinações existentes
+    ref_estado, ref_existentes, n_ref = _codigos_comuns(df_estado[ref], df_existentes[ref])
+    uf_estado, uf_existentes, n_uf = _codigos_comuns(df_estado[colunaUF], df_existentes[colunaUF])
+    cid_municipios, cid_existentes, n_cid = _codigos_comuns(indice.municipios, df_existentes[colunaCid])
+    cid_expandido = np.where(codigos_mun >= 0, cid_municipios[codigos_mun], n_cid)
+
+    base = ref_estado.astype(np.int64) * n_uf + uf_estado
+    chaves = base[linhas] * (n_cid + 1) + cid_expandido
+    chaves_existentes = (ref_existentes.astype(np.int64) * n_uf + uf_existentes) * (n_cid + 1) + cid_existentes
+    existe = pd.Series(chaves).isin(chaves_existentes).to_numpy()
+
+    # Mesmos tipos que os merges da implementação original dariam a ref, UF e cidade
+    # (ex: UF categórica vira object). O pandas só unifica tipos diferentes quando os
+    # dois lados têm linhas: basta uma linha de cada lado não vazio
+    chaves_merge = [ref, colunaUF, colunaCid]
+    amostra = df_estado.iloc[:1].merge(indice.amostra, left_on=colunaUF, right_on='UF', how='left')
+    amostra[colunaCid] = amostra['NOME_MUNICIPIO']
+    tipos = amostra[chaves_merge].merge(df_existentes[chaves_merge].iloc[:1], how='left').dtypes.to_dict()
+
+    return _Expansao(df_estado, nulas[unicas], linhas, codigos_mun, existe, tipos)
+
+def _monta(expansao, colunaCid, mantidas, indice) -> pd.DataFrame:
+    df_expandido = expansao.estado.take(expansao.linhas[mantidas]).reset_index(drop=True)
+    municipios = indice.municipios.take(expansao.codigos_mun[mantidas], allow_fill=True, fill_value=np.nan)
+    df_expandido[colunaCid] = municipios.astype(expansao.tipos[colunaCid])
+    return df_expandido.astype(expansao.tipos)
+
+def _trataPrazoIndice(df, colunaCid, colunaUF, ref, ligacao):
+    indice = indiceUF()
+    expansao = _expande(df, colunaCid, colunaUF, ref, indice)
+
+    if ligacao == 'both':
+        mantidas = expansao.existe
+    elif ligacao == 'left_only':
+        mantidas = ~expansao.existe
+    else:
+        mantidas = np.zeros(len(expansao.linhas), dtype=bool)
+
+    return _monta(expansao, colunaCid, mantidas, indice)
+
+def trataPrazo(df, colunaCid, colunaUF, ref='REFERENCIA_MEDICAO', ligacao='left_only', engine='indice'):
+    """
+    Expande as linhas "Todo o Estado" (cidade nula) para todos os municípios
+    da UF e mantém as combinações (ref, UF, cidade) conforme `ligacao`:
+    'left_only' (ainda não existentes em df) ou 'both' (já existentes).
+
+    engine='indice' usa o IndiceUF (repeat/take e diferença por chaves
+    inteiras); engine='merge' é a implementação original com merges. As
+    duas produzem o mesmo resultado.
+    """
+    if engine == 'indice':
+        return _trataPrazoIndice(df, colunaCid, colunaUF, ref, ligacao)
+
+    df_aux = _ibge_decodificado()
 
-def trataPrazo(df, colunaCid, colunaUF, ref='REFERENCIA_MEDICAO', ligacao='left_only'):
     # Separar linhas com cidade nula (Todo o Estado)
     df_estado = df[df[colunaCid].isna()].copy()
     df_existentes = df[df[colunaCid].notna()][[ref, colunaUF, colunaCid]].drop_duplicates()
@@ -24,19 +267,222 @@ def trataPrazo(df, colunaCid, colunaUF, ref='REFERENCIA_MEDICAO', ligacao='left_
     df_expandido = df_expandido[df_expandido['_merge'].isin([ligacao])].drop(columns=['_merge'])
 
     # Limpeza
-    df_expandido = df_expandido.drop(columns=columns).drop_duplicates().reset_index(drop=True)
+    df_expandido = df_expandido.drop(columns=IBGE_COLUNAS).drop_duplicates().reset_index(drop=True)
 
     return df_expandido
 
-def trata(df):
-    df_paridade = trataPrazo(df, 'COLETA_CIDORIGEM', 'COLETA_UFORIGEM', ligacao='both')
+def _chave(codigos, tamanhos):
+    # Combina códigos inteiros em uma chave int64, recodificando antes de estourar
+    chave = np.zeros(len(codigos[0]), dtype=np.int64)
+    total = 1
+    for codigo, tamanho in zip(codigos, tamanhos):
+        if total * tamanho >= 2 ** 62:
+            chave, unicos = pd.factorize(chave)
+            total = len(unicos)
+        chave = chave * tamanho + codigo
+        total *= tamanho
+    return chave
+
+def _trataIndice(df, ordem=False):
+    indice = indiceUF()
+    ref, inco = 'REFERENCIA_MEDICAO', 'INCOTERMS'
+    cidO, ufO, cidD, ufD = 'COLETA_CIDORIGEM', 'COLETA_UFORIGEM', 'COLETA_CIDDESTINO', 'COLETA_UFDESTINO'
+
+    origem = _expande(df, cidO, ufO, ref, indice)
+    destino = _expande(df, cidD, ufD, ref, indice)
+
+    # Códigos das chaves de deduplicação; as cidades (de df e do IBGE) num espaço só
+    cidades = pd.concat([df[cidO], df[cidD], pd.Series(indice.municipios), pd.Series([np.nan])], ignore_index=True)
+    codigos_cid, valores_cid = pd.factorize(cidades, use_na_sentinel=False)
+    n = len(df)
+    cid_df = {cidO: codigos_cid[:n], cidD: codigos_cid[n:2 * n]}
+    cid_nula = codigos_cid[-1]
+    # Inclui o NaN do fim: o código de município -1 (UF desconhecida) cai na cidade nula
+    cid_municipios = codigos_cid[2 * n:]
+
+    codigos, tamanhos = {}, {}
+    for coluna in (ref, inco, ufO, ufD):
+        codigos[coluna], valores = pd.factorize(df[coluna], use_na_sentinel=False)
+        tamanhos[coluna] = len(valores)
+    tamanhos[cidO] = tamanhos[cidD] = len(valores_cid)
+
+    # Partes na ordem do concat original: df, agregar (origem), agregar1 (destino), paridade
+    cid_origem = cid_municipios[origem.codigos_mun]
+    linhas_origem = origem.posicoes[origem.linhas]
+    paridade = origem.existe & (cid_origem == cid_df[cidD][linhas_origem]) & (cid_origem != cid_nula)
+    partes = [
+        (None, None, np.ones(n, dtype=bool)),
+        (origem, cidO, ~origem.existe),
+        (destino, cidD, ~destino.existe),
+        (origem, cidO, paridade),
+    ]
+
+    colunas = (ref, inco, cidO, ufO, cidD, ufD)
+    blocos = {coluna: [] for coluna in colunas}
+    posicoes, municipios, substituida, deslocamentos = [], [], {cidO: [], cidD: []}, []
+    for expansao, colunaCid, mantidas in partes:
+        linhas = np.arange(n) if expansao is None else expansao.posicoes[expansao.linhas[mantidas]]
+        codigos_mun = np.full(len(linhas), -1) if expansao is None else expansao.codigos_mun[mantidas]
+        posicoes.append(linhas)
+        municipios.append(codigos_mun)
+        if ordem:
+            # Ordem do município dentro da expansão da sua linha
+            deslocamentos.append(np.zeros(n, dtype=np.int64) if expansao is None else
+                                 (np.arange(len(expansao.linhas)) - np.searchsorted(expansao.linhas, expansao.linhas))[mantidas])
+        for coluna in (cidO, cidD):
+            substituida[coluna].append(np.full(len(linhas), coluna == colunaCid))
+        for coluna in colunas:
+            if coluna == colunaCid:
+                blocos[coluna].append(cid_municipios[codigos_mun])
+            elif coluna in cid_df:
+                blocos[coluna].append(cid_df[coluna][linhas])
+            else:
+                blocos[coluna].append(codigos[coluna][linhas])
+    chaves = _chave([np.concatenate(blocos[c]) for c in colunas], [tamanhos[c] for c in colunas])
+    unicas = ~pd.Series(chaves).duplicated().to_numpy()
+
+    # Posição de cada linha no resultado deduplicado e o filtro final (as duas cidades preenchidas ou as duas nulas)
+    origem_nula = np.concatenate(blocos[cidO]) == cid_nula
+    destino_nula = np.concatenate(blocos[cidD]) == cid_nula
+    del blocos, chaves
+    finais = unicas & (origem_nula == destino_nula)
+    indice_final = pd.Index((np.cumsum(unicas) - 1)[finais])
+
+    # Tipos do concat original (partes vazias também contam)
+    tipos = pd.concat(
+        [df.iloc[:0]] + [_monta(expansao, colunaCid, [], indice) for expansao, colunaCid, _ in partes[1:]]
+    ).dtypes
+
+    # Cada linha do resultado é uma linha de df, com no máximo uma das cidades trocada por um município
+    resultado = df.take(np.concatenate(posicoes)[finais]).astype(tipos.to_dict())
+    resultado.index = indice_final
+    municipios = np.concatenate(municipios)[finais]
+    for coluna in (cidO, cidD):
+        trocar = np.flatnonzero(np.concatenate(substituida[coluna])[finais])
+        valores = indice.municipios.take(municipios[trocar], allow_fill=True, fill_value=np.nan)
+        resultado.iloc[trocar, resultado.columns.get_loc(coluna)] = valores.astype(tipos[coluna])
+
+    if ordem:
+        # Chave de ordenação (parte, linha de df, município) das linhas únicas, para juntar partições
+        parte = np.repeat(np.arange(len(partes)), [len(p) for p in posicoes])
+        chaves_ordem = (parte[unicas], np.concatenate(posicoes)[unicas], np.concatenate(deslocamentos)[unicas], finais[unicas])
+        return resultado, chaves_ordem
+    return resultado
+
+def trata(df, engine='indice'):
+    """
+    Expande as linhas "Todo o Estado" de origem e destino e junta ao df,
+    sem repetir (referência, incoterms, cidades e UFs).
+
+    engine='indice' faz a expansão da origem uma única vez (usada tanto
+    para as combinações novas quanto para a paridade) e deduplica por
+    chaves inteiras antes de montar as linhas do resultado;
+    engine='merge' é a implementação original. As duas produzem o mesmo
+    resultado.
+    """
+    if engine == 'indice':
+        return _trataIndice(df)
+
+    df_paridade = trataPrazo(df, 'COLETA_CIDORIGEM', 'COLETA_UFORIGEM', ligacao='both', engine=engine)
     df_paridade = df_paridade.loc[df_paridade['COLETA_CIDORIGEM'] == df_paridade['COLETA_CIDDESTINO']]
 
-    df_agregar = trataPrazo(df, 'COLETA_CIDORIGEM', 'COLETA_UFORIGEM', ligacao='left_only')
-    df_agregar1 = trataPrazo(df, 'COLETA_CIDDESTINO', 'COLETA_UFDESTINO', ligacao='left_only')
+    df_agregar = trataPrazo(df, 'COLETA_CIDORIGEM', 'COLETA_UFORIGEM', ligacao='left_only', engine=engine)
+    df_agregar1 = trataPrazo(df, 'COLETA_CIDDESTINO', 'COLETA_UFDESTINO', ligacao='left_only', engine=engine)
 
     df = pd.concat([df, df_agregar, df_agregar1, df_paridade], ignore_index=True).drop_duplicates(['REFERENCIA_MEDICAO', 'INCOTERMS', 'COLETA_CIDORIGEM', 'COLETA_UFORIGEM', 'COLETA_CIDDESTINO', 'COLETA_UFDESTINO']).reset_index(drop=True)
     #df = df[(df["COLETA_CIDORIGEM"].notna()) & (df["COLETA_CIDDESTINO"].notna())]
     df = df[(~((df["COLETA_CIDORIGEM"].notna() & df["COLETA_CIDDESTINO"].isna()))) & (~((df["COLETA_CIDORIGEM"].isna() & df["COLETA_CIDDESTINO"].notna())))]
 
     return df
+
+def _trataParticao(df):
+    # Executada nos processos: o IBGE vem da cópia local em disco, sem passar pelo pickle
+    return _trataIndice(df, ordem=True)
+
+def trataParalelo(df, processos=None, ref='REFERENCIA_MEDICAO') -> pd.DataFrame:
+    """
+    Mesmo resultado de trata(df) (linhas, ordem, índice e tipos), com as
+    referências processadas em paralelo em um pool de processos.
+
+    Cada referência é independente (as combinações existentes e a
+    deduplicação incluem a referência); as UFs de uma referência ficam
+    juntas, porque a expansão do destino consulta todas as UFs de origem.
+    A cópia local do IBGE é gravada antes de iniciar o pool; cada processo
+    a lê do disco em vez de recebê-la pelo pickle, mas mantém sua própria
+    cópia em memória (pequena: só UF e município, como categóricas). As
+    partes são reordenadas pela posição que teriam no processamento serial.
+    """
+    carregaIBGE()
+
+    codigos, _ = pd.factorize(df[ref], use_na_sentinel=False)
+    ordem = np.argsort(codigos, kind='stable')
+    grupos = np.split(ordem, np.cumsum(np.bincount(codigos))[:-1]) if len(df) else []
+    # Maiores primeiro, para equilibrar os processos
+    grupos.sort(key=len, reverse=True)
+
+    if processos == 1 or len(grupos) <= 1:
+        resultados = [_trataParticao(df.iloc[linhas]) for linhas in grupos]
+    else:
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            resultados = list(executor.map(_trataParticao, (df.iloc[linhas] for linhas in grupos)))
+    if not resultados:
+        return trata(df)
+
+    # Posição de cada linha única no processamento serial (parte, linha de df, município)
+    parte = np.concatenate([chaves[0] for _, chaves in resultados])
+    posicao = np.concatenate([linhas[chaves[1]] for linhas, (_, chaves) in zip(grupos, resultados)])
+    deslocamento = np.concatenate([chaves[2] for _, chaves in resultados])
+    finais = np.concatenate([chaves[3] for _, chaves in resultados])
+    posicao_serial = np.empty(len(parte), dtype=np.int64)
+    posicao_serial[np.lexsort((deslocamento, posicao, parte))] = np.arange(len(parte))
+
+    indice_final = posicao_serial[finais]
+    resultado = pd.concat([r for r, _ in resultados], ignore_index=True).take(np.argsort(indice_final))
+    resultado.index = pd.Index(np.sort(indice_final))
+    return resultado
+
+def _referencias(dataset, ref):
+    # Valores de ref: pelas chaves das partições (sem ler dados) ou, se ref não for
+    # chave de partição, lendo só essa coluna em lotes
+    valores = set()
+    for fragmento in dataset.get_fragments():
+        chaves = ds.get_partition_keys(fragmento.partition_expression)
+        if ref not in chaves:
+            break
+        valores.add(chaves[ref])
+    else:
+        return sorted(valores, key=lambda v: (v is None, v))
+
+    valores = set()
+    for lote in dataset.to_batches(columns=[ref]):
+        valores.update(pc.unique(lote.column(0)).to_pylist())
+    return sorted(valores, key=lambda v: (v is None, v))
+
+def trataParquet(origem, destino, partitioning='hive', ref='REFERENCIA_MEDICAO', engine='indice') -> int:
+    """
+    Aplica trata a um dataset parquet sem carregá-lo inteiro na memória.
+
+    O dataset (arquivo ou pasta, particionado por REFERENCIA_MEDICAO e/ou UF)
+    é processado uma referência por vez: as combinações existentes e a
+    deduplicação incluem a referência, então o resultado de cada uma
+    independe das outras. As partições por UF de uma mesma referência são
+    lidas juntas, porque a expansão do destino consulta todas as UFs de
+    origem. Cada resultado é gravado em `destino` (um arquivo parquet) assim
+    que fica pronto; a memória usada depende do tamanho de uma referência.
+
+    O esquema gravado é o do dataset (inclusive as colunas de partição).
+    Retorna o número de linhas gravadas.
+    """
+    dataset = ds.dataset(origem, format='parquet', partitioning=partitioning)
+    total = 0
+    with pq.ParquetWriter(destino, dataset.schema) as escritor:
+        for valor in _referencias(dataset, ref):
+            filtro = ds.field(ref).is_null() if valor is None else ds.field(ref) == valor
+            df = dataset.to_table(filter=filtro).to_pandas()
+            resultado = trata(df, engine=engine)
+            del df
+            if resultado.empty:
+                continue
+            escritor.write_table(pa.Table.from_pandas(resultado, schema=dataset.schema, preserve_index=False))
+            total += len(resultado)
+    return total
@@ -3,6 +3,13 @@ from setuptools import setup, find_packages
 setup(
     name="Modulos",
     version="0.1",
-    packages=find_packages(),
+    # Os benchmarks rodam a partir do repositório e não fazem parte do pacote instalado
+    packages=find_packages(exclude=["Minio.benchmarks", "Minio.benchmarks.*"]),
     include_package_data=True,
+    install_requires=[
+        # Minio.minio_client usa funções internas do minio-py: assinatura de URLs
+        # (minio.signer, Minio._get_region/_base_url/_provider) e multipart
+        # (Minio._create_multipart_upload, _upload_part, _list_parts, ...): só versões testadas
+        "minio>=7.2.20,<7.3",
+    ],
 )
@@ -0,0 +1,194 @@
+"""
+Cliente Minio falso, em memória, para testar o MinIOManager sem servidor.
+
+Implementa só o que os testes usam: buckets, put/get/stat/list/remove,
+cópia e composição no servidor e as chamadas de multipart de baixo nível.
+"""
+
+import datetime
+import hashlib
+import io
+import threading
+import uuid
+from types import SimpleNamespace
+
+from minio.datatypes import Part
+from minio.error import S3Error
+
+from Minio.minio_client import MinIOManager
+
+
+class FakeObject:
+    def __init__(self, bucket_name, object_name, data, content_type=None, metadata=None):
+        self.bucket_name = bucket_name
+        self.object_name = object_name
+        self.data = data
+        self.size = len(data)
+        self.etag = hashlib.md5(data).hexdigest()
+        self.content_type = content_type or "application/octet-stream"
+        self.last_modified = datetime.datetime.now(datetime.timezone.utc)
+        self.metadata = {
+            (k.lower() if k.lower().startswith("x-amz-meta-") else f"x-amz-meta-{k.lower()}"): v
+            for k, v in (metadata or {}).items()
+        }
+        self.is_dir = False
+        self.version_id = None
+
+
+class FakeResponse(io.BytesIO):
+    def __init__(self, data, headers):
+        super().__init__(data)
+        self.headers = headers
+
+    def release_conn(self):
+        pass
+
+    def stream(self, amt=65536):
+        while True:
+            chunk = self.read(amt)
+            if not chunk:
+                break
+            yield chunk
+
+
+def _error(code):
+    return S3Error(SimpleNamespace(status=404), code, code, "resource", "request", "host")
+
+
+class FakeMinio:
+    def __init__(self):
+        self.buckets = {}
+        self._lock = threading.Lock()
+        self._region_map = {}
+        self.uploads = {}
+
+    def bucket_exists(self, bucket_name):
+        return bucket_name in self.buckets
+
+    def make_bucket(self, bucket_name, *args, **kwargs):
+        self.buckets.setdefault(bucket_name, {})
+
+    def list_buckets(self):
+        return [SimpleNamespace(name=name) for name in self.buckets]
+
+    def _store(self, bucket_name, object_name, data, content_type=None, metadata=None):
+        obj = FakeObject(bucket_name, object_name, data, content_type, metadata)
+        with self._lock:
+            self.buckets.setdefault(bucket_name, {})[object_name] = obj
+        return SimpleNamespace(etag=obj.etag, object_name=object_name, version_id=None)
+
+    def put_object(self, bucket_name, object_name, data, length, content_type=None, metadata=None, **kwargs):
+        raw = data.read() if length == -1 else data.read(length)
+        return self._store(bucket_name, object_name, raw, content_type, metadata)
+
+    def fput_object(self, bucket_name, object_name, file_path, content_type=None, metadata=None, **kwargs):
+        with open(file_path, "rb") as f:
+            return self._store(bucket_name, object_name, f.read(), content_type, metadata)
+
+    def _get(self, bucket_name, object_name):
+        try:
+            return self.buckets[bucket_name][object_name]
+        except KeyError:
+            raise _error("NoSuchKey" if bucket_name in self.buckets else "NoSuchBucket")
+
+    def stat_object(self, bucket_name, object_name, **kwargs):
+        return self._get(bucket_name, object_name)
+
+    def get_object(self, bucket_name, object_name, offset=0, length=0, **kwargs):
+        obj = self._get(bucket_name, object_name)
+        data = obj.data[offset:offset + length] if length else obj.data[offset:]
+        return FakeResponse(data, dict(obj.metadata))
+
+    def fget_object(self, bucket_name, object_name, file_path, **kwargs):
+        obj = self._get(bucket_name, object_name)
+        with open(file_path, "wb") as f:
+            f.write(obj.data)
+        return obj
+
+    def list_objects(self, bucket_name, prefix=None, recursive=False, start_after=None, **kwargs):
+        if bucket_name not in self.buckets:
+            raise _error("NoSuchBucket")
+        for name in sorted(self.buckets[bucket_name]):
+            if prefix and not name.startswith(prefix):
+                continue
+            if start_after and name <= start_after:
+                continue
+            yield self.buckets[bucket_name][name]
+
+    def remove_object(self, bucket_name, object_name, **kwargs):
+        self.buckets.get(bucket_name, {}).pop(object_name, None)
+
+    def remove_objects(self, bucket_name, delete_object_list, **kwargs):
+        for item in list(delete_object_list):
+            self.buckets.get(bucket_name, {}).pop(item.name, None)
+        return iter([])
+
+    def copy_object(self, bucket_name, object_name, source, **kwargs):
+        obj = self._get(source.bucket_name, source.object_name)
+        if bucket_name not in self.buckets:
+            raise _error("NoSuchBucket")
+        return self._store(bucket_name, object_name, obj.data, obj.content_type, obj.metadata)
+
+    def compose_object(self, bucket_name, object_name, sources, **kwargs):
+        data = b"".join(self._get(source.bucket_name, source.object_name).data for source in sources)
+        if bucket_name not in self.buckets:
+            raise _error("NoSuchBucket")
+        return self._store(bucket_name, object_name, data)
+
+    def _create_multipart_upload(self, bucket_name, object_name, headers):
+        upload_id = uuid.uuid4().hex
+        with self._lock:
+            self.uploads[upload_id] = SimpleNamespace(
+                bucket_name=bucket_name, object_name=object_name, upload_id=upload_id,
+                initiated_time=datetime.datetime.now(datetime.timezone.utc),
+                content_type=headers.get("Content-Type"), parts={}
+            )
+        return upload_id
+
+    def _upload(self, upload_id):
+        try:
+            return self.uploads[upload_id]
+        except KeyError:
+            raise _error("NoSuchUpload")
+
+    def _upload_part(self, bucket_name, object_name, data, headers, upload_id, part_number):
+        self._upload(upload_id).parts[part_number] = bytes(data)
+        return hashlib.md5(data).hexdigest()
+
+    def _complete_multipart_upload(self, bucket_name, object_name, upload_id, parts, ssec=None):
+        with self._lock:
+            upload = self._upload(upload_id)
+            del self.uploads[upload_id]
+        chunks = [upload.parts[part.part_number] for part in parts]
+        result = self._store(bucket_name, object_name, b"".join(chunks), upload.content_type)
+        obj = self.buckets[bucket_name][object_name]
+        obj.etag = result.etag = hashlib.md5(
+            b"".join(hashlib.md5(chunk).digest() for chunk in chunks)
+        ).hexdigest() + f"-{len(chunks)}"
+        return result
+
+    def _abort_multipart_upload(self, bucket_name, object_name, upload_id):
+        with self._lock:
+            self._upload(upload_id)
+            del self.uploads[upload_id]
+
+    def _list_multipart_uploads(self, bucket_name, prefix=None, **kwargs):
+        uploads = [
+            upload for upload in self.uploads.values()
+            if upload.bucket_name == bucket_name and upload.object_name.startswith(prefix or "")
+        ]
+        return SimpleNamespace(uploads=uploads, is_truncated=False, next_key_marker=None)
+
+    def _list_parts(self, bucket_name, object_name, upload_id, part_number_marker=None, **kwargs):
+        parts = [
+            Part(number, hashlib.md5(data).hexdigest(), None, len(data))
+            for number, data in sorted(self._upload(upload_id).parts.items())
+        ]
+        return SimpleNamespace(parts=parts, is_truncated=False, next_part_number_marker=None)
+
+
+def fake_manager() -> MinIOManager:
+    """MinIOManager ligado a um FakeMinio (lazy: nenhum cliente real é criado)."""
+    manager = MinIOManager("fake:9000", "access-key", "secret-key", secure=False, lazy=True)
+    manager.client = FakeMinio()
+    return manager
@@ -0,0 +1,77 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from fake_minio import fake_manager
+from Minio.minio_client import AsyncMinIOManager, MinIOOperationError
+
+
+@pytest.fixture
+def manager():
+    manager = fake_manager()
+    for i in range(20):
+        manager.client._store("bkt", f"obj-{i:02d}.txt", b"x" * i)
+    return manager
+
+
+def test_get_many_file_info_respeita_a_concorrencia(manager):
+    stat_object = manager.client.stat_object
+    lock = threading.Lock()
+    ativos, pico = 0, 0
+
+    def _stat_object(*args, **kwargs):
+        nonlocal ativos, pico
+        with lock:
+            ativos += 1
+            pico = max(pico, ativos)
+        time.sleep(0.02)
+        with lock:
+            ativos -= 1
+        return stat_object(*args, **kwargs)
+
+    manager.client.stat_object = _stat_object
+    nomes = [f"obj-{i:02d}.txt" for i in reversed(range(20))]
+
+    async def _main():
+        async with AsyncMinIOManager(manager, max_concurrency=4) as async_manager:
+            return await async_manager.get_many_file_info("bkt", nomes)
+
+    infos = asyncio.run(_main())
+
+    assert [info["name"] for info in infos] == nomes
+    assert [info["size"] for info in infos] == list(reversed(range(20)))
+    assert 1 < pico <= 4
+
+
+def test_get_many_file_info_com_excecoes(manager):
+    async def _main():
+        async with AsyncMinIOManager(manager) as async_manager:
+            infos = await async_manager.get_many_file_info(
+                "bkt", ["obj-01.txt", "nada.txt"], return_exceptions=True
+            )
+            with pytest.raises(MinIOOperationError):
+                await async_manager.get_file_info("bkt", "nada.txt")
+            return infos
+
+    infos = asyncio.run(_main())
+
+    assert infos[0]["size"] == 1
+    assert isinstance(infos[1], MinIOOperationError)
+
+
+def test_upload_e_download(manager, tmp_path):
+    origem = tmp_path / "origem.txt"
+    origem.write_bytes(b"conteudo")
+
+    async def _main():
+        async with AsyncMinIOManager(manager) as async_manager:
+            await async_manager.upload_file(origem, "novo.txt", "bkt")
+            await async_manager.download_file("bkt", "novo.txt", tmp_path / "destino.txt")
+            return await async_manager.list_files("bkt", prefix="novo")
+
+    arquivos = asyncio.run(_main())
+
+    assert (tmp_path / "destino.txt").read_bytes() == b"conteudo"
+    assert [arquivo["name"] for arquivo in arquivos] == ["novo.txt"]
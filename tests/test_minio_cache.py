@@ -0,0 +1,110 @@
+import io
+
+import pandas as pd
+import pytest
+
+from fake_minio import fake_manager
+from Minio.minio_client import ObjectCache
+
+
+@pytest.fixture
+def manager():
+    manager = fake_manager()
+    manager.client.make_bucket("bkt")
+    return manager
+
+
+@pytest.fixture
+def downloads(manager):
+    """Objetos baixados com get_object, na ordem."""
+    names = []
+    get_object = manager.client.get_object
+
+    def _get_object(bucket_name, object_name, *args, **kwargs):
+        names.append(object_name)
+        return get_object(bucket_name, object_name, *args, **kwargs)
+
+    manager.client.get_object = _get_object
+    return names
+
+
+def _put(manager, name, data):
+    manager.client.put_object("bkt", name, io.BytesIO(data), len(data))
+
+
+def test_get_bytes_downloads_only_when_etag_changes(manager, downloads):
+    _put(manager, "a.bin", b"v1")
+    cache = ObjectCache(manager)
+
+    assert cache.get_bytes("bkt", "a.bin") == b"v1"
+    assert cache.get_bytes("bkt", "a.bin") == b"v1"
+    assert downloads == ["a.bin"]
+
+    _put(manager, "a.bin", b"v2")
+    assert cache.get_bytes("bkt", "a.bin") == b"v2"
+    assert downloads == ["a.bin", "a.bin"]
+    assert cache.stats()["entries"] == 1
+    assert (cache.stats()["hits"], cache.stats()["misses"]) == (1, 2)
+
+
+def test_memory_budget_evicts_least_recently_used(manager, downloads):
+    for name in ("a", "b", "c"):
+        _put(manager, name, name.encode() * 40)
+    cache = ObjectCache(manager, max_memory_bytes=100)
+
+    cache.get_bytes("bkt", "a")
+    cache.get_bytes("bkt", "b")
+    cache.get_bytes("bkt", "a")
+    cache.get_bytes("bkt", "c")
+    cache.get_bytes("bkt", "a")
+    cache.get_bytes("bkt", "b")
+
+    assert downloads == ["a", "b", "c", "b"]
+    assert cache.stats()["memory_bytes"] <= 100
+
+
+def test_disk_tier_survives_a_new_cache(manager, downloads, tmp_path):
+    _put(manager, "a.bin", b"conteudo")
+    ObjectCache(manager, disk_dir=tmp_path).get_bytes("bkt", "a.bin")
+
+    assert ObjectCache(manager, disk_dir=tmp_path).get_bytes("bkt", "a.bin") == b"conteudo"
+    assert downloads == ["a.bin"]
+
+    _put(manager, "a.bin", b"outro")
+    assert ObjectCache(manager, disk_dir=tmp_path).get_bytes("bkt", "a.bin") == b"outro"
+    assert len(list(tmp_path.glob("*.bin"))) == 1
+
+
+def test_compressed_objects_are_cached_decompressed(manager):
+    manager.upload_data(b"texto " * 1000, "a.txt", "bkt", codec="gzip")
+
+    assert ObjectCache(manager).get_bytes("bkt", "a.txt") == b"texto " * 1000
+
+
+def test_get_dataframe_returns_copies_and_projects_columns(manager, downloads):
+    df = pd.DataFrame({"id": range(10), "uf": ["SP", "RJ"] * 5})
+    buffer = io.BytesIO()
+    df.to_parquet(buffer, index=False)
+    _put(manager, "t.parquet", buffer.getvalue())
+    cache = ObjectCache(manager)
+
+    first = cache.get_dataframe("bkt", "t.parquet")
+    first.loc[0, "id"] = -1
+    second = cache.get_dataframe("bkt", "t.parquet")
+
+    pd.testing.assert_frame_equal(second, df)
+    assert downloads == ["t.parquet"]
+    assert list(cache.get_dataframe("bkt", "t.parquet", columns=["uf"]).columns) == ["uf"]
+    filtered = cache.get_dataframe("bkt", "t.parquet", filters=[("uf", "=", "SP")])
+    assert filtered["id"].tolist() == [0, 2, 4, 6, 8]
+
+
+def test_invalidate_forces_new_download(manager, downloads, tmp_path):
+    _put(manager, "a.bin", b"x")
+    cache = ObjectCache(manager, disk_dir=tmp_path)
+    cache.get_bytes("bkt", "a.bin")
+
+    cache.invalidate("bkt", "a.bin")
+    cache.get_bytes("bkt", "a.bin")
+
+    assert downloads == ["a.bin", "a.bin"]
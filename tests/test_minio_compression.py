@@ -0,0 +1,73 @@
+import gzip
+import io
+
+import pytest
+
+from fake_minio import fake_manager
+from Minio.minio_client import codec_from_metadata
+
+
+@pytest.fixture
+def manager():
+    manager = fake_manager()
+    manager.client.make_bucket("bkt")
+    return manager
+
+
+@pytest.fixture
+def origem(tmp_path):
+    origem = tmp_path / "origem"
+    (origem / "sub").mkdir(parents=True)
+    (origem / "a.csv").write_bytes(b"id;valor\n" + b"1;2\n" * 5000)
+    (origem / "sub" / "b.csv").write_bytes(b"id;valor\n" + b"3;4\n" * 3000)
+    return origem
+
+
+def test_codec_from_metadata_ignores_foreign_values():
+    assert codec_from_metadata({"x-amz-meta-modulos-codec": "GZIP"}) == "gzip"
+    assert codec_from_metadata({"x-amz-meta-codec": "gzip"}) is None
+    assert codec_from_metadata({"x-amz-meta-modulos-codec": "h264"}) is None
+    assert codec_from_metadata(None) is None
+
+
+def test_download_file_keeps_objects_with_foreign_codec_metadata(manager, tmp_path):
+    manager.client.put_object("bkt", "video.mp4", io.BytesIO(b"frames"), 6, metadata={"codec": "h264"})
+
+    result = manager.download_file("bkt", "video.mp4", tmp_path / "video.mp4")
+
+    assert "codec" not in result
+    assert (tmp_path / "video.mp4").read_bytes() == b"frames"
+
+
+def test_compressed_round_trip_skips_unchanged_copies(manager, origem, tmp_path):
+    manager.upload_directory(origem, "bkt", prefix="dados/", codec="gzip")
+    stored = manager.client.buckets["bkt"]["dados/a.csv"]
+    assert gzip.decompress(stored.data) == (origem / "a.csv").read_bytes()
+    destino = tmp_path / "destino"
+
+    first = manager.download_prefix("bkt", "dados", destino)
+    second = manager.download_prefix("bkt", "dados", destino)
+
+    assert len(first["downloaded"]) == 2
+    assert (destino / "sub" / "b.csv").read_bytes() == (origem / "sub" / "b.csv").read_bytes()
+    assert second["downloaded"] == []
+    assert sorted(second["skipped"]) == ["dados/a.csv", "dados/sub/b.csv"]
+
+    # Mesmo tamanho, conteúdo diferente: o MD5 do original decide
+    (destino / "a.csv").write_bytes((origem / "a.csv").read_bytes().replace(b"1;2", b"9;9", 1))
+    third = manager.download_prefix("bkt", "dados", destino)
+
+    assert [item["object_name"] for item in third["downloaded"]] == ["dados/a.csv"]
+    assert (destino / "a.csv").read_bytes() == (origem / "a.csv").read_bytes()
+
+
+def test_sync_download_skips_unchanged_compressed_copies(manager, origem, tmp_path):
+    manager.upload_directory(origem, "bkt", prefix="dados/", codec="gzip")
+    destino = tmp_path / "destino"
+
+    first = manager.sync(destino, "bkt", prefix="dados", direction="download")
+    second = manager.sync(destino, "bkt", prefix="dados", direction="download")
+
+    assert first["transferred"] == 2
+    assert second["transferred"] == 0 and second["skipped"] == 2
+    assert (destino / "a.csv").read_bytes() == (origem / "a.csv").read_bytes()
@@ -0,0 +1,99 @@
+import pytest
+
+from fake_minio import _error, fake_manager
+from Minio.minio_client import MinIOOperationError
+
+
+@pytest.fixture
+def manager():
+    manager = fake_manager()
+    manager.client.make_bucket("origem")
+    for name, data in [("dados/a.txt", b"a"), ("dados/sub/b.txt", b"bb"), ("dados.txt", b"irmao")]:
+        manager.client._store("origem", name, data, "text/plain", {"autor": "teste"})
+    return manager
+
+
+def _nomes(manager, bucket_name):
+    return sorted(manager.client.buckets.get(bucket_name, {}))
+
+
+def test_copy_object_preserva_conteudo_e_metadados(manager):
+    result = manager.copy_object("origem", "dados/a.txt", "origem", "copia.txt")
+
+    copia = manager.client.buckets["origem"]["copia.txt"]
+    assert copia.data == b"a"
+    assert copia.content_type == "text/plain"
+    assert copia.metadata == {"x-amz-meta-autor": "teste"}
+    assert result["etag"] == copia.etag
+    assert "dados/a.txt" in manager.client.buckets["origem"]
+
+
+def test_copy_object_usa_o_mesmo_nome_por_padrao(manager):
+    manager.client.make_bucket("destino")
+
+    manager.copy_object("origem", "dados/a.txt", "destino")
+
+    assert _nomes(manager, "destino") == ["dados/a.txt"]
+
+
+def test_copy_object_inexistente(manager):
+    with pytest.raises(MinIOOperationError) as exc:
+        manager.copy_object("origem", "nada.txt", "origem", "copia.txt")
+    assert exc.value.operation == "copy_object"
+
+
+def test_move_object(manager):
+    manager.move_object("origem", "dados/a.txt", "origem", "movido.txt")
+
+    assert "dados/a.txt" not in manager.client.buckets["origem"]
+    assert manager.client.buckets["origem"]["movido.txt"].data == b"a"
+
+
+def test_move_object_para_o_mesmo_lugar_nao_remove(manager):
+    manager.move_object("origem", "dados/a.txt", "origem")
+
+    assert manager.client.buckets["origem"]["dados/a.txt"].data == b"a"
+
+
+def test_copy_prefix(manager):
+    result = manager.copy_prefix("origem", "dados/", "destino", "backup/")
+
+    assert _nomes(manager, "destino") == ["backup/a.txt", "backup/sub/b.txt"]
+    assert result["total_bytes"] == 3
+    assert result["failed"] == []
+    assert _nomes(manager, "origem") == ["dados.txt", "dados/a.txt", "dados/sub/b.txt"]
+
+
+def test_move_prefix_so_remove_o_que_foi_copiado(manager):
+    copy_object = manager.client.copy_object
+
+    def _copy_object(bucket_name, object_name, source, **kwargs):
+        if source.object_name == "dados/sub/b.txt":
+            raise _error("AccessDenied")
+        return copy_object(bucket_name, object_name, source, **kwargs)
+
+    manager.client.copy_object = _copy_object
+
+    result = manager.move_prefix("origem", "dados/", "destino", "backup/")
+
+    assert result["deleted"] == 1
+    assert [item["object_name"] for item in result["failed"]] == ["dados/sub/b.txt"]
+    assert _nomes(manager, "origem") == ["dados.txt", "dados/sub/b.txt"]
+    assert _nomes(manager, "destino") == ["backup/a.txt"]
+
+
+def test_compose(manager):
+    manager.client.make_bucket("outro")
+    manager.client._store("outro", "fim.txt", b"!")
+
+    result = manager.compose("origem", "junto.txt", ["dados/a.txt", "dados/sub/b.txt", ("outro", "fim.txt")])
+
+    assert manager.client.buckets["origem"]["junto.txt"].data == b"abb!"
+    assert result["parts"] == 3
+
+
+def test_compose_com_parte_inexistente(manager):
+    with pytest.raises(MinIOOperationError) as exc:
+        manager.compose("origem", "junto.txt", ["dados/a.txt", "nada.txt"])
+    assert exc.value.operation == "compose_object"
+    assert "junto.txt" not in manager.client.buckets["origem"]
@@ -0,0 +1,78 @@
+import io
+
+import pytest
+from minio.deleteobjects import DeleteError
+
+from fake_minio import fake_manager
+from Minio.minio_client import MinIOOperationError
+from Minio.minio_client import client as minio_client
+
+
+@pytest.fixture
+def manager():
+    manager = fake_manager()
+    manager.client.make_bucket("bkt")
+    return manager
+
+
+def _put(manager, *names):
+    for name in names:
+        manager.client.put_object("bkt", name, io.BytesIO(b"x"), 1)
+
+
+def test_delete_many_in_batches(manager):
+    names = [f"obj/{i:05d}" for i in range(minio_client.DELETE_BATCH_SIZE + 5)]
+    _put(manager, *names, "keep.txt")
+
+    result = manager.delete_many("bkt", names + names[:3])
+
+    assert result == {"bucket": "bkt", "deleted": len(names), "batches": 2, "dry_run": False}
+    assert list(manager.client.buckets["bkt"]) == ["keep.txt"]
+
+
+def test_delete_many_dry_run_keeps_objects(manager):
+    _put(manager, "a", "b")
+
+    result = manager.delete_many("bkt", ["a", "b"], dry_run=True)
+
+    assert result["deleted"] == 2 and result["dry_run"]
+    assert sorted(manager.client.buckets["bkt"]) == ["a", "b"]
+
+
+def test_delete_many_reports_failed_keys(manager):
+    _put(manager, "a", "b")
+    remove_objects = manager.client.remove_objects
+
+    def _remove_objects(bucket_name, delete_object_list, **kwargs):
+        batch = list(delete_object_list)
+        remove_objects(bucket_name, [item for item in batch if item.name != "b"])
+        return iter([DeleteError("AccessDenied", "negado", "b", None)])
+
+    manager.client.remove_objects = _remove_objects
+
+    with pytest.raises(MinIOOperationError) as excinfo:
+        manager.delete_many("bkt", ["a", "b"])
+
+    assert excinfo.value.operation == "delete_many"
+    assert excinfo.value.details == [{"object_name": "b", "code": "AccessDenied", "message": "negado"}]
+    assert list(manager.client.buckets["bkt"]) == ["b"]
+
+
+@pytest.mark.parametrize("prefix", ["data", "data/"])
+def test_delete_prefix_keeps_sibling_prefixes(manager, prefix):
+    _put(manager, "data/x.txt", "data/sub/y.txt", "dataset/z.txt", "data")
+
+    result = manager.delete_prefix("bkt", prefix)
+
+    assert result["deleted"] == 2 and result["prefix"] == "data/"
+    assert sorted(manager.client.buckets["bkt"]) == ["data", "dataset/z.txt"]
+
+
+def test_delete_prefix_rejects_empty_prefix(manager):
+    _put(manager, "a")
+
+    with pytest.raises(MinIOOperationError) as excinfo:
+        manager.delete_prefix("bkt", "")
+
+    assert excinfo.value.operation == "delete_prefix"
+    assert list(manager.client.buckets["bkt"]) == ["a"]
@@ -0,0 +1,43 @@
+import io
+
+import pytest
+
+from fake_minio import fake_manager
+
+
+@pytest.fixture
+def manager():
+    manager = fake_manager()
+    manager.client.make_bucket("bkt")
+    return manager
+
+
+def _local_files(local_dir):
+    return sorted(p.relative_to(local_dir).as_posix() for p in local_dir.rglob("*") if p.is_file())
+
+
+@pytest.mark.parametrize("prefix", ["data", "data/"])
+def test_download_prefix_ignores_sibling_prefixes(manager, tmp_path, prefix):
+    manager.client.put_object("bkt", "data/x.txt", io.BytesIO(b"x"), 1)
+    manager.client.put_object("bkt", "data/sub/y.txt", io.BytesIO(b"yy"), 2)
+    manager.client.put_object("bkt", "dataset/z.txt", io.BytesIO(b"z"), 1)
+
+    result = manager.download_prefix("bkt", prefix, tmp_path)
+
+    assert result["failed"] == []
+    assert _local_files(tmp_path) == ["sub/y.txt", "x.txt"]
+    assert (tmp_path / "sub" / "y.txt").read_bytes() == b"yy"
+
+
+def test_download_prefix_skips_unchanged_and_keys_outside_local_dir(manager, tmp_path):
+    manager.client.put_object("bkt", "data/x.txt", io.BytesIO(b"x"), 1)
+    manager.client.put_object("bkt", "data//abs.txt", io.BytesIO(b"a"), 1)
+    manager.client.put_object("bkt", "data/../escape.txt", io.BytesIO(b"e"), 1)
+    local_dir = tmp_path / "local"
+
+    first = manager.download_prefix("bkt", "data", local_dir)
+    second = manager.download_prefix("bkt", "data", local_dir)
+
+    assert len(first["downloaded"]) == 1 and first["failed"] == []
+    assert second["downloaded"] == [] and second["skipped"] == ["data/x.txt"]
+    assert _local_files(tmp_path) == ["local/x.txt"]
@@ -0,0 +1,144 @@
+"""Funções de Minio/examples/MinIO.py, com o manager compartilhado ligado a um FakeMinio."""
+
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fake_minio import fake_manager
+from Minio.examples import MinIO
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    manager = fake_manager()
+    manager.client.make_bucket("bkt")
+    monkeypatch.setattr(MinIO, "_manager", manager)
+    return manager
+
+
+def test_manager_attribute_is_none_when_connection_fails(monkeypatch):
+    monkeypatch.setattr(MinIO, "_manager", None)
+    for key in ("MINIO_ENDPOINT", "MINIO_ACCESS_KEY", "MINIO_SECRET_KEY"):
+        monkeypatch.delenv(key, raising=False)
+
+    assert MinIO.manager is None
+    with pytest.raises(RuntimeError):
+        MinIO.get_manager()
+
+
+def test_manager_attribute_returns_shared_manager(manager):
+    from Minio.examples.MinIO import manager as imported
+
+    assert imported is manager
+
+
+def _parquet(manager, name):
+    return pd.read_parquet(io.BytesIO(manager.client.buckets["bkt"][name].data))
+
+
+def test_write_dataframe_single_object(manager):
+    df = pd.DataFrame({"id": [1, 2, 3], "valor": [0.5, 1.5, 2.5]})
+
+    MinIO.write_dataframe(df, "tabela.parquet", "bkt")
+
+    pd.testing.assert_frame_equal(_parquet(manager, "tabela.parquet"), df)
+
+
+def test_write_dataframe_partitions_lazily_in_hive_layout(manager, monkeypatch):
+    df = pd.DataFrame({
+        "REFERENCIA_MEDICAO": ["2024-01", "2024-02", "2024-01", None, "2024-02"],
+        "UF": ["SP", "RJ", "SP", "MG", "a/b"],
+        "valor": [1, 2, 3, 4, 5],
+    })
+    upload_many_data = manager.upload_many_data
+    payloads = []
+
+    def _upload_many_data(objects, *args, **kwargs):
+        objects = list(objects)
+        payloads.extend(data for _, data in objects)
+        return upload_many_data(objects, *args, **kwargs)
+
+    monkeypatch.setattr(manager, "upload_many_data", _upload_many_data)
+
+    result = MinIO.write_dataframe(df, "dados/", "bkt", partition_cols=["REFERENCIA_MEDICAO", "UF"])
+
+    assert result["failed"] == []
+    assert all(callable(data) for data in payloads)
+    assert sorted(manager.client.buckets["bkt"]) == [
+        "dados/REFERENCIA_MEDICAO=2024-01/UF=SP/part-00000.parquet",
+        "dados/REFERENCIA_MEDICAO=2024-02/UF=RJ/part-00000.parquet",
+        "dados/REFERENCIA_MEDICAO=2024-02/UF=a%2Fb/part-00000.parquet",
+        "dados/REFERENCIA_MEDICAO=__HIVE_DEFAULT_PARTITION__/UF=MG/part-00000.parquet",
+    ]
+    parte = _parquet(manager, "dados/REFERENCIA_MEDICAO=2024-01/UF=SP/part-00000.parquet")
+    assert list(parte.columns) == ["valor"]
+    assert parte["valor"].tolist() == [1, 3]
+    assert np.array_equal(
+        _parquet(manager, "dados/REFERENCIA_MEDICAO=__HIVE_DEFAULT_PARTITION__/UF=MG/part-00000.parquet")["valor"],
+        [4]
+    )
+
+
+ANEXOS = [
+    "1_a.pdf", "10_a.pdf", "10_b.jpg", "100_a.pdf", "1000_a.pdf", "11_a.pdf", "110_a.pdf",
+    "12_a.pdf", "120_a.pdf", "12_b.pdf", "13_a.pdf", "2_a.pdf", "20_a.pdf",
+]
+
+
+@pytest.fixture
+def anexos(manager, monkeypatch):
+    monkeypatch.setattr(MinIO, "_anexos_cache", {})
+    for nome in ANEXOS:
+        manager.client._store("bkt", nome, b"x")
+    listagens = []
+    list_objects = manager.client.list_objects
+
+    def _list_objects(bucket_name, prefix=None, **kwargs):
+        listagens.append(prefix)
+        return list_objects(bucket_name, prefix=prefix, **kwargs)
+
+    manager.client.list_objects = _list_objects
+    return listagens
+
+
+@pytest.mark.parametrize("sufixo_agrupado", [0, 1, 2])
+def test_listar_anexos_lote_igual_a_listar_anexos(anexos, sufixo_agrupado):
+    ids = ["10", "11", "12", "1", "100", "2", "99"]
+
+    result = MinIO.listar_anexos_lote("bkt", ids, sufixo_agrupado=sufixo_agrupado)
+
+    assert result == {id_registro: MinIO.listar_anexos("bkt", id_registro) for id_registro in ids}
+    assert result["1"] == ["1_a.pdf"]
+    assert result["12"] == ["12_a.pdf", "12_b.pdf"]
+    assert result["99"] == []
+
+
+def test_agrupar_ids_agrupa_so_ids_de_mesmo_tamanho():
+    assert sorted(MinIO._agrupar_ids(["10", "11", "12", "1", "100", "2"], 1)) == [
+        ("1", ["10", "11", "12"]), ("100_", ["100"]), ("1_", ["1"]), ("2_", ["2"]),
+    ]
+    assert MinIO._agrupar_ids(["10", "11"], 0) == [("10_", ["10"]), ("11_", ["11"])]
+
+
+def test_listar_anexos_lote_agrupado_lista_uma_vez(anexos):
+    MinIO.listar_anexos_lote("bkt", ["10", "11", "12", "13"], sufixo_agrupado=1)
+
+    assert anexos == ["1"]
+
+
+def test_listar_anexos_lote_cache(anexos, manager, monkeypatch):
+    monkeypatch.setattr(MinIO, "_ANEXOS_CACHE_MAX", 3)
+    MinIO.listar_anexos_lote("bkt", ["10", "11"], cache_ttl=60)
+    manager.client._store("bkt", "10_c.pdf", b"x")
+    anexos.clear()
+
+    result = MinIO.listar_anexos_lote("bkt", ["10", "11", "12"], cache_ttl=60)
+
+    assert anexos == ["12_"]
+    assert result["10"] == ["10_a.pdf", "10_b.jpg"]
+
+    MinIO.listar_anexos_lote("bkt", ["13", "2"], cache_ttl=60)
+    assert len(MinIO._anexos_cache) == 3
+    assert ("bkt", "2") in MinIO._anexos_cache
@@ -0,0 +1,32 @@
+import pytest
+
+from Minio.minio_client import MinIOManager, RetryPolicy
+from Minio.minio_client import client as minio_client
+
+
+def _pool(**kwargs):
+    manager = MinIOManager("fake:9000", "access-key", "secret-key", secure=False, lazy=True, **kwargs)
+    return manager._build_http_client()
+
+
+@pytest.mark.parametrize("kwargs, expected", [
+    ({}, minio_client.DEFAULT_MAX_WORKERS * minio_client.MULTIPART_MAX_WORKERS),
+    ({"max_concurrency": 12}, 12),
+    ({"max_concurrency": None}, minio_client.DEFAULT_MAX_CONNECTIONS),
+    ({"max_connections": 100}, 100),
+])
+def test_pool_size_follows_worker_counts(kwargs, expected):
+    assert _pool(**kwargs).connection_pool_kw["maxsize"] == expected
+
+
+def test_urllib3_does_not_retry_when_retry_policy_is_active():
+    retries = _pool().connection_pool_kw["retries"]
+
+    assert retries.connect == retries.read == retries.status == retries.other == 0
+    assert not retries.is_retry("GET", 500)
+
+
+def test_urllib3_retries_server_errors_without_retry_policy():
+    retries = _pool(retry_policy=RetryPolicy(max_attempts=1)).connection_pool_kw["retries"]
+
+    assert retries.is_retry("GET", 502)
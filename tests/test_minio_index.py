@@ -0,0 +1,118 @@
+import datetime
+import io
+import sqlite3
+
+import pytest
+
+from fake_minio import fake_manager
+from Minio.minio_client import BucketIndex
+
+DAY = datetime.datetime(2024, 5, 1, tzinfo=datetime.timezone.utc)
+
+
+@pytest.fixture
+def manager():
+    manager = fake_manager()
+    manager.client.make_bucket("bkt")
+    return manager
+
+
+def _put(manager, name, data=b"x", day=0):
+    manager.client.put_object("bkt", name, io.BytesIO(data), len(data))
+    manager.client.buckets["bkt"][name].last_modified = DAY + datetime.timedelta(days=day)
+
+
+def _names(entries):
+    return [entry.name for entry in entries]
+
+
+def test_refresh_adds_updates_and_removes(manager):
+    _put(manager, "2024/01/a.pdf", b"a")
+    _put(manager, "2024/01/b.csv", b"bb", day=1)
+    _put(manager, "2024/02/c.pdf", b"ccc", day=2)
+    index = BucketIndex(manager)
+
+    first = index.refresh("bkt")
+    assert (first["listed"], first["added"], first["updated"], first["removed"]) == (3, 3, 0, 0)
+
+    _put(manager, "2024/01/b.csv", b"novo", day=3)
+    manager.client.remove_object("bkt", "2024/01/a.pdf")
+    second = index.refresh("bkt")
+
+    assert (second["listed"], second["added"], second["updated"], second["removed"]) == (2, 0, 1, 1)
+    assert second["max_last_modified"] == DAY + datetime.timedelta(days=3)
+    assert _names(index.find("bkt")) == ["2024/01/b.csv", "2024/02/c.pdf"]
+    assert index.find("bkt", prefix="2024/01/")[0].size == 4
+
+
+def test_refresh_by_prefix_keeps_other_prefixes(manager):
+    _put(manager, "2024/01/a.pdf")
+    _put(manager, "2024/02/b.pdf")
+    index = BucketIndex(manager)
+    index.refresh("bkt")
+
+    manager.client.remove_object("bkt", "2024/02/b.pdf")
+    manager.client.remove_object("bkt", "2024/01/a.pdf")
+    result = index.refresh("bkt", prefix="2024/01/")
+
+    assert result["removed"] == 1
+    assert _names(index.find("bkt")) == ["2024/02/b.pdf"]
+
+
+def test_append_only_lists_after_last_key(manager):
+    _put(manager, "log/001")
+    _put(manager, "log/002")
+    index = BucketIndex(manager)
+    index.refresh("bkt", prefix="log/")
+
+    _put(manager, "log/003")
+    manager.client.remove_object("bkt", "log/001")
+    result = index.refresh("bkt", prefix="log/", append_only=True)
+
+    assert (result["listed"], result["added"], result["removed"]) == (1, 1, 0)
+    assert index.count("bkt", prefix="log/") == 3
+
+
+def test_find_filters_locally(manager):
+    _put(manager, "a/1.pdf", b"1", day=0)
+    _put(manager, "a/2.pdf", b"22", day=2)
+    _put(manager, "a/3.csv", b"333", day=4)
+    _put(manager, "b/4.pdf", b"4444", day=5)
+    index = BucketIndex(manager)
+    index.refresh("bkt")
+
+    assert _names(index.find("bkt", glob="*.pdf")) == ["a/1.pdf", "a/2.pdf", "b/4.pdf"]
+    assert _names(index.find("bkt", prefix="a/", min_size=2, max_size=3)) == ["a/2.pdf", "a/3.csv"]
+    assert _names(index.find("bkt", modified_since=DAY + datetime.timedelta(days=3))) == ["a/3.csv", "b/4.pdf"]
+    assert _names(index.find("bkt", limit=1)) == ["a/1.pdf"]
+
+
+def test_last_refresh_reflects_indexed_objects(manager, tmp_path):
+    _put(manager, "a", day=1)
+    _put(manager, "b", day=5)
+    db_path = tmp_path / "indice.db"
+    with BucketIndex(manager, db_path) as index:
+        assert index.last_refresh("bkt") is None
+        index.refresh("bkt")
+        manager.client.remove_object("bkt", "b")
+        index.refresh("bkt")
+
+    with BucketIndex(manager, db_path) as index:
+        info = index.last_refresh("bkt")
+        assert info["max_last_modified"] == DAY + datetime.timedelta(days=1)
+        assert _names(index.find("bkt")) == ["a"]
+
+
+def test_opens_index_created_with_watermark_column(manager, tmp_path):
+    db_path = tmp_path / "antigo.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE refreshes (bucket TEXT NOT NULL, prefix TEXT NOT NULL, refreshed_at REAL NOT NULL, "
+            "max_last_modified REAL, PRIMARY KEY (bucket, prefix))"
+        )
+    _put(manager, "a")
+
+    with BucketIndex(manager, db_path) as index:
+        index.refresh("bkt")
+        index.refresh("bkt")
+        assert index.last_refresh("bkt") is not None
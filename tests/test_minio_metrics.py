@@ -0,0 +1,89 @@
+import contextlib
+
+import pytest
+
+from fake_minio import fake_manager
+from Minio.minio_client import MinIOOperationError, OperationMetrics
+
+
+@pytest.fixture
+def manager():
+    manager = fake_manager()
+    manager.metrics = OperationMetrics()
+    manager.client._store("bkt", "a.txt", b"x" * 100)
+    return manager
+
+
+def test_snapshot_conta_chamadas_erros_e_bytes(manager, tmp_path):
+    manager.get_file_info("bkt", "a.txt")
+    with pytest.raises(MinIOOperationError):
+        manager.get_file_info("bkt", "nada.txt")
+    manager.download_file("bkt", "a.txt", tmp_path / "a.txt")
+    manager.read_object_parallel("bkt", "a.txt", chunk_size=30)
+
+    snapshot = manager.metrics.snapshot()
+
+    assert snapshot["get_file_info"]["calls"] == 2
+    assert snapshot["get_file_info"]["errors"] == 1
+    assert snapshot["get_file_info"]["error_rate"] == 0.5
+    assert snapshot["get_file_info"]["bytes"] == 0
+    assert snapshot["download_file"]["bytes"] == 100
+    assert snapshot["read_object"]["bytes"] == 100
+    assert snapshot["read_object"]["latency_p50"] is not None
+
+
+def test_falha_fica_na_mesma_operacao_da_excecao(manager):
+    def get_object(*args, **kwargs):
+        raise ConnectionError("conexão recusada")
+
+    manager.client.get_object = get_object
+
+    with pytest.raises(MinIOOperationError) as exc:
+        manager.read_object_parallel("bkt", "a.txt", max_retries=0)
+
+    assert manager.metrics.snapshot()[exc.value.operation]["errors"] == 1
+
+
+def test_ganchos_e_listeners(manager):
+    spans, chamadas = [], []
+
+    @contextlib.contextmanager
+    def _span(operation):
+        spans.append(operation)
+        yield
+
+    manager.metrics.add_span_hook(_span)
+    manager.metrics.add_listener(lambda *args: chamadas.append(args))
+
+    manager.get_file_info("bkt", "a.txt")
+
+    assert spans == ["get_file_info"]
+    ((operation, seconds, nbytes, error),) = chamadas
+    assert operation == "get_file_info" and seconds >= 0 and nbytes is None and error is None
+
+
+def test_quantis_e_prometheus():
+    metrics = OperationMetrics(latency_buckets=(0.1, 1.0), size_buckets=(10, 100))
+    for seconds in (0.05, 0.05, 0.5, 2.0):
+        metrics.observe("download_file", seconds, 50)
+    metrics.observe("download_file", 0.05, error=RuntimeError())
+
+    stats = metrics.snapshot()["download_file"]
+    texto = metrics.to_prometheus()
+
+    assert stats["calls"] == 5 and stats["errors"] == 1 and stats["bytes"] == 200
+    assert 0 < stats["latency_p50"] <= 0.1
+    assert 0.1 < stats["latency_p95"] <= 1.0
+    assert 'minio_operation_calls_total{operation="download_file"} 5' in texto
+    assert 'minio_operation_duration_seconds_bucket{operation="download_file",le="0.1"} 3' in texto
+    assert 'minio_operation_duration_seconds_bucket{operation="download_file",le="+Inf"} 5' in texto
+    assert 'minio_operation_size_bytes_bucket{operation="download_file",le="100"} 4' in texto
+
+    metrics.reset()
+    assert metrics.snapshot() == {}
+
+
+def test_sem_metricas(manager):
+    manager.metrics = None
+
+    assert manager.get_file_info("bkt", "a.txt")["size"] == 100
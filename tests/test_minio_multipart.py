@@ -0,0 +1,143 @@
+import datetime
+import hashlib
+import inspect
+
+import pytest
+from minio import Minio
+
+from fake_minio import _error, fake_manager
+from Minio.minio_client import MinIOOperationError
+from Minio.minio_client import client as minio_client
+
+MIB = 1024 * 1024
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    # Partes de 1 MiB para não precisar de arquivos com dezenas de MiB
+    monkeypatch.setattr(minio_client, "DEFAULT_PART_SIZE", MIB)
+    manager = fake_manager()
+    manager.client.make_bucket("bkt")
+    return manager
+
+
+@pytest.fixture
+def arquivo(tmp_path):
+    path = tmp_path / "grande.bin"
+    path.write_bytes(bytes(range(256)) * (3 * MIB // 256 + 100))
+    return path
+
+
+def _pendente(manager, object_name, idade=0):
+    upload_id = manager.client._create_multipart_upload("bkt", object_name, {})
+    upload = manager.client.uploads[upload_id]
+    upload.initiated_time -= datetime.timedelta(seconds=idade)
+    return upload_id
+
+
+def _falha_na_parte(manager, numero):
+    original = manager.client._upload_part
+
+    def _upload_part(bucket_name, object_name, data, headers, upload_id, part_number):
+        if part_number == numero:
+            raise _error("AccessDenied")
+        return original(bucket_name, object_name, data, headers, upload_id, part_number)
+
+    manager.client._upload_part = _upload_part
+
+
+def test_upload_nao_adota_upload_de_outro_processo(manager, arquivo):
+    alheio = _pendente(manager, "grande.bin")
+    manager.client._upload_part("bkt", "grande.bin", b"outro", None, alheio, 1)
+
+    manager.upload_file(arquivo, "grande.bin", "bkt")
+
+    assert manager.client.buckets["bkt"]["grande.bin"].data == arquivo.read_bytes()
+    assert list(manager.client.uploads) == [alheio]
+
+
+def test_upload_aborta_pendentes_antigos(manager, arquivo):
+    antigo = _pendente(manager, "grande.bin", idade=minio_client.STALE_MULTIPART_AGE + 60)
+    outro = _pendente(manager, "grande.bin.bak", idade=minio_client.STALE_MULTIPART_AGE + 60)
+
+    manager.upload_file(arquivo, "grande.bin", "bkt")
+
+    assert antigo not in manager.client.uploads
+    assert outro in manager.client.uploads
+    assert manager.abort_stale_uploads("bkt") == 1
+    assert not manager.client.uploads
+
+
+def test_falha_sem_resume_aborta_upload(manager, arquivo):
+    _falha_na_parte(manager, 2)
+
+    with pytest.raises(MinIOOperationError):
+        manager.upload_file(arquivo, "grande.bin", "bkt")
+
+    assert not manager.client.uploads
+    assert "grande.bin" not in manager.client.buckets["bkt"]
+
+
+def test_falha_com_resume_reaproveita_partes(manager, arquivo):
+    original = manager.client._upload_part
+    _falha_na_parte(manager, 2)
+    with pytest.raises(MinIOOperationError):
+        manager.upload_file(arquivo, "grande.bin", "bkt", resume=True)
+    (upload,) = manager.client.uploads.values()
+    assert 1 in upload.parts
+
+    enviadas = []
+
+    def _upload_part(bucket_name, object_name, data, headers, upload_id, part_number):
+        enviadas.append(part_number)
+        return original(bucket_name, object_name, data, headers, upload_id, part_number)
+
+    manager.client._upload_part = _upload_part
+    manager.upload_file(arquivo, "grande.bin", "bkt", resume=True)
+
+    assert 1 not in enviadas and 2 in enviadas
+    assert not manager.client.uploads
+    assert manager.client.buckets["bkt"]["grande.bin"].data == arquivo.read_bytes()
+
+
+def test_conclusao_com_resposta_perdida(manager, arquivo):
+    original = manager.client._complete_multipart_upload
+
+    def _complete(bucket_name, object_name, upload_id, parts, ssec=None):
+        original(bucket_name, object_name, upload_id, parts, ssec)
+        raise _error("NoSuchUpload")
+
+    manager.client._complete_multipart_upload = _complete
+    result = manager.upload_file(arquivo, "grande.bin", "bkt")
+
+    assert result["etag"] == manager.client.buckets["bkt"]["grande.bin"].etag
+
+
+def test_conclusao_de_outro_objeto_falha(manager, arquivo):
+    def _complete(bucket_name, object_name, upload_id, parts, ssec=None):
+        manager.client._store(bucket_name, object_name, b"outro conteudo")
+        raise _error("NoSuchUpload")
+
+    manager.client._complete_multipart_upload = _complete
+
+    with pytest.raises(MinIOOperationError):
+        manager.upload_file(arquivo, "grande.bin", "bkt")
+    assert manager.client.buckets["bkt"]["grande.bin"].etag == hashlib.md5(b"outro conteudo").hexdigest()
+
+
+def test_private_multipart_api_matches_installed_minio():
+    # O upload multipart chama métodos internos do minio-py; uma mudança de assinatura
+    # em outra versão quebraria os uploads grandes sem erro de importação
+    expected = {
+        "_create_multipart_upload": ["bucket_name", "object_name", "headers"],
+        "_upload_part": ["bucket_name", "object_name", "data", "headers", "upload_id", "part_number"],
+        "_complete_multipart_upload": ["bucket_name", "object_name", "upload_id", "parts"],
+        "_abort_multipart_upload": ["bucket_name", "object_name", "upload_id"],
+        "_list_parts": ["bucket_name", "object_name", "upload_id"],
+    }
+    for name, params in expected.items():
+        signature = list(inspect.signature(getattr(Minio, name)).parameters)[1:]
+        assert signature[:len(params)] == params, name
+    listing = inspect.signature(Minio._list_multipart_uploads).parameters
+    assert {"prefix", "key_marker", "upload_id_marker"} <= set(listing)
+    assert "part_number_marker" in inspect.signature(Minio._list_parts).parameters
@@ -0,0 +1,42 @@
+"""
+presign_many reimplementa a assinatura SigV4 com funções internas do minio-py:
+as URLs precisam ser idênticas às de Minio.get_presigned_url.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from minio import Minio
+
+from Minio.minio_client.presign import presign_many
+
+NAMES = ["a.txt", "pasta/sub/b c.csv", "acentuação/ç+ã&=?.bin", "x" * 300]
+DATE = datetime(2024, 5, 17, 13, 45, 12, tzinfo=timezone.utc)
+
+
+@pytest.fixture(params=[
+    dict(endpoint="localhost:9000", secure=False, region="us-east-1"),
+    dict(endpoint="minio.example.com", secure=True, region="sa-east-1"),
+    dict(endpoint="s3.amazonaws.com", secure=True, region="eu-west-1"),
+    dict(endpoint="localhost:9000", secure=False, region="us-east-1", session_token="token/+="),
+], ids=["http", "https", "aws", "session-token"])
+def client(request):
+    return Minio(access_key="access-key", secret_key="secret/key+", **request.param)
+
+
+@pytest.mark.parametrize("method", ["GET", "PUT"])
+@pytest.mark.parametrize("expires", [1, 3600, 7 * 24 * 3600])
+def test_presign_many_matches_get_presigned_url(client, method, expires):
+    urls = presign_many(client, method, "meu-bucket", NAMES, expires, request_date=DATE)
+
+    assert urls == [
+        client.get_presigned_url(
+            method, "meu-bucket", name, expires=timedelta(seconds=expires), request_date=DATE
+        )
+        for name in NAMES
+    ]
+
+
+def test_presign_many_rejects_invalid_expiry(client):
+    with pytest.raises(ValueError):
+        presign_many(client, "GET", "meu-bucket", NAMES, 7 * 24 * 3600 + 1)
@@ -0,0 +1,125 @@
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from fake_minio import fake_manager
+from Minio.minio_client import MinIOOperationError
+
+DADOS = bytes(range(256)) * 40 + b"resto"
+
+
+@pytest.fixture
+def manager():
+    manager = fake_manager()
+    manager.client._store("bkt", "dados.bin", DADOS)
+    return manager
+
+
+def _intervalos(manager):
+    pedidos = []
+    original = manager.client.get_object
+
+    def get_object(bucket_name, object_name, offset=0, length=0, **kwargs):
+        pedidos.append((offset, length, kwargs.get("request_headers")))
+        return original(bucket_name, object_name, offset=offset, length=length, **kwargs)
+
+    manager.client.get_object = get_object
+    return pedidos
+
+
+def test_download_file_parallel_monta_os_intervalos(manager, tmp_path):
+    pedidos = _intervalos(manager)
+    destino = tmp_path / "sub" / "dados.bin"
+
+    result = manager.download_file_parallel("bkt", "dados.bin", destino, chunk_size=1000, max_workers=4)
+
+    assert destino.read_bytes() == DADOS
+    assert result["chunks"] == len(pedidos) == 11
+    assert sorted(offset for offset, _, _ in pedidos) == list(range(0, len(DADOS), 1000))
+    assert sum(length for _, length, _ in pedidos) == len(DADOS)
+    etag = manager.client.buckets["bkt"]["dados.bin"].etag
+    assert all(headers == {"If-Match": etag} for _, _, headers in pedidos)
+    assert not (tmp_path / "sub" / "dados.bin.part.minio").exists()
+
+
+def test_download_file_parallel_repete_intervalo_incompleto(manager, tmp_path):
+    original = manager.client.get_object
+    falhas = []
+
+    def get_object(bucket_name, object_name, offset=0, length=0, **kwargs):
+        resp = original(bucket_name, object_name, offset=offset, length=length, **kwargs)
+        if offset == 2000 and not falhas:
+            falhas.append(offset)
+            resp.truncate(10)
+        return resp
+
+    manager.client.get_object = get_object
+
+    manager.download_file_parallel("bkt", "dados.bin", tmp_path / "dados.bin", chunk_size=1000)
+
+    assert falhas == [2000]
+    assert (tmp_path / "dados.bin").read_bytes() == DADOS
+
+
+def test_download_file_parallel_falha_remove_temporario(manager, tmp_path):
+    def get_object(*args, **kwargs):
+        raise ConnectionError("conexão recusada")
+
+    manager.client.get_object = get_object
+
+    with pytest.raises(MinIOOperationError) as exc:
+        manager.download_file_parallel("bkt", "dados.bin", tmp_path / "dados.bin",
+                                       chunk_size=1000, max_retries=0)
+    assert exc.value.operation == "download_file"
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_read_object_parallel(manager):
+    assert manager.read_object_parallel("bkt", "dados.bin", chunk_size=333) == DADOS
+    assert manager.read_object_parallel("bkt", "dados.bin", chunk_size=len(DADOS) * 2) == DADOS
+
+
+def test_read_object_parallel_falha_com_a_propria_operacao(manager):
+    def get_object(*args, **kwargs):
+        raise ConnectionError("conexão recusada")
+
+    manager.client.get_object = get_object
+
+    with pytest.raises(MinIOOperationError) as exc:
+        manager.read_object_parallel("bkt", "dados.bin", chunk_size=1000, max_retries=0)
+    assert exc.value.operation == "read_object"
+    with pytest.raises(MinIOOperationError) as exc:
+        manager.read_object_parallel("bkt", "dados.bin", chunk_size=0)
+    assert exc.value.operation == "read_object"
+
+
+def test_open_object_le_por_intervalos(manager):
+    pedidos = _intervalos(manager)
+
+    with manager.open_object("bkt", "dados.bin") as reader:
+        assert reader.size == len(DADOS)
+        reader.seek(-5, 2)
+        assert reader.read() == b"resto"
+        reader.seek(256)
+        assert reader.read(4) == bytes(range(4))
+        assert reader.tell() == 260
+        assert reader.read_range(0, 3) == bytes(range(3))
+        assert reader.tell() == 260
+
+    assert [(offset, length) for offset, length, _ in pedidos] == [
+        (len(DADOS) - 5, 5), (256, 4), (0, 3)
+    ]
+
+
+def test_open_object_parquet(manager):
+    tabela = pa.table({"id": list(range(20_000)), "nome": [f"linha {i:08d}" * 8 for i in range(20_000)]})
+    sink = pa.BufferOutputStream()
+    pq.write_table(tabela, sink, row_group_size=2000, compression="none")
+    manager.client._store("bkt", "tabela.parquet", sink.getvalue().to_pybytes())
+
+    with manager.open_object("bkt", "tabela.parquet") as reader:
+        lida = pq.ParquetFile(reader).read_row_group(3, columns=["id"])
+        # Só o rodapé e a coluna "id" do row group 3 são lidos
+        assert reader.bytes_read < reader.size / 10
+
+    assert lida.column("id").to_pylist() == list(range(6000, 8000))
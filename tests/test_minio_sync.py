@@ -0,0 +1,63 @@
+import io
+
+import pytest
+
+from fake_minio import fake_manager
+
+
+@pytest.fixture
+def manager():
+    manager = fake_manager()
+    manager.client.make_bucket("bkt")
+    return manager
+
+
+@pytest.mark.parametrize("prefix", ["data", "data/"])
+def test_sync_download_prefix_with_and_without_slash(manager, tmp_path, prefix):
+    manager.client.put_object("bkt", "data/x.txt", io.BytesIO(b"x"), 1)
+    manager.client.put_object("bkt", "data/sub/y.txt", io.BytesIO(b"yy"), 2)
+    manager.client.put_object("bkt", "dataset/z.txt", io.BytesIO(b"z"), 1)
+    local_dir = tmp_path / "local"
+    local_dir.mkdir()
+    (local_dir / "x.txt").write_bytes(b"x")
+    (local_dir / "stale.txt").write_bytes(b"old")
+
+    summary = manager.sync(local_dir, "bkt", prefix=prefix, direction="download", delete=True)
+
+    assert summary["failed"] == []
+    assert sorted(p.relative_to(local_dir).as_posix() for p in local_dir.rglob("*") if p.is_file()) == [
+        "sub/y.txt", "x.txt"
+    ]
+    assert (local_dir / "sub" / "y.txt").read_bytes() == b"yy"
+    assert summary["deleted"] == 1
+    assert not (tmp_path / "x.txt").exists()
+
+
+@pytest.mark.parametrize("prefix", ["data", "data/"])
+def test_sync_upload_prefix_with_and_without_slash(manager, tmp_path, prefix):
+    manager.client.put_object("bkt", "data/x.txt", io.BytesIO(b"old"), 3)
+    manager.client.put_object("bkt", "data/gone.txt", io.BytesIO(b"g"), 1)
+    manager.client.put_object("bkt", "dataset/z.txt", io.BytesIO(b"z"), 1)
+    (tmp_path / "x.txt").write_bytes(b"new!")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "y.txt").write_bytes(b"yy")
+
+    summary = manager.sync(tmp_path, "bkt", prefix=prefix, direction="upload", delete=True)
+
+    assert summary["failed"] == []
+    assert sorted(manager.client.buckets["bkt"]) == ["data/sub/y.txt", "data/x.txt", "dataset/z.txt"]
+    assert manager.client.buckets["bkt"]["data/x.txt"].data == b"new!"
+    assert summary["deleted"] == 1
+
+
+def test_sync_download_ignores_keys_outside_local_dir(manager, tmp_path):
+    manager.client.put_object("bkt", "data//abs.txt", io.BytesIO(b"a"), 1)
+    manager.client.put_object("bkt", "data/../escape.txt", io.BytesIO(b"e"), 1)
+    manager.client.put_object("bkt", "data/ok.txt", io.BytesIO(b"o"), 1)
+    local_dir = tmp_path / "local"
+    local_dir.mkdir()
+
+    summary = manager.sync(local_dir, "bkt", prefix="data", direction="download")
+
+    assert summary["transferred"] == 1
+    assert [p.name for p in tmp_path.rglob("*") if p.is_file()] == ["ok.txt"]
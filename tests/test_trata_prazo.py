@@ -0,0 +1,110 @@
+"""
+Equivalência entre os engines de TrataTabPrazo ('indice' e o 'merge' original),
+com uma tabela do IBGE sintética.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import TrataTabPrazo
+
+UFS = ["SP", "RJ", "MG", "DF"]
+TEXTO = ["REFERENCIA_MEDICAO", "INCOTERMS", "COLETA_CIDORIGEM", "COLETA_UFORIGEM",
+         "COLETA_CIDDESTINO", "COLETA_UFDESTINO"]
+
+
+def _ibge() -> pd.DataFrame:
+    linhas = [(uf, f"{uf} CIDADE {i}") for uf in UFS for i in range(1 if uf == "DF" else 6)]
+    # Município com o mesmo nome em duas UFs e pares UF/município repetidos
+    linhas += [("SP", "SANTA RITA"), ("MG", "SANTA RITA"), ("RJ", "RJ CIDADE 0"), ("SP", "SP CIDADE 3")]
+    df = pd.DataFrame(linhas, columns=["UF", "NOME_MUNICIPIO"])
+    df.insert(0, "COD_MUNICIPIO", np.arange(len(df)) + 1_000_000)
+    return df
+
+
+@pytest.fixture(autouse=True)
+def ibge(tmp_path, monkeypatch):
+    caminho = tmp_path / "IBGE.parquet"
+    _ibge().to_parquet(caminho)
+    monkeypatch.setattr(TrataTabPrazo, "IBGE_PATH", str(caminho))
+    monkeypatch.setattr(TrataTabPrazo, "IBGE_CACHE_DIR", tmp_path / "cache")
+    TrataTabPrazo.carregaIBGE(recarregar=True)
+    yield
+    monkeypatch.setattr(TrataTabPrazo, "_ibge", None)
+    monkeypatch.setattr(TrataTabPrazo, "_indice", None)
+
+
+def _dados(n=400, seed=0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    ibge = _ibge()
+    origem = rng.integers(0, len(ibge), n)
+    destino = rng.integers(0, len(ibge), n)
+    df = pd.DataFrame({
+        "REFERENCIA_MEDICAO": rng.choice(["2024-01", "2024-02"], n),
+        "INCOTERMS": rng.choice(["CIF", "FOB"], n),
+        "COLETA_CIDORIGEM": ibge["NOME_MUNICIPIO"].to_numpy()[origem],
+        "COLETA_UFORIGEM": ibge["UF"].to_numpy()[origem],
+        "COLETA_CIDDESTINO": ibge["NOME_MUNICIPIO"].to_numpy()[destino],
+        "COLETA_UFDESTINO": ibge["UF"].to_numpy()[destino],
+        "PRAZO": rng.integers(1, 15, n),
+    })
+    # "Todo o Estado" (cidade nula) na origem e no destino
+    df.loc[rng.random(n) < 0.15, "COLETA_CIDORIGEM"] = None
+    df.loc[rng.random(n) < 0.15, "COLETA_CIDDESTINO"] = None
+    # Mesma UF na origem e no destino, para a paridade
+    mesma = rng.random(n) < 0.1
+    df.loc[mesma, "COLETA_UFDESTINO"] = df.loc[mesma, "COLETA_UFORIGEM"]
+    df.loc[mesma, "COLETA_CIDORIGEM"] = None
+    # UF desconhecida e UF nula
+    df.loc[rng.random(n) < 0.03, "COLETA_UFORIGEM"] = "XX"
+    nula = rng.random(n) < 0.03
+    df.loc[nula, ["COLETA_UFORIGEM", "COLETA_CIDORIGEM"]] = None
+    # Linhas repetidas
+    return pd.concat([df, df.sample(40, random_state=seed)], ignore_index=True)
+
+
+def _casos():
+    df = _dados()
+    objeto = df.astype({coluna: object for coluna in TEXTO})
+    categorica = df.astype({coluna: "category" for coluna in TEXTO[2:]})
+    return {
+        "str": df,
+        "object": objeto,
+        "sem_cidade_nula": df[df["COLETA_CIDORIGEM"].notna()],
+        "object_sem_cidade_nula": objeto[objeto["COLETA_CIDORIGEM"].notna()],
+        "object_so_cidade_nula": objeto[objeto["COLETA_CIDORIGEM"].isna()],
+        "categorica": categorica,
+        "categorica_sem_cidade_nula": categorica[categorica["COLETA_CIDORIGEM"].notna()],
+        "categorica_so_cidade_nula": categorica[categorica["COLETA_CIDORIGEM"].isna()],
+    }
+
+
+CASOS = list(_casos())
+
+
+@pytest.mark.parametrize("caso", CASOS)
+@pytest.mark.parametrize("ligacao", ["left_only", "both", "right_only"])
+@pytest.mark.parametrize("colunas", [("COLETA_CIDORIGEM", "COLETA_UFORIGEM"),
+                                     ("COLETA_CIDDESTINO", "COLETA_UFDESTINO")])
+def test_trataPrazo_igual_ao_merge(caso, ligacao, colunas):
+    df = _casos()[caso]
+    pd.testing.assert_frame_equal(
+        TrataTabPrazo.trataPrazo(df, *colunas, ligacao=ligacao),
+        TrataTabPrazo.trataPrazo(df, *colunas, ligacao=ligacao, engine="merge"),
+    )
+
+
+@pytest.mark.parametrize("caso", CASOS)
+def test_trata_igual_ao_merge(caso):
+    df = _casos()[caso]
+    pd.testing.assert_frame_equal(TrataTabPrazo.trata(df), TrataTabPrazo.trata(df, engine="merge"))
+
+
+@pytest.mark.parametrize("caso", ["str", "object", "categorica"])
+def test_trataParalelo_igual_ao_serial(caso, monkeypatch):
+    # Os processos do pool (sem fork) reimportam o módulo: a tabela vem das variáveis de ambiente
+    monkeypatch.setenv("IBGE_PARQUET", TrataTabPrazo.IBGE_PATH)
+    monkeypatch.setenv("IBGE_CACHE_DIR", str(TrataTabPrazo.IBGE_CACHE_DIR))
+    df = _casos()[caso]
+    pd.testing.assert_frame_equal(TrataTabPrazo.trataParalelo(df, processos=2), TrataTabPrazo.trata(df))